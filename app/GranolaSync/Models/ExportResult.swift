@@ -4,13 +4,27 @@ struct ExportResult: Codable {
     let success: Bool
     let exported: Int
     let skipped: Int
+    /// Meetings re-rendered with identical output, whose files were left as they were.
+    let unchanged: Int?
     let apiFetched: Int
     let errors: [String]
     let files: [String]
     let message: String
+    /// Seconds per phase ("setup", "cache", "api_wait", "render", ...) and "total".
+    let timings: [String: Double]?
+    /// The slowest documents of the run, slowest first.
+    let slowest: [DocumentTiming]?
 
     enum CodingKeys: String, CodingKey {
-        case success, exported, skipped, errors, files, message
+        case success, exported, skipped, unchanged, errors, files, message, timings, slowest
         case apiFetched = "api_fetched"
     }
 }
+
+struct DocumentTiming: Codable {
+    let file: String
+    let seconds: Double
+    let api: Double?
+    let render: Double?
+    let write: Double?
+}
@@ -8,7 +8,7 @@ struct SyncConfig: Codable {
     var manifestPath: String = "~/Library/Application Support/GranolaSync/manifest.json"
     var scheduleInterval: Int = 1_209_600
     var notificationsEnabled: Bool = true
-    var exportFormat: String = "docx"
+    var exportFormat: ExportFormats = ExportFormats(["docx"])
     var apiUrl: String = "https://api.granola.ai/v1"
     var logPath: String = "~/Library/Application Support/GranolaSync/export.log"
 
@@ -39,3 +39,42 @@ struct SyncConfig: Codable {
         configDir.appendingPathComponent("config.json")
     }()
 }
+
+/// `export_format`: one format ("docx") or several (["docx", "md"]).
+/// Written back as a plain string when there is only one.
+struct ExportFormats: Codable, Equatable {
+    var formats: [String]
+
+    init(_ formats: [String]) {
+        self.formats = formats
+    }
+
+    init(from decoder: Decoder) throws {
+        let container = try decoder.singleValueContainer()
+        if let format = try? container.decode(String.self) {
+            formats = format.split(separator: ",").map { $0.trimmingCharacters(in: .whitespaces) }
+        } else {
+            formats = try container.decode([String].self)
+        }
+    }
+
+    func encode(to encoder: Encoder) throws {
+        var container = encoder.singleValueContainer()
+        if formats.count == 1 {
+            try container.encode(formats[0])
+        } else {
+            try container.encode(formats)
+        }
+    }
+
+    /// The first format (the file the app shows); setting it keeps the others.
+    var primary: String {
+        get { formats.first ?? "docx" }
+        set { formats = [newValue] + formats.dropFirst().filter { $0 != newValue } }
+    }
+
+    /// Formats exported besides the primary one.
+    var additional: [String] {
+        Array(formats.dropFirst())
+    }
+}
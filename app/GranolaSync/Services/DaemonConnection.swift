@@ -0,0 +1,116 @@
+import Foundation
+
+/// A long-lived `granola-sync serve` process, shared by every PythonBridge.
+///
+/// Requests are line-delimited JSON-RPC over the process's stdin/stdout.
+/// All I/O happens on one serial queue, so requests never interleave.
+/// The process is (re)started on demand.
+final class DaemonConnection: @unchecked Sendable {
+    static let shared = DaemonConnection()
+
+    enum DaemonError: Error {
+        /// The daemon could not be started; the request was not sent.
+        case unavailable(String)
+        /// The daemon died after the request was sent.
+        case lost(String)
+        /// The daemon answered with a JSON-RPC error.
+        case failed(String)
+    }
+
+    private let queue = DispatchQueue(label: "granola-sync.daemon")
+    private var process: Process?
+    private var input: FileHandle?
+    private var output: FileHandle?
+    private var buffer = Data()
+    private var nextId = 0
+
+    /// Send `method` with JSON-encoded `params`; returns the JSON-encoded result.
+    func call(binary: URL, method: String, params: Data) async throws -> Data {
+        try await withCheckedThrowingContinuation { continuation in
+            queue.async {
+                do {
+                    continuation.resume(returning: try self.send(binary: binary, method: method, params: params))
+                } catch let error as DaemonError {
+                    if case .failed = error {} else { self.stop() }
+                    continuation.resume(throwing: error)
+                } catch {
+                    self.stop()
+                    continuation.resume(throwing: DaemonError.unavailable(error.localizedDescription))
+                }
+            }
+        }
+    }
+
+    private func start(binary: URL) throws {
+        // A write to a dead daemon must fail, not kill the app
+        signal(SIGPIPE, SIG_IGN)
+
+        let process = Process()
+        process.executableURL = binary
+        process.arguments = ["serve"]
+        let stdin = Pipe()
+        let stdout = Pipe()
+        process.standardInput = stdin
+        process.standardOutput = stdout
+        process.standardError = FileHandle.nullDevice
+        try process.run()
+
+        self.process = process
+        input = stdin.fileHandleForWriting
+        output = stdout.fileHandleForReading
+        buffer = Data()
+    }
+
+    private func stop() {
+        if let process, process.isRunning {
+            process.terminate()
+        }
+        process = nil
+        input = nil
+        output = nil
+        buffer = Data()
+    }
+
+    private func send(binary: URL, method: String, params: Data) throws -> Data {
+        if process?.isRunning != true {
+            stop()
+            try start(binary: binary)
+        }
+        guard let input else { throw DaemonError.unavailable("granola-sync serve is not running") }
+
+        nextId += 1
+        var line = Data("{\"jsonrpc\":\"2.0\",\"id\":\(nextId),\"method\":\"\(method)\",\"params\":".utf8)
+        line.append(params)
+        line.append(Data("}\n".utf8))
+        do {
+            try input.write(contentsOf: line)
+        } catch {
+            throw DaemonError.unavailable(error.localizedDescription)
+        }
+
+        let reply = try readLine()
+        guard let response = try? JSONSerialization.jsonObject(with: reply) as? [String: Any] else {
+            throw DaemonError.lost(String(data: reply, encoding: .utf8) ?? "Unreadable response")
+        }
+        if let error = response["error"] as? [String: Any] {
+            throw DaemonError.failed(error["message"] as? String ?? "Unknown error")
+        }
+        return try JSONSerialization.data(withJSONObject: response["result"] ?? NSNull(), options: [.fragmentsAllowed])
+    }
+
+    private func readLine() throws -> Data {
+        guard let output else { throw DaemonError.lost("granola-sync serve is not running") }
+        while true {
+            if let newline = buffer.firstIndex(of: 0x0A) {
+                let line = Data(buffer[buffer.startIndex..<newline])
+                buffer = Data(buffer[buffer.index(after: newline)...])
+                return line
+            }
+            let chunk = output.availableData
+            if chunk.isEmpty {
+                throw DaemonError.lost("granola-sync serve exited")
+            }
+            buffer.append(chunk)
+        }
+    }
+}
@@ -103,7 +103,27 @@ actor PythonBridge {
         }
     }
 
+    /// Ask the shared `granola-sync serve` daemon, falling back to a one-off
+    /// process (with `arguments`) if the daemon can't be used. Only quick,
+    /// read-only requests go here: the daemon answers one at a time, so a
+    /// long export would hold up the meeting list.
+    private func request(_ method: String, _ params: [String: Any] = [:], fallback arguments: [String]) async throws -> Data {
+        let (binary, searched) = findBinary()
+        guard let binary else {
+            throw BridgeError.binaryNotFound(searched: searched)
+        }
+        let body = try JSONSerialization.data(withJSONObject: params)
+        do {
+            return try await DaemonConnection.shared.call(binary: binary, method: method, params: body)
+        } catch DaemonConnection.DaemonError.failed(let message) {
+            throw BridgeError.executionFailed(message)
+        } catch {
+            return try await run(arguments)
+        }
+    }
+
     func export() async throws -> ExportResult {
+        // Its own process, so list/show/stats stay responsive meanwhile
         let data = try await run(["export", "--json"])
         do {
             return try JSONDecoder().decode(ExportResult.self, from: data)
@@ -113,7 +133,7 @@ actor PythonBridge {
     }
 
     func status() async throws -> [String: Any] {
-        let data = try await run(["status", "--json"])
+        let data = try await request("status", fallback: ["status", "--json"])
         guard let json = try JSONSerialization.jsonObject(with: data) as? [String: Any] else {
             throw BridgeError.decodingFailed("Expected JSON object")
         }
@@ -137,7 +157,7 @@ actor PythonBridge {
     }
 
     func listMeetings() async throws -> [MeetingSummary] {
-        let data = try await run(["list", "--json"])
+        let data = try await request("list", fallback: ["list", "--json"])
         do {
             return try JSONDecoder().decode([MeetingSummary].self, from: data)
         } catch {
@@ -146,7 +166,7 @@ actor PythonBridge {
     }
 
     func showMeeting(id: String) async throws -> MeetingDetail {
-        let data = try await run(["show", id, "--json"])
+        let data = try await request("show", ["doc_id": id], fallback: ["show", id, "--json"])
         do {
             return try JSONDecoder().decode(MeetingDetail.self, from: data)
         } catch {
@@ -155,7 +175,7 @@ actor PythonBridge {
     }
 
     func stats() async throws -> SyncStats {
-        let data = try await run(["stats", "--json"])
+        let data = try await request("stats", fallback: ["stats", "--json"])
         do {
             return try JSONDecoder().decode(SyncStats.self, from: data)
         } catch {
@@ -40,13 +40,19 @@ struct SettingsView: View {
                     VStack(alignment: .leading, spacing: 8) {
                         Text("File format for exported meetings:")
                             .font(.callout)
-                        Picker("Format", selection: $appState.config.exportFormat) {
+                        Picker("Format", selection: $appState.config.exportFormat.primary) {
                             Text(".docx (Word)").tag("docx")
                             Text(".md (Markdown)").tag("md")
                             Text(".txt (Plain text)").tag("txt")
                         }
                         .pickerStyle(.segmented)
                         .labelsHidden()
+                        if !appState.config.exportFormat.additional.isEmpty {
+                            Text("Also exported: " + appState.config.exportFormat.additional
+                                .map { ".\($0)" }.joined(separator: ", "))
+                                .font(.caption)
+                                .foregroundStyle(.secondary)
+                        }
                     }
                     .padding(4)
                 }
@@ -0,0 +1,68 @@
+"""Compare the lxml summary parser against the stdlib HTMLParser path.
+
+    python benchmarks/bench_html_parser.py --sections 4 16 64 --docs 200
+
+Both parsers run on the same synthetic Summary panels and must produce
+identical element streams; the best of --repeat runs is reported.
+"""
+
+import argparse
+import json
+import random
+import time
+
+from synthetic import summary_html
+
+from granola_sync.html_parser import HTMLToDocxElements, parse_html_to_elements
+
+
+def stdlib_parse(html: str) -> list[tuple[str, str, int]]:
+    parser = HTMLToDocxElements()
+    parser.feed(html)
+    parser.close()
+    parser._flush()
+    return parser.elements
+
+
+def best_of(fn, inputs: list[str], repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        for html in inputs:
+            fn(html)
+        times.append(time.perf_counter() - t0)
+    return min(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sections", type=int, nargs="+", default=[4, 16, 64],
+                        help="Summary sections per document (one row each)")
+    parser.add_argument("--docs", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--json", action="store_true", help="Output as JSON")
+    args = parser.parse_args()
+
+    results = []
+    for sections in args.sections:
+        rng = random.Random(sections)
+        inputs = [summary_html(rng, sections) for _ in range(args.docs)]
+        assert all(stdlib_parse(h) == parse_html_to_elements(h) for h in inputs), "parsers disagree"
+        stdlib_s = best_of(stdlib_parse, inputs, args.repeat)
+        lxml_s = best_of(parse_html_to_elements, inputs, args.repeat)
+        results.append({
+            "sections": sections,
+            "avg_kb": round(sum(map(len, inputs)) / len(inputs) / 1024, 1),
+            "stdlib_s": stdlib_s, "lxml_s": lxml_s, "speedup": stdlib_s / lxml_s,
+        })
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    print(f"{'sections':>9}{'avg KB':>9}{'stdlib s':>10}{'lxml s':>9}{'speedup':>9}")
+    for r in results:
+        print(f"{r['sections']:>9}{r['avg_kb']:>9}{r['stdlib_s']:>10.3f}{r['lxml_s']:>9.3f}{r['speedup']:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""Compare peak RSS and wall time of load_cache against the original
+copy + json.load implementation.
+
+    python benchmarks/bench_load_cache.py --docs 2000 --chunks 400
+
+Loaders: ``legacy`` (copy + json.load), ``scan`` (the mmap scanner for
+every load, as the index uses it for file offsets) and ``load_cache``
+(what callers get: one json.loads for a full load, the scanner for a
+subset of sections). Each runs in a fresh interpreter so peak RSS is
+not shared.
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+from synthetic import build_state, write_cache
+
+CHILD = r"""
+import json, resource, shutil, sys, tempfile, os, time
+
+def legacy_load(path):
+    with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as tmp:
+        tmp_path = tmp.name
+    try:
+        shutil.copy2(path, tmp_path)
+        with open(tmp_path) as f:
+            raw = json.load(f)
+        cache = raw["cache"]
+        if isinstance(cache, str):
+            cache = json.loads(cache)
+        return cache["state"]
+    finally:
+        os.remove(tmp_path)
+
+def peak_rss_mb():
+    # ru_maxrss survives fork+exec on Linux, so prefer the per-process high-water mark
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 2**20  # bytes on macOS
+
+loader, path, touch = sys.argv[1], sys.argv[2], sys.argv[3].split(",")
+if loader != "legacy":
+    from granola_sync.cache import SECTIONS, load_cache
+baseline = peak_rss_mb()
+t0 = time.perf_counter()
+if loader == "legacy":
+    state = legacy_load(path)
+    n = sum(len(state.get(k, {})) for k in touch)
+else:
+    keys = [{"panels": "documentPanels", "meetings_meta": "meetingsMetadata"}.get(k, k) for k in touch]
+    subset = tuple(keys) if len(keys) < len(SECTIONS) else None
+    cache = load_cache(path, sections=subset, offsets=loader == "scan")
+    n = sum(len(getattr(cache, k)) for k in touch)
+elapsed = time.perf_counter() - t0
+peak = peak_rss_mb()
+print(json.dumps({"seconds": elapsed, "peak_rss_mb": peak, "delta_rss_mb": peak - baseline, "entries": n}))
+"""
+
+ATTR_TO_KEY = {
+    "documents": "documents",
+    "transcripts": "transcripts",
+    "panels": "documentPanels",
+    "meetings_meta": "meetingsMetadata",
+}
+
+
+def run(loader: str, path: str, touch: list[str]) -> dict:
+    keys = touch if loader != "legacy" else [ATTR_TO_KEY[t] for t in touch]
+    out = subprocess.run(
+        [sys.executable, "-c", CHILD, loader, path, ",".join(keys)],
+        capture_output=True, text=True, check=True,
+    )
+    return json.loads(out.stdout)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--docs", type=int, default=1000)
+    parser.add_argument("--chunks", type=int, default=300, help="Transcript chunks per document")
+    parser.add_argument("--json", action="store_true", help="Output as JSON")
+    args = parser.parse_args()
+
+    state = build_state(args.docs, args.chunks)
+    results = []
+    with tempfile.TemporaryDirectory() as d:
+        for version in ("v3", "v4"):
+            path = os.path.join(d, f"cache-{version}.json")
+            write_cache(path, state, int(version[1:]))
+            size_mb = os.path.getsize(path) / 2**20
+            for label, touch in (("list", ["documents", "transcripts", "panels", "meetings_meta"]),
+                                 ("status", ["documents"])):
+                for loader in ("legacy", "scan", "load_cache"):
+                    r = run(loader, path, touch)
+                    results.append({"cache": version, "size_mb": round(size_mb, 1),
+                                    "sections": label, "loader": loader, **r})
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    print(f"{'cache':6}{'size MB':>9}  {'sections':9}{'loader':11}{'seconds':>9}{'peak RSS MB':>13}{'delta MB':>10}")
+    for r in results:
+        print(f"{r['cache']:6}{r['size_mb']:>9}  {r['sections']:9}{r['loader']:11}"
+              f"{r['seconds']:>9.2f}{r['peak_rss_mb']:>13.1f}{r['delta_rss_mb']:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""Cold-start wall time and import cost of each CLI command.
+
+    python benchmarks/bench_startup.py --runs 10 --top 15
+    python benchmarks/bench_startup.py --check   # exit 1 if over budget
+
+Every run is a fresh interpreter with HOME pointed at a temporary
+directory holding a small Granola cache and config, so nothing is warm
+but the OS page cache. The slowest imports come from -X importtime.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+COMMANDS = [
+    ["version"],
+    ["list", "--json"],
+    ["status", "--json"],
+    ["show", "doc-000000", "--json"],
+    ["stats", "--json"],
+    ["export", "--json", "--force"],
+]
+
+# Milliseconds spent importing after interpreter startup (-X importtime),
+# a few times what each command takes today
+IMPORT_BUDGET_MS = {
+    "list": 150,
+    "status": 150,
+    "show": 150,
+    "stats": 150,
+    "export": 250,
+}
+
+
+def setup_home(home: str, docs: int) -> None:
+    state = {"documents": {}, "transcripts": {}, "documentPanels": {}, "meetingsMetadata": {}}
+    for i in range(docs):
+        doc_id = f"doc-{i:06d}"
+        state["documents"][doc_id] = {
+            "title": f"Meeting {i}", "created_at": "2026-01-15T10:00:00Z", "notes_markdown": "- point\n",
+        }
+    Path(home, "cache-v4.json").write_text(json.dumps({"cache": {"state": state}}))
+    Path(home, "drive").mkdir()
+    config_dir = Path(home, "Library", "Application Support", "GranolaSync")
+    config_dir.mkdir(parents=True)
+    (config_dir / "config.json").write_text(json.dumps({
+        "granola_cache_path": str(Path(home, "cache-v4.json")),
+        "drive_path": str(Path(home, "drive")),
+        "export_format": "md",
+        "notifications_enabled": False,
+    }))
+
+
+def run(home: str, args: list[str], importtime: bool = False) -> subprocess.CompletedProcess:
+    flags = ["-X", "importtime"] if importtime else []
+    return subprocess.run(
+        [sys.executable, *flags, "-c", "from granola_sync.cli import main; main()", *args],
+        capture_output=True, text=True, check=True, env={**os.environ, "HOME": home},
+    )
+
+
+def import_breakdown(stderr: str, top: int) -> tuple[float, list[tuple[str, float]]]:
+    """Milliseconds imported after startup, and the slowest modules by self time."""
+    rows = [line.split("|") for line in stderr.splitlines() if line.startswith("import time:")]
+    start = max(i for i, (_, _, name) in enumerate(rows) if name.strip() == "site") + 1
+    ours = rows[start:]
+    total = sum(int(cumulative) for _, cumulative, name in ours if not name.startswith("  ")) / 1000
+    slowest = sorted(((name.strip(), int(own.split(":")[1]) / 1000) for own, _, name in ours),
+                     key=lambda r: r[1], reverse=True)
+    return total, slowest[:top]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5, help="Cold starts per command")
+    parser.add_argument("--docs", type=int, default=200)
+    parser.add_argument("--top", type=int, default=10, help="Slowest imports to show per command")
+    parser.add_argument("--json", action="store_true", help="Output as JSON")
+    parser.add_argument("--check", action="store_true", help="Exit 1 if a command imports over its budget")
+    args = parser.parse_args()
+
+    results = []
+    with tempfile.TemporaryDirectory() as home:
+        setup_home(home, args.docs)
+        for command in COMMANDS:
+            run(home, command)  # warm the index and page cache
+            walls = []
+            for _ in range(args.runs):
+                t0 = time.perf_counter()
+                run(home, command)
+                walls.append((time.perf_counter() - t0) * 1000)
+            import_ms, slowest = import_breakdown(run(home, command, importtime=True).stderr, args.top)
+            results.append({
+                "command": " ".join(command),
+                "wall_ms_median": round(statistics.median(walls), 1),
+                "wall_ms_min": round(min(walls), 1),
+                "import_ms": round(import_ms, 1),
+                "import_budget_ms": IMPORT_BUDGET_MS.get(command[0]),
+                "slowest_imports": [{"module": m, "self_ms": round(ms, 2)} for m, ms in slowest],
+            })
+
+    over = [r for r in results if r["import_budget_ms"] and r["import_ms"] > r["import_budget_ms"]]
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print(f"{'command':28}{'median ms':>11}{'min ms':>9}{'import ms':>11}{'budget':>8}")
+        for r in results:
+            budget = r["import_budget_ms"] or "-"
+            print(f"{r['command']:28}{r['wall_ms_median']:>11.1f}{r['wall_ms_min']:>9.1f}"
+                  f"{r['import_ms']:>11.1f}{budget:>8}{'  OVER' if r in over else ''}")
+        for r in results:
+            print(f"\n{r['command']} — slowest imports (self time)")
+            for s in r["slowest_imports"]:
+                print(f"  {s['self_ms']:>8.2f} ms  {s['module']}")
+    if args.check and over:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
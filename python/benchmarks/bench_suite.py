@@ -0,0 +1,310 @@
+"""Benchmark suite: wall time and peak memory per scenario on a synthetic cache.
+
+    python benchmarks/bench_suite.py --docs 500 --output before.json
+    python benchmarks/bench_suite.py --docs 500 --compare before.json
+    python benchmarks/bench_suite.py --only load_cache_v4,run_export_md
+    python benchmarks/bench_suite.py --only build_docx_long --long-chunks 50000
+    python benchmarks/bench_suite.py --only build_docx,build_docx_long --coalesce-seconds 5
+
+Every run of a scenario is a fresh interpreter. Setup (loading inputs,
+warming the index) happens before the clock starts; on Linux the peak
+RSS counter is reset at the same point, so ``rss_delta_mb`` is what the
+measured code itself added.
+"""
+
+import argparse
+import json
+import os
+import platform
+import resource
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+from synthetic import build_state, transcript, write_cache
+
+
+def _rss_mb(field: str) -> float | None:
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith(field + ":"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return None
+
+
+def peak_rss_mb() -> float:
+    peak = _rss_mb("VmHWM")
+    if peak is not None:
+        return peak
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 2**20  # bytes on macOS
+
+
+def reset_peak_rss() -> None:
+    """Start a new high-water mark (Linux only; elsewhere it is the process peak)."""
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+    except OSError:
+        pass
+
+
+# Scenarios: each takes (work dir, options) and returns the callable to time
+
+def _cfg(work: str, tmp: str, export_format: str = "md", coalesce_seconds: float = 0) -> dict:
+    from granola_sync import config
+
+    cfg = dict(config.DEFAULTS)
+    cfg.update({
+        "granola_cache_path": os.path.join(work, "cache-v4.json"),
+        "granola_auth_path": os.path.join(tmp, "no-auth.json"),
+        "index_path": os.path.join(tmp, "index.sqlite3"),
+        "manifest_path": os.path.join(tmp, "manifest.json"),
+        "drive_path": os.path.join(tmp, "drive"),
+        "export_format": export_format,
+        "notifications_enabled": False,
+        "api_cache_enabled": False,
+        "transcript_coalesce_seconds": coalesce_seconds,
+    })
+    os.makedirs(cfg["drive_path"])
+    return cfg
+
+
+def _load_cache(version: int):
+    def setup(work, tmp, opts):
+        from granola_sync.cache import load_cache
+
+        def op():
+            cache = load_cache(os.path.join(work, f"cache-v{version}.json"))
+            return sum(len(s) for s in (cache.documents, cache.transcripts, cache.panels, cache.meetings_meta))
+        return op
+    return setup
+
+
+def _list_meetings(warm: bool):
+    def setup(work, tmp, opts):
+        from granola_sync.index import list_meetings
+
+        cfg = _cfg(work, tmp)
+        if warm:
+            list_meetings(cfg, {})
+        return lambda: len(list_meetings(cfg, {}))
+    return setup
+
+
+def _meeting_detail(work, tmp, opts):
+    from granola_sync.index import get_meeting_detail, list_meetings
+
+    cfg = _cfg(work, tmp)
+    doc_ids = [m["doc_id"] for m in list_meetings(cfg, {})][:opts["sample"]]
+    return lambda: sum(1 for doc_id in doc_ids if get_meeting_detail(cfg, doc_id, {}))
+
+
+def _compute_stats(work, tmp, opts):
+    from granola_sync.index import list_meetings
+    from granola_sync.stats import compute_stats
+
+    cfg = _cfg(work, tmp)
+    list_meetings(cfg, {})
+    return lambda: compute_stats(cfg=cfg, manifest={})["total_meetings"]
+
+
+def _inputs(work: str, sample: int) -> list[dict]:
+    """Builder arguments for the first *sample* meetings, as run_export passes them."""
+    from granola_sync.cache import _parse_attendees, load_cache
+
+    cache = load_cache(os.path.join(work, "cache-v4.json"))
+    out = []
+    for doc_id, doc in list(cache.documents.items())[:sample]:
+        panels = cache.panels.get(doc_id, {}).values()
+        out.append(dict(
+            title=doc["title"], date_str=doc["created_at"],
+            attendees=_parse_attendees(cache.meetings_meta.get(doc_id, {})),
+            summary_html=next((p["original_content"] for p in panels if p.get("title") == "Summary"), ""),
+            transcript_chunks=cache.transcripts.get(doc_id, []),
+            notes_markdown=doc.get("notes_markdown", ""),
+        ))
+    return out
+
+
+def _parse_html(work, tmp, opts):
+    from granola_sync.html_parser import parse_html_to_elements
+
+    summaries = [args["summary_html"] for args in _inputs(work, opts["docs"])]
+    return lambda: sum(len(parse_html_to_elements(html)) for html in summaries)
+
+
+def _build(module: str, func: str, ext: str):
+    def setup(work, tmp, opts):
+        import importlib
+
+        builder = getattr(importlib.import_module(f"granola_sync.{module}"), func)
+        inputs = _inputs(work, opts["sample"])
+
+        def op():
+            for i, args in enumerate(inputs):
+                builder(filepath=os.path.join(tmp, f"{i}{ext}"), coalesce_seconds=opts["coalesce_seconds"], **args)
+            return len(inputs)
+        return op
+    return setup
+
+
+def _build_docx_long(work, tmp, opts):
+    """One meeting with an --long-chunks transcript (hours of conversation)."""
+    import random
+
+    from granola_sync.docx_builder import create_meeting_docx
+
+    args = _inputs(work, 1)[0]
+    start = datetime.fromisoformat(args["date_str"].replace("Z", "+00:00"))
+    args["transcript_chunks"] = transcript(random.Random(0), start, opts["long_chunks"])
+    args["coalesce_seconds"] = opts["coalesce_seconds"]
+    return lambda: create_meeting_docx(filepath=os.path.join(tmp, "long.docx"), **args) or 1
+
+
+def _run_export(export_format: str):
+    def setup(work, tmp, opts):
+        from granola_sync.cache import load_cache
+        from granola_sync.exporter import run_export
+
+        cfg = _cfg(work, tmp, export_format, opts["coalesce_seconds"])
+        doc_ids = list(load_cache(cfg["granola_cache_path"]).documents)[:opts["export_docs"]]
+        return lambda: run_export(cfg, doc_ids=doc_ids).exported
+    return setup
+
+
+SCENARIOS = {
+    "load_cache_v3": _load_cache(3),
+    "load_cache_v4": _load_cache(4),
+    "list_meetings_cold": _list_meetings(warm=False),
+    "list_meetings_warm": _list_meetings(warm=True),
+    "get_meeting_detail": _meeting_detail,
+    "compute_stats": _compute_stats,
+    "parse_html": _parse_html,
+    "build_md": _build("markdown_builder", "create_meeting_md", ".md"),
+    "build_txt": _build("text_builder", "create_meeting_txt", ".txt"),
+    "build_docx": _build("docx_builder", "create_meeting_docx", ".docx"),
+    "build_docx_long": _build_docx_long,
+    "run_export_md": _run_export("md"),
+    "run_export_docx": _run_export("docx"),
+}
+
+
+def child(name: str, work: str, opts: dict) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        op = SCENARIOS[name](work, tmp, opts)
+        reset_peak_rss()
+        before = _rss_mb("VmRSS") or peak_rss_mb()
+        t0 = time.perf_counter()
+        items = op()
+        elapsed = time.perf_counter() - t0
+        peak = peak_rss_mb()
+    return {"seconds": elapsed, "peak_rss_mb": peak, "rss_delta_mb": peak - before, "items": items}
+
+
+def run(name: str, work: str, opts: dict) -> dict:
+    out = subprocess.run(
+        [sys.executable, __file__, "--child", name, work, json.dumps(opts)],
+        capture_output=True, text=True, check=True,
+    )
+    return json.loads(out.stdout)
+
+
+def _git_rev() -> str | None:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__)), check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    if len(sys.argv) > 1 and sys.argv[1] == "--child":
+        name, work, opts = sys.argv[2], sys.argv[3], json.loads(sys.argv[4])
+        print(json.dumps(child(name, work, opts)))
+        return
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--docs", type=int, default=500)
+    parser.add_argument("--chunks", type=int, default=300, help="Transcript chunks per document")
+    parser.add_argument("--panel-sections", type=int, default=4, help="Summary sections per document")
+    parser.add_argument("--attendees", type=int, default=5)
+    parser.add_argument("--sample", type=int, default=20, help="Meetings per builder/detail scenario")
+    parser.add_argument("--export-docs", type=int, default=50, help="Meetings per run_export scenario")
+    parser.add_argument("--long-chunks", type=int, default=12000, help="Transcript chunks for build_docx_long")
+    parser.add_argument("--coalesce-seconds", type=float, default=0,
+                        help="transcript_coalesce_seconds for the build and run_export scenarios")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per scenario")
+    parser.add_argument("--only", help="Comma-separated scenarios (default: all)")
+    parser.add_argument("--output", help="Write results as JSON to this file")
+    parser.add_argument("--compare", help="Earlier --output file to compare against")
+    parser.add_argument("--json", action="store_true", help="Output as JSON")
+    args = parser.parse_args()
+
+    names = args.only.split(",") if args.only else list(SCENARIOS)
+    unknown = [n for n in names if n not in SCENARIOS]
+    if unknown:
+        parser.error(f"unknown scenario(s): {', '.join(unknown)}; choose from {', '.join(SCENARIOS)}")
+    opts = {"docs": args.docs, "sample": args.sample, "export_docs": args.export_docs,
+            "long_chunks": args.long_chunks, "coalesce_seconds": args.coalesce_seconds}
+
+    results = []
+    with tempfile.TemporaryDirectory() as work:
+        state = build_state(args.docs, args.chunks, args.panel_sections, args.attendees)
+        for version in (3, 4):
+            write_cache(os.path.join(work, f"cache-v{version}.json"), state, version)
+        del state
+        for name in names:
+            runs = [run(name, work, opts) for _ in range(args.repeat)]
+            seconds = [r["seconds"] for r in runs]
+            results.append({
+                "scenario": name,
+                "runs": len(runs),
+                "seconds_median": statistics.median(seconds),
+                "seconds_min": min(seconds),
+                "peak_rss_mb": max(r["peak_rss_mb"] for r in runs),
+                "rss_delta_mb": max(r["rss_delta_mb"] for r in runs),
+                "items": runs[0]["items"],
+            })
+
+    report = {
+        "meta": {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "git_rev": _git_rev(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "docs": args.docs, "chunks": args.chunks, "panel_sections": args.panel_sections,
+            "attendees": args.attendees, "sample": args.sample, "export_docs": args.export_docs,
+            "long_chunks": args.long_chunks, "coalesce_seconds": args.coalesce_seconds,
+        },
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+
+    baseline = {}
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = {r["scenario"]: r for r in json.load(f)["results"]}
+    print(f"{'scenario':22}{'median s':>10}{'min s':>9}{'peak MB':>9}{'delta MB':>10}"
+          + (f"{'before s':>10}{'ratio':>8}" if baseline else ""))
+    for r in results:
+        line = (f"{r['scenario']:22}{r['seconds_median']:>10.3f}{r['seconds_min']:>9.3f}"
+                f"{r['peak_rss_mb']:>9.1f}{r['rss_delta_mb']:>10.1f}")
+        old = baseline.get(r["scenario"])
+        if old:
+            line += f"{old['seconds_median']:>10.3f}{r['seconds_median'] / old['seconds_median']:>8.2f}"
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""Synthetic Granola caches for benchmarks.
+
+    python benchmarks/synthetic.py /tmp/cache-v4.json --docs 2000 --chunks 400
+    python benchmarks/synthetic.py /tmp/cache-v3.json --format 3
+
+Output is deterministic for a given seed. Documents are spread over the
+past year with varied titles, notes, a Summary panel of nested lists and
+a transcript alternating microphone and system speech, next to calendar
+events and other state the exporter never reads.
+"""
+
+import argparse
+import json
+import random
+from datetime import datetime, timedelta, timezone
+
+WORDS = (
+    "roadmap launch pricing customer migration review budget hiring design api "
+    "latency dashboard onboarding contract renewal feedback release incident "
+    "metrics quarter partner security retention experiment timeline scope"
+).split()
+TOPICS = ["Weekly sync", "1:1", "Design review", "Customer call", "Planning", "Retro",
+          "Interview", "Standup", "Board prep", "Kickoff"]
+NAMES = ["Ada Lovelace", "Grace Hopper", "Alan Turing", "Katherine Johnson", "Linus Torvalds",
+         "Barbara Liskov", "Ken Thompson", "Margaret Hamilton", "Donald Knuth", "Radia Perlman"]
+
+
+def _sentence(rng: random.Random, words: int) -> str:
+    text = " ".join(rng.choice(WORDS) for _ in range(words))
+    return text[0].upper() + text[1:] + "."
+
+
+def _person(i: int) -> dict:
+    name = NAMES[i % len(NAMES)] + ("" if i < len(NAMES) else f" {i}")
+    email = name.lower().replace(" ", ".") + "@example.com"
+    return {"email": email, "details": {"person": {"name": {"fullName": name}}}}
+
+
+def summary_html(rng: random.Random, sections: int) -> str:
+    """A Summary panel: headed sections of bullets, some nested, some bold."""
+    parts = []
+    for _ in range(sections):
+        parts.append(f"<h3>{_sentence(rng, 3)[:-1]}</h3><ul>")
+        for _ in range(rng.randint(2, 5)):
+            parts.append(f"<li><p><strong>{rng.choice(WORDS).title()}</strong>: {_sentence(rng, 12)}</p>")
+            if rng.random() < 0.4:
+                parts.append("<ul>" + "".join(f"<li><p>{_sentence(rng, 8)}</p></li>"
+                                              for _ in range(rng.randint(1, 3))) + "</ul>")
+            parts.append("</li>")
+        parts.append("</ul>")
+    return "".join(parts)
+
+
+def transcript(rng: random.Random, start: datetime, chunks: int) -> list[dict]:
+    out = []
+    t = start
+    for j in range(chunks):
+        end = t + timedelta(seconds=rng.uniform(2, 12))
+        out.append({
+            "id": f"chunk-{j}",
+            "start_timestamp": t.strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z",
+            "end_timestamp": end.strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z",
+            "source": "microphone" if j % 3 else "system",
+            "text": _sentence(rng, rng.randint(4, 30)),
+            "is_final": True,
+        })
+        t = end + timedelta(seconds=rng.uniform(0, 2))
+    return out
+
+
+def build_state(docs: int = 500, chunks: int = 300, panel_sections: int = 4,
+                attendees: int = 5, seed: int = 0) -> dict:
+    """Cache ``state`` with *docs* meetings of *chunks* transcript chunks,
+    *panel_sections* summary sections and *attendees* attendees each."""
+    rng = random.Random(seed)
+    now = datetime(2026, 6, 1, tzinfo=timezone.utc)
+    state = {"documents": {}, "transcripts": {}, "documentPanels": {}, "meetingsMetadata": {},
+             "events": [], "people": [_person(i) for i in range(50)]}
+    for i in range(docs):
+        doc_id = f"doc-{i:06d}"
+        start = now - timedelta(days=rng.uniform(0, 365), hours=rng.randint(0, 8))
+        created_at = start.strftime("%Y-%m-%dT%H:%M:%S.000Z")
+        state["documents"][doc_id] = {
+            "id": doc_id,
+            "title": f"{rng.choice(TOPICS)}: {_sentence(rng, 3)[:-1]}",
+            "created_at": created_at,
+            "updated_at": created_at,
+            "notes_markdown": "\n".join(f"- {_sentence(rng, 8)}" for _ in range(rng.randint(0, 12))),
+            "type": "meeting",
+        }
+        state["transcripts"][doc_id] = transcript(rng, start, chunks)
+        state["documentPanels"][doc_id] = {
+            f"panel-{i}": {
+                "id": f"panel-{i}", "title": "Summary", "document_id": doc_id,
+                "original_content": summary_html(rng, panel_sections),
+                "created_at": created_at,
+            },
+        }
+        people = [_person(rng.randrange(50)) for _ in range(attendees)]
+        state["meetingsMetadata"][doc_id] = {"creator": {**people[0], "name": people[0]["email"]},
+                                             "attendees": people[1:]}
+        state["events"].append({"id": f"event-{i}", "summary": state["documents"][doc_id]["title"],
+                                "description": _sentence(rng, 60), "start": {"dateTime": created_at}})
+    return state
+
+
+def write_cache(path: str, state: dict, version: int = 4) -> None:
+    """Write *state* as Granola does: v3 nests it in a JSON string, v4 inline."""
+    if version == 3:
+        raw = {"cache": json.dumps({"state": state, "version": 3})}
+    else:
+        raw = {"cache": {"state": state, "version": version}}
+    with open(path, "w") as f:
+        json.dump(raw, f)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("path")
+    parser.add_argument("--format", type=int, choices=(3, 4), default=4, help="Cache version")
+    parser.add_argument("--docs", type=int, default=500)
+    parser.add_argument("--chunks", type=int, default=300, help="Transcript chunks per document")
+    parser.add_argument("--panel-sections", type=int, default=4, help="Summary sections per document")
+    parser.add_argument("--attendees", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    write_cache(args.path, build_state(args.docs, args.chunks, args.panel_sections,
+                                       args.attendees, args.seed), args.format)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,29 @@
-"""Granola API client — fetch data not available in local cache."""
+"""Granola API client — fetch data not available in local cache.
 
-import requests
+``requests`` is imported when the first client is created, not with this
+module, so commands that never reach the network don't pay for it.
+"""
 
-from . import config
+from __future__ import annotations
+
+import email.utils
+import random
+import threading
+import time
+from typing import TYPE_CHECKING
+
+from . import config, tracing
+from .api_cache import ResponseCache, ttl_for
+
+if TYPE_CHECKING:
+    import requests
 
 CLIENT_VERSION = "6.476.0"
 
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+# Responses that mean every other request will fail too
+BREAKER_STATUSES = RETRY_STATUSES | {401, 403}
+
 
 def _headers(token: str) -> dict:
     return {
@@ -16,42 +34,223 @@ def _headers(token: str) -> dict:
     }
 
 
-def fetch_transcript(doc_id: str, token: str, api_url: str | None = None) -> list | None:
-    url = api_url or config.get("api_url")
+def _retry_after(resp: requests.Response) -> float | None:
+    """Seconds requested by a Retry-After header (delta or HTTP date)."""
+    value = resp.headers.get("Retry-After")
+    if not value:
+        return None
     try:
-        resp = requests.post(
-            f"{url}/get-document-transcript",
-            headers=_headers(token),
-            json={"document_id": doc_id},
-            timeout=30,
-        )
-        if resp.ok:
-            data = resp.json()
-            if isinstance(data, list) and len(data) > 0:
-                return data
-    except requests.RequestException:
+        return max(0.0, float(value))
+    except ValueError:
         pass
-    return None
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, when.timestamp() - time.time())
+
 
+class ApiClient:
+    """Pooled keep-alive session with retries and a circuit breaker.
 
-def fetch_panels(doc_id: str, token: str, api_url: str | None = None) -> list | None:
-    """Fetch document panels (summary, etc.) from the API.
+    Retryable failures (connection errors, timeouts, 429 and 5xx) are
+    retried with exponential backoff and full jitter, honouring
+    Retry-After. After ``breaker_threshold`` consecutive failed calls the
+    breaker opens and calls return None without touching the network
+    until ``breaker_cooldown`` seconds have passed; then a single trial
+    call decides whether it closes again.
 
-    Returns a list of panel dicts, each with keys like 'title',
-    'original_content', 'content', etc. Returns None on failure.
+    With a ``response_cache``, successful responses are stored on disk and
+    served from there until they expire (see api_cache.ttl_for), unless
+    ``cache_responses`` is off; the cache then only holds the known-empty
+    markers the exporter keeps there.
     """
-    url = api_url or config.get("api_url")
-    try:
-        resp = requests.post(
-            f"{url}/get-document-panels",
-            headers=_headers(token),
-            json={"document_id": doc_id},
-            timeout=30,
-        )
-        if resp.ok:
-            data = resp.json()
-            if isinstance(data, list):
+
+    def __init__(self, pool_size: int = 8, timeout: float = 30, max_retries: int = 3,
+                 backoff: float = 0.5, max_backoff: float = 8.0, max_retry_after: float = 60.0,
+                 breaker_threshold: int = 5, breaker_cooldown: float = 60.0,
+                 response_cache: ResponseCache | None = None, cache_responses: bool = True):
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.max_retry_after = max_retry_after
+        self.breaker_threshold = breaker_threshold
+        self.breaker_cooldown = breaker_cooldown
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._trial_running = False
+        self._lock = threading.Lock()
+        self._sleep = time.sleep
+        self.response_cache = response_cache
+        self.cache_responses = cache_responses
+
+    def close(self) -> None:
+        self.session.close()
+        if self.response_cache is not None:
+            self.response_cache.close()
+
+    @property
+    def breaker_open(self) -> bool:
+        return self._opened_at is not None
+
+    def _allow(self) -> bool:
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            if self._trial_running or time.monotonic() - self._opened_at < self.breaker_cooldown:
+                return False
+            self._trial_running = True
+            return True
+
+    def _record(self, ok: bool) -> None:
+        with self._lock:
+            self._trial_running = False
+            if ok:
+                self._failures = 0
+                self._opened_at = None
+                return
+            self._failures += 1
+            if self._failures >= self.breaker_threshold:
+                self._opened_at = time.monotonic()
+
+    def _delay(self, attempt: int, resp: requests.Response | None) -> float:
+        if resp is not None:
+            retry_after = _retry_after(resp)
+            if retry_after is not None:
+                return min(retry_after, self.max_retry_after)
+        return random.uniform(0, min(self.max_backoff, self.backoff * 2 ** attempt))
+
+    def post(self, url: str, token: str, payload: dict):
+        """POST JSON and return the decoded body, or None on failure."""
+        if not self._allow():
+            return None
+        from requests import RequestException
+
+        for attempt in range(self.max_retries + 1):
+            resp = None
+            try:
+                with tracing.span("POST", cat="api", url=url, attempt=attempt):
+                    resp = self.session.post(url, headers=_headers(token), json=payload, timeout=self.timeout)
+            except RequestException:
+                pass
+            else:
+                if resp.ok:
+                    self._record(True)
+                    try:
+                        return resp.json()
+                    except ValueError:
+                        return None
+                if resp.status_code not in RETRY_STATUSES:
+                    self._record(resp.status_code not in BREAKER_STATUSES)
+                    return None
+            if attempt < self.max_retries:
+                with tracing.span("backoff", cat="api", attempt=attempt):
+                    self._sleep(self._delay(attempt, resp))
+        self._record(False)
+        return None
+
+    def _fetch(self, endpoint: str, doc_id: str, token: str, api_url: str | None,
+               created_at: str | None, use_cache: bool):
+        cache = self.response_cache if use_cache and self.cache_responses else None
+        url = api_url or config.get("api_url")
+        if cache is not None:
+            with tracing.span("api_cache_get", cat="api", endpoint=endpoint, doc_id=doc_id):
+                hit, data = cache.get(endpoint, doc_id, url)
+            if hit:
                 return data
-    except requests.RequestException:
-        pass
-    return None
+        data = self.post(f"{url}/{endpoint}", token, {"document_id": doc_id})
+        if cache is not None and isinstance(data, list):
+            cache.put(endpoint, doc_id, data, ttl_for(created_at), url)
+        return data
+
+    def fetch_transcript(self, doc_id: str, token: str, api_url: str | None = None,
+                         created_at: str | None = None, use_cache: bool = True) -> list | None:
+        """Fetch transcript chunks; [] if there are none, None on failure."""
+        data = self._fetch("get-document-transcript", doc_id, token, api_url, created_at, use_cache)
+        if isinstance(data, list):
+            return data
+        return None
+
+    def fetch_panels(self, doc_id: str, token: str, api_url: str | None = None,
+                     created_at: str | None = None, use_cache: bool = True) -> list | None:
+        """Fetch document panels (summary, etc.) from the API.
+
+        Returns a list of panel dicts, each with keys like 'title',
+        'original_content', 'content', etc. Returns None on failure.
+        ``created_at`` (the meeting start) decides how long the cached
+        response stays fresh; ``use_cache=False`` skips the cache entirely.
+        """
+        data = self._fetch("get-document-panels", doc_id, token, api_url, created_at, use_cache)
+        if isinstance(data, list):
+            return data
+        return None
+
+
+_client: ApiClient | None = None
+_client_settings: tuple | None = None
+_client_lock = threading.Lock()
+
+
+def _settings(cfg: dict) -> tuple:
+    """What a client is built from: response cache on/off, its path and
+    size limit, and the worker count."""
+    return (bool(cfg.get("api_cache_enabled", True)), config.get("api_cache_path", cfg),
+            int(config.get("api_cache_max_mb", cfg)), max(1, int(config.get("api_workers", cfg))))
+
+
+def get_client(cfg: dict | None = None) -> ApiClient:
+    """The process-wide client, so connections are reused across calls.
+    It is rebuilt when *cfg* asks for other settings; without *cfg* the
+    current client is kept, or one built from the config file."""
+    global _client, _client_settings
+    stale = None
+    with _client_lock:
+        if _client is None or cfg is not None:
+            settings = _settings(cfg or config.load_config())
+            if _client is None or settings != _client_settings:
+                enabled, cache_path, max_mb, workers = settings
+                stale = _client
+                _client = ApiClient(pool_size=workers,
+                                    response_cache=ResponseCache(cache_path, max_mb * 1024 * 1024),
+                                    cache_responses=enabled)
+                _client_settings = settings
+        client = _client
+    if stale is not None:
+        stale.close()
+    return client
+
+
+def reset_client() -> None:
+    """Close the shared client; the next call builds a new one."""
+    global _client
+    with _client_lock:
+        client, _client = _client, None
+    if client is not None:
+        client.close()
+
+
+def response_cache(cfg: dict | None = None) -> ResponseCache:
+    """The shared client's on-disk cache. It holds the known-empty markers
+    even when api_cache_enabled is off and responses aren't cached."""
+    return get_client(cfg).response_cache
+
+
+def fetch_transcript(doc_id: str, token: str, api_url: str | None = None,
+                     created_at: str | None = None, use_cache: bool = True,
+                     cfg: dict | None = None) -> list | None:
+    return get_client(cfg).fetch_transcript(doc_id, token, api_url, created_at, use_cache)
+
+
+def fetch_panels(doc_id: str, token: str, api_url: str | None = None,
+                 created_at: str | None = None, use_cache: bool = True,
+                 cfg: dict | None = None) -> list | None:
+    """Fetch document panels via the shared client. See ApiClient.fetch_panels."""
+    return get_client(cfg).fetch_panels(doc_id, token, api_url, created_at, use_cache)
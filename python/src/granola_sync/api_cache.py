@@ -0,0 +1,189 @@
+"""On-disk cache of Granola API responses (panels and transcripts).
+
+Responses are stored content-addressed: each request (API URL, endpoint
+and doc id) points at a blob keyed by the SHA-256 of its body, so identical bodies
+(empty panel lists, re-fetched transcripts) are stored once. Entries
+expire after a TTL that grows with the meeting's age. Once the blobs
+exceed the size cap, expired entries and then the least recently used
+ones are evicted.
+
+Meetings the API had nothing for (no transcript, no summary) are also
+remembered for a while, so scheduled exports don't keep asking.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from datetime import datetime, timezone
+
+HOUR = 3600
+DAY = 24 * HOUR
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    request TEXT PRIMARY KEY,
+    blob TEXT NOT NULL,
+    expires_at REAL NOT NULL,
+    last_used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_last_used ON responses (last_used);
+CREATE INDEX IF NOT EXISTS responses_blob ON responses (blob);
+CREATE TABLE IF NOT EXISTS blobs (
+    sha TEXT PRIMARY KEY,
+    body BLOB NOT NULL,
+    size INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS known_empty (
+    doc_id TEXT PRIMARY KEY,
+    expires_at REAL NOT NULL
+);
+"""
+
+
+def meeting_age(created_at: str | None) -> float | None:
+    """Seconds since the meeting started, or None if unknown."""
+    try:
+        dt = datetime.fromisoformat((created_at or "").replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return max(0.0, time.time() - dt.timestamp())
+
+
+def ttl_for(created_at: str | None) -> float:
+    """How long a response stays fresh: meetings that ended long ago don't change."""
+    age = meeting_age(created_at)
+    if age is None or age < DAY:
+        return HOUR
+    if age < 14 * DAY:
+        return DAY
+    return 90 * DAY
+
+
+def empty_ttl_for(created_at: str | None) -> float:
+    """How long to trust an empty API result: a quarter of the meeting's
+    age, between an hour and 30 days. Fresh meetings may still be processing."""
+    age = meeting_age(created_at)
+    if age is None:
+        return HOUR
+    return min(30 * DAY, max(HOUR, age / 4))
+
+
+class ResponseCache:
+    """SQLite-backed response store shared by the API worker threads."""
+
+    def __init__(self, path: str, max_bytes: int = 256 * 1024 * 1024):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._total = None  # bytes in blobs, counted on the first put
+        self._conn = sqlite3.connect(path, timeout=30, isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(SCHEMA)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    @staticmethod
+    def _key(endpoint: str, doc_id: str, api_url: str) -> str:
+        return f"{api_url}/{endpoint}:{doc_id}"
+
+    def get(self, endpoint: str, doc_id: str, api_url: str = "") -> tuple[bool, object]:
+        """Return ``(hit, data)`` for a fresh cached response."""
+        now = time.time()
+        key = self._key(endpoint, doc_id, api_url)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT b.body FROM responses r JOIN blobs b ON b.sha = r.blob "
+                "WHERE r.request = ? AND r.expires_at > ?",
+                (key, now),
+            ).fetchone()
+            if row is None:
+                return False, None
+            self._conn.execute("UPDATE responses SET last_used = ? WHERE request = ?", (now, key))
+        return True, json.loads(zlib.decompress(row[0]))
+
+    def put(self, endpoint: str, doc_id: str, data, ttl: float, api_url: str = "") -> None:
+        body = zlib.compress(json.dumps(data, separators=(",", ":")).encode())
+        sha = hashlib.sha256(body).hexdigest()
+        key = self._key(endpoint, doc_id, api_url)
+        now = time.time()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                if self._total is None:
+                    self._total = self._blob_bytes()
+                old = self._conn.execute("SELECT blob FROM responses WHERE request = ?", (key,)).fetchone()
+                added = self._conn.execute(
+                    "INSERT OR IGNORE INTO blobs (sha, body, size) VALUES (?, ?, ?)",
+                    (sha, body, len(body)),
+                ).rowcount
+                self._total += len(body) if added else 0
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO responses (request, blob, expires_at, last_used) "
+                    "VALUES (?, ?, ?, ?)",
+                    (key, sha, now + ttl, now),
+                )
+                if old and old[0] != sha:
+                    self._release(old[0])
+                if self._total > self.max_bytes:
+                    self._evict(now)
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                self._total = None  # recounted on the next put
+                raise
+
+    def _blob_bytes(self) -> int:
+        return self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM blobs").fetchone()[0]
+
+    def _release(self, sha: str) -> None:
+        """Delete blob *sha* if no response points at it any more."""
+        if self._conn.execute("SELECT 1 FROM responses WHERE blob = ? LIMIT 1", (sha,)).fetchone():
+            return
+        row = self._conn.execute("SELECT size FROM blobs WHERE sha = ?", (sha,)).fetchone()
+        if row:
+            self._conn.execute("DELETE FROM blobs WHERE sha = ?", (sha,))
+            self._total -= row[0]
+
+    def _evict(self, now: float) -> None:
+        """Drop expired responses, then the least recently used, until the
+        blobs fit the cap. The total is recounted first, since other
+        processes share the file."""
+        self._conn.execute("DELETE FROM responses WHERE expires_at <= ?", (now,))
+        self._conn.execute("DELETE FROM blobs WHERE sha NOT IN (SELECT blob FROM responses)")
+        self._total = self._blob_bytes()
+        while self._total > self.max_bytes:
+            oldest = self._conn.execute(
+                "SELECT request, blob FROM responses ORDER BY last_used LIMIT 1"
+            ).fetchone()
+            if oldest is None:
+                break
+            request, sha = oldest
+            self._conn.execute("DELETE FROM responses WHERE request = ?", (request,))
+            self._release(sha)
+
+    def known_empty(self, doc_ids) -> set[str]:
+        """Which of ``doc_ids`` the API recently had nothing for."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT doc_id FROM known_empty WHERE expires_at > ?", (time.time(),)
+            ).fetchall()
+        return {doc_id for (doc_id,) in rows} & set(doc_ids)
+
+    def mark_empty(self, doc_id: str, ttl: float) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO known_empty (doc_id, expires_at) VALUES (?, ?)",
+                (doc_id, time.time() + ttl),
+            )
+
+    def clear_empty(self, doc_id: str) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM known_empty WHERE doc_id = ?", (doc_id,))
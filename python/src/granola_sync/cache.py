@@ -2,25 +2,117 @@
 
 import glob
 import json
+import mmap
 import os
 import re
 import shutil
 import tempfile
+import weakref
 from datetime import datetime
 
-from . import config
+from . import config, tracing
+from .json_scan import Scanner, release_pages, unescape_string
 
 GRANOLA_DATA_DIR = os.path.expanduser("~/Library/Application Support/Granola")
 
+# The only parts of the cache state we ever read
+SECTIONS = ("documents", "transcripts", "documentPanels", "meetingsMetadata")
 
-class CacheData:
-    """Structured access to Granola cache contents."""
 
-    def __init__(self, state: dict):
-        self.documents: dict = state.get("documents", {})
-        self.transcripts: dict = state.get("transcripts", {})
-        self.panels: dict = state.get("documentPanels", {})
-        self.meetings_meta: dict = state.get("meetingsMetadata", {})
+class CacheData:
+    """Structured access to Granola cache contents.
+
+    Sections are decoded on first access, so a command that only needs
+    ``documents`` never pays for parsing transcripts.
+    """
+
+    def __init__(self, state: dict, source: "_CacheSource | None" = None):
+        self._state = dict(state)
+        self._source = source
+
+    def _section(self, key: str) -> dict:
+        if key not in self._state:
+            self._state[key] = self._source.load(key) if self._source else {}
+        return self._state[key]
+
+    @property
+    def is_direct(self) -> bool:
+        """True when raw entry offsets are positions in the cache file."""
+        return self._source is not None and self._source.direct
+
+    def raw_entries(self, key: str):
+        """Yield ``(doc_id, raw_json, offset)`` for each entry of a state section.
+
+        Entries come straight from the file when possible, so callers can
+        hash or selectively decode them without parsing the section.
+        *offset* is where *raw_json* starts in the cache file itself, or
+        None when the entry doesn't appear verbatim there (v3 caches).
+        """
+        if self._source is not None:
+            yield from self._source.raw_entries(key)
+            return
+        for doc_id, value in self._section(key).items():
+            yield doc_id, json.dumps(value, sort_keys=True).encode(), None
+
+    @property
+    def documents(self) -> dict:
+        return self._section("documents")
+
+    @property
+    def transcripts(self) -> dict:
+        return self._section("transcripts")
+
+    @property
+    def panels(self) -> dict:
+        return self._section("documentPanels")
+
+    @property
+    def meetings_meta(self) -> dict:
+        return self._section("meetingsMetadata")
+
+
+class _CacheSource:
+    """A private, memory-mapped copy of the cache with section offsets.
+
+    The backing files are unlinked as soon as they are mapped, so nothing
+    is left in the temp dir once the CacheData is garbage collected.
+    """
+
+    def __init__(self, buf: mmap.mmap, sections: dict[str, tuple[int, int]], direct: bool):
+        self.buf = buf
+        self.sections = sections
+        # True when buf is a byte-for-byte copy of the cache file
+        self.direct = direct
+        weakref.finalize(self, _close_quietly, buf)
+
+    def load(self, key: str) -> dict:
+        span = self.sections.get(key)
+        if span is None:
+            return {}
+        start, end = span
+        # Decode straight from the mapping (no intermediate bytes copy),
+        # then let the OS drop the pages we just read.
+        with tracing.span("decode", cat="cache", section=key, bytes=end - start):
+            text = str(memoryview(self.buf)[start:end], "utf-8")
+            release_pages(self.buf, start, end)
+            return json.loads(text)
+
+    def raw_entries(self, key: str):
+        span = self.sections.get(key)
+        if span is None:
+            return
+        view = memoryview(self.buf)
+        for doc_id, start, end in Scanner(self.buf).iter_object(span[0]):
+            yield doc_id, view[start:end], start if self.direct else None
+
+
+def _close_quietly(buf: mmap.mmap) -> None:
+    # Views handed out by raw_entries may outlive the source; the mapping
+    # is then unmapped when the last of them goes away.
+    try:
+        buf.close()
+    except BufferError:
+        pass
 
 
 def _find_cache_file() -> str:
@@ -39,29 +131,98 @@ def _find_cache_file() -> str:
     return matches[0]
 
 
-def load_cache(cache_path: str | None = None) -> CacheData:
+def resolve_cache_path(cache_path: str | None = None) -> str:
+    """Configured cache path, or the newest cache-v*.json if it's gone."""
     path = cache_path or config.get("granola_cache_path")
-
     # If the configured path doesn't exist, auto-discover
     if not os.path.exists(path):
         path = _find_cache_file()
+    return path
 
-    # Copy to temp to avoid reading a file Granola is actively writing
-    with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as tmp:
-        tmp_path = tmp.name
+
+def _map_temp(fill) -> mmap.mmap:
+    """Write a temp file with *fill*, map it read-only, then unlink it."""
+    fd, tmp_path = tempfile.mkstemp(suffix=".json")
     try:
-        shutil.copy2(path, tmp_path)
-        with open(tmp_path) as f:
-            raw = json.load(f)
-        cache = raw["cache"]
-        # v3: cache value is a JSON string; v4+: cache value is a dict
-        if isinstance(cache, str):
-            cache = json.loads(cache)
-        state = cache["state"]
-        return CacheData(state)
+        with os.fdopen(fd, "wb") as f:
+            fill(f)
+        if os.path.getsize(tmp_path) == 0:
+            raise json.JSONDecodeError("Expecting value", "", 0)
+        with open(tmp_path, "rb") as f:
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
     finally:
-        if os.path.exists(tmp_path):
-            os.remove(tmp_path)
+        os.remove(tmp_path)
+
+
+def _state_sections(cache, wanted: set) -> dict:
+    """The wanted sections of a decoded ``cache`` value (a v3 string or a dict)."""
+    if isinstance(cache, str):
+        cache = json.loads(cache)
+    state = cache["state"]
+    return {key: state[key] for key in wanted if key in state}
+
+
+def load_cache(cache_path: str | None = None, sections: tuple[str, ...] | None = None,
+               offsets: bool = False) -> CacheData:
+    """Load the Granola cache. *sections* limits which state keys are kept
+    (defaults to ``SECTIONS``).
+
+    When every section is wanted, the file is decoded with one json.loads:
+    the C decoder beats scanning when everything gets used anyway. For a
+    strict subset of sections, or with *offsets* (raw entries positioned in
+    the file, for the meeting index), it is scanned instead: only the byte
+    ranges of the wanted sections are recorded, and each is decoded the
+    first time CacheData touches it. v3 caches have no such positions, so
+    *offsets* alone doesn't make them scanned.
+    """
+    path = resolve_cache_path(cache_path)
+    wanted = set(sections or SECTIONS)
+    partial = not wanted >= set(SECTIONS)
+
+    if not partial and not offsets:
+        # Read in one go rather than parsing a file Granola may be writing.
+        # Text, not bytes: json.loads would otherwise hold a decoded copy too
+        with tracing.span("read_cache", cat="cache", path=path), open(path, encoding="utf-8") as f:
+            text = f.read()
+        with tracing.span("decode", cat="cache", chars=len(text)):
+            cache = json.loads(text)["cache"]
+            del text
+            return CacheData(_state_sections(cache, wanted))
+
+    # Copy to temp to avoid reading a file Granola is actively writing
+    def copy(out):
+        with open(path, "rb") as src:
+            shutil.copyfileobj(src, out, 1024 * 1024)
+
+    with tracing.span("copy_cache", cat="cache", path=path):
+        buf = _map_temp(copy)
+    scanner = Scanner(buf)
+    start = scanner.find_key(0, "cache")
+    direct = True
+    # v3: cache value is a JSON string; v4+: cache value is a dict
+    if buf[start:start + 1] == b'"':
+        end = scanner.skip_value(start)
+        if not partial:
+            with tracing.span("decode", cat="cache", bytes=end - start):
+                literal = str(memoryview(buf)[start:end], "utf-8")
+                buf.close()
+                inner = json.loads(literal)
+                del literal
+                return CacheData(_state_sections(inner, wanted))
+        with tracing.span("unescape_v3", cat="cache"):
+            inner = _map_temp(lambda out: unescape_string(buf, start, end, out))
+        buf.close()
+        buf, scanner = inner, Scanner(inner)
+        start = 0
+        direct = False
+    start = scanner.find_key(start, "state")
+
+    spans = {}
+    with tracing.span("scan_cache", cat="cache"):
+        for key, value_start, value_end in scanner.iter_object(start):
+            if key in wanted:
+                spans[key] = (value_start, value_end)
+    return CacheData({}, _CacheSource(buf, spans, direct))
 
 
 def _parse_attendees(meta: dict) -> list[dict]:
@@ -98,72 +259,67 @@ def _compute_duration(transcript_chunks: list) -> int | None:
     return int((timestamps[-1] - timestamps[0]).total_seconds())
 
 
-def list_meetings(cache: CacheData, manifest: dict | None = None) -> list[dict]:
-    """Return summary info for all meetings in cache."""
-    manifest = manifest or {}
-    meetings = []
-
-    for doc_id, doc in cache.documents.items():
-        title = doc.get("title", "Untitled Meeting")
-        created_at = doc.get("created_at", "")
-
-        meta = cache.meetings_meta.get(doc_id, {})
-        attendees = _parse_attendees(meta)
+def meeting_summary(doc_id: str, doc: dict, transcript_chunks: list,
+                    doc_panels: dict, meta: dict) -> dict:
+    """Summary fields for one meeting (everything except export status)."""
+    # Check for summary
+    has_summary = False
+    for panel in doc_panels.values():
+        if panel.get("title") == "Summary" and panel.get("original_content"):
+            has_summary = True
+            break
 
-        transcript_chunks = cache.transcripts.get(doc_id, [])
-        duration = _compute_duration(transcript_chunks)
+    return {
+        "doc_id": doc_id,
+        "title": doc.get("title", "Untitled Meeting"),
+        "created_at": doc.get("created_at", ""),
+        "attendees": [a["name"] for a in _parse_attendees(meta)],
+        "duration_seconds": _compute_duration(transcript_chunks),
+        "has_transcript": len(transcript_chunks) > 0,
+        "has_summary": has_summary,
+        "has_notes": bool(doc.get("notes_markdown")),
+    }
 
-        # Check for summary
-        has_summary = False
-        doc_panels = cache.panels.get(doc_id, {})
-        for panel in doc_panels.values():
-            if panel.get("title") == "Summary" and panel.get("original_content"):
-                has_summary = True
-                break
 
-        has_notes = bool(doc.get("notes_markdown"))
-        has_transcript = len(transcript_chunks) > 0
-
-        export_info = manifest.get(doc_id)
-        is_exported = export_info is not None
-
-        meetings.append({
-            "doc_id": doc_id,
-            "title": title,
-            "created_at": created_at,
-            "attendees": [a["name"] for a in attendees],
-            "duration_seconds": duration,
-            "has_transcript": has_transcript,
-            "has_summary": has_summary,
-            "has_notes": has_notes,
-            "is_exported": is_exported,
-            "export_filename": export_info["filename"] if export_info else None,
-        })
+def with_export_status(meetings: list[dict], manifest: dict | None = None) -> list[dict]:
+    """Add manifest export fields and sort by date descending."""
+    manifest = manifest or {}
+    for m in meetings:
+        export_info = manifest.get(m["doc_id"])
+        m["is_exported"] = export_info is not None
+        m["export_filename"] = export_info["filename"] if export_info else None
 
     # Sort by date descending (most recent first)
     meetings.sort(key=lambda m: m["created_at"], reverse=True)
     return meetings
 
 
-def get_meeting_detail(cache: CacheData, doc_id: str, manifest: dict | None = None) -> dict | None:
-    """Return full content for a single meeting."""
-    doc = cache.documents.get(doc_id)
-    if not doc:
-        return None
+def list_meetings(cache: CacheData, manifest: dict | None = None) -> list[dict]:
+    """Return summary info for all meetings in cache."""
+    meetings = [
+        meeting_summary(
+            doc_id, doc,
+            cache.transcripts.get(doc_id, []),
+            cache.panels.get(doc_id, {}),
+            cache.meetings_meta.get(doc_id, {}),
+        )
+        for doc_id, doc in cache.documents.items()
+    ]
+    return with_export_status(meetings, manifest)
 
+
+def meeting_detail(doc_id: str, doc: dict, transcript_chunks: list, doc_panels: dict,
+                   meta: dict, manifest: dict | None = None) -> dict:
+    """Full content for one meeting from its raw cache entries."""
     manifest = manifest or {}
     title = doc.get("title", "Untitled Meeting")
     created_at = doc.get("created_at", "")
 
-    meta = cache.meetings_meta.get(doc_id, {})
     attendees = _parse_attendees(meta)
-
-    transcript_chunks = cache.transcripts.get(doc_id, [])
     duration = _compute_duration(transcript_chunks)
 
     # Summary HTML
     summary_html = ""
-    doc_panels = cache.panels.get(doc_id, {})
     for panel in doc_panels.values():
         if panel.get("title") == "Summary":
             summary_html = panel.get("original_content", "")
@@ -195,3 +351,17 @@ def get_meeting_detail(cache: CacheData, doc_id: str, manifest: dict | None = No
         "is_exported": export_info is not None,
         "export_filename": export_info["filename"] if export_info else None,
     }
+
+
+def get_meeting_detail(cache: CacheData, doc_id: str, manifest: dict | None = None) -> dict | None:
+    """Return full content for a single meeting."""
+    doc = cache.documents.get(doc_id)
+    if not doc:
+        return None
+    return meeting_detail(
+        doc_id, doc,
+        cache.transcripts.get(doc_id, []),
+        cache.panels.get(doc_id, {}),
+        cache.meetings_meta.get(doc_id, {}),
+        manifest,
+    )
@@ -14,7 +14,11 @@ def cmd_export(args):
     cfg = config.load_config()
     ids = args.ids.split(",") if getattr(args, "ids", None) else None
     force = getattr(args, "force", False)
-    result = run_export(cfg, doc_ids=ids, force=force)
+    if getattr(args, "no_api_cache", False):
+        cfg["api_cache_enabled"] = False
+    recheck_empty = getattr(args, "recheck_empty", False)
+    result = run_export(cfg, doc_ids=ids, force=force, recheck_empty=recheck_empty,
+                        jobs=getattr(args, "jobs", None), trace=getattr(args, "trace", None))
 
     if args.json:
         print(json.dumps(result.to_dict(), indent=2))
@@ -25,41 +29,30 @@ def cmd_export(args):
         print(f"\n  Exported:    {result.exported}")
         print(f"  API fetched: {result.api_fetched}")
         print(f"  Skipped:     {result.skipped}")
+        if result.unchanged:
+            print(f"  Unchanged:   {result.unchanged}")
         if result.errors:
             print(f"  Errors:      {len(result.errors)}")
             for e in result.errors:
                 print(f"    [ERR] {e}")
         print(f"\n  {result.message}")
+        # Scheduled runs write this to export.log
+        timing = result.timing_summary()
+        if timing:
+            print(f"  Timing:      {timing[0]}")
+            for line in timing[1:]:
+                print(f"    {line}")
 
     sys.exit(0 if result.success else 1)
 
 
 def cmd_list(args):
-    from .cache import load_cache, list_meetings
+    from .commands import list_meetings
     from .manifest import load_manifest
 
     cfg = config.load_config()
-    cache = load_cache(config.expand(cfg.get("granola_cache_path", "")))
     manifest = load_manifest(config.expand(cfg.get("manifest_path", "")))
-    meetings = list_meetings(cache, manifest)
-
-    # Filter by search query
-    if args.search:
-        q = args.search.lower()
-        meetings = [
-            m for m in meetings
-            if q in m["title"].lower() or any(q in a.lower() for a in m["attendees"])
-        ]
-
-    # Sort
-    if args.sort == "title":
-        meetings.sort(key=lambda m: m["title"].lower())
-    elif args.sort == "duration":
-        meetings.sort(key=lambda m: m["duration_seconds"] or 0, reverse=True)
-    # default: date (already sorted in list_meetings)
-
-    if args.limit:
-        meetings = meetings[:args.limit]
+    meetings = list_meetings(cfg, manifest, args.search, args.sort, args.limit)
 
     if args.json:
         print(json.dumps(meetings, indent=2))
@@ -81,27 +74,12 @@ def cmd_list(args):
 
 
 def cmd_show(args):
-    from .cache import load_cache, get_meeting_detail
+    from .commands import show_meeting
     from .manifest import load_manifest
-    from .auth import get_access_token
-    from .api import fetch_panels
 
     cfg = config.load_config()
-    cache = load_cache(config.expand(cfg.get("granola_cache_path", "")))
     manifest = load_manifest(config.expand(cfg.get("manifest_path", "")))
-    detail = get_meeting_detail(cache, args.doc_id, manifest)
-
-    # API fallback for summary if cache panels are empty (v4+)
-    if detail and not detail.get("summary_html"):
-        token = get_access_token(config.expand(cfg.get("granola_auth_path", "")))
-        if token:
-            api_panels = fetch_panels(args.doc_id, token, cfg.get("api_url"))
-            if api_panels:
-                for panel in api_panels:
-                    if panel.get("title") == "Summary":
-                        detail["summary_html"] = panel.get("original_content", "")
-                        if detail["summary_html"]:
-                            break
+    detail = show_meeting(cfg, manifest, args.doc_id, use_cache=not args.no_api_cache)
 
     if not detail:
         print(f"Meeting not found: {args.doc_id}", file=sys.stderr)
@@ -127,12 +105,10 @@ def cmd_show(args):
 
 
 def cmd_stats(args):
-    from .cache import load_cache
     from .stats import compute_stats
 
     cfg = config.load_config()
-    cache = load_cache(config.expand(cfg.get("granola_cache_path", "")))
-    stats = compute_stats(cache, cfg)
+    stats = compute_stats(cfg=cfg)
 
     if args.json:
         print(json.dumps(stats, indent=2))
@@ -152,41 +128,12 @@ def cmd_stats(args):
 
 
 def cmd_status(args):
-    from .cache import load_cache
+    from .commands import sync_status
     from .manifest import load_manifest
-    from .auth import get_access_token
-    from . import launchd
 
     cfg = config.load_config()
-    status = {}
-
-    # Granola cache
-    cache_path = config.expand(cfg.get("granola_cache_path", ""))
-    try:
-        cache = load_cache(cache_path)
-        status["granola_cache"] = "connected"
-        status["documents_in_cache"] = len(cache.documents)
-    except Exception as e:
-        status["granola_cache"] = f"error: {e}"
-        status["documents_in_cache"] = 0
-
-    # Drive
-    drive_path = config.expand(cfg.get("drive_path", ""))
-    import os
-    status["drive_path"] = drive_path
-    status["drive_accessible"] = os.path.isdir(drive_path) if drive_path else False
-
-    # Manifest
-    manifest_path = config.expand(cfg.get("manifest_path", ""))
-    manifest = load_manifest(manifest_path)
-    status["manifest_count"] = len(manifest)
-
-    # Auth
-    auth_path = config.expand(cfg.get("granola_auth_path", ""))
-    status["api_auth"] = "available" if get_access_token(auth_path) else "unavailable"
-
-    # LaunchAgent
-    status["launchd"] = launchd.status()
+    manifest = load_manifest(config.expand(cfg.get("manifest_path", "")))
+    status = sync_status(cfg, manifest)
 
     if args.json:
         print(json.dumps(status, indent=2))
@@ -217,10 +164,14 @@ def cmd_config(args):
             sys.exit(1)
         # Type coercion for known types
         value = args.value
-        if args.key in ("schedule_interval",):
+        if args.key in ("schedule_interval", "api_workers", "api_cache_max_mb", "export_jobs"):
             value = int(value)
-        elif args.key in ("notifications_enabled",):
+        elif args.key in ("transcript_coalesce_seconds", "watch_interval", "watch_debounce"):
+            value = float(value)
+        elif args.key in ("notifications_enabled", "api_cache_enabled"):
             value = value.lower() in ("true", "1", "yes")
+        elif args.key == "export_format" and "," in value:
+            value = config.export_formats({"export_format": value})
         cfg[args.key] = value
         config.save_config(cfg)
         print(f"  Set {args.key} = {value}")
@@ -285,6 +236,34 @@ def cmd_launchd(args):
                 print(f"  Interval:  {info['interval']}s ({days} days)")
 
 
+def cmd_watch(args):
+    from .watch import Watcher
+
+    def report(result):
+        if args.json:
+            print(json.dumps(result.to_dict()), flush=True)
+            return
+        for f in result.files:
+            print(f"  [ok] {f}")
+        for e in result.errors:
+            print(f"  [ERR] {e}")
+        print(f"  {result.message}", flush=True)
+
+    watcher = Watcher(interval=args.interval, debounce=args.debounce)
+    if not args.json:
+        print(f"  Watching {watcher.cache_dir} (Ctrl-C to stop)", flush=True)
+    try:
+        watcher.run(report)
+    except KeyboardInterrupt:
+        pass
+
+
+def cmd_serve(args):
+    from .server import run
+
+    run(args.socket)
+
+
 def cmd_version(args):
     print(f"granola-sync {__version__}")
 
@@ -302,6 +281,13 @@ def main():
     p_export.add_argument("--json", action="store_true", dest="json")
     p_export.add_argument("--ids", help="Comma-separated doc IDs to export")
     p_export.add_argument("--force", action="store_true", help="Re-export even if already exported")
+    p_export.add_argument("--no-api-cache", action="store_true", help="Don't read or write the API response cache")
+    p_export.add_argument("--jobs", type=int, metavar="N",
+                          help="Render files in N worker processes (default: export_jobs from config)")
+    p_export.add_argument("--recheck-empty", action="store_true",
+                          help="Ask the API again about meetings it recently had nothing for")
+    p_export.add_argument("--trace", metavar="FILE",
+                          help="Write a Chrome/Perfetto trace of the run to FILE")
 
     # list
     p_list = subparsers.add_parser("list", help="List all meetings in cache")
@@ -314,6 +300,7 @@ def main():
     p_show = subparsers.add_parser("show", help="Show full meeting details")
     p_show.add_argument("doc_id", help="Document ID of the meeting")
     p_show.add_argument("--json", action="store_true", dest="json")
+    p_show.add_argument("--no-api-cache", action="store_true", help="Don't read or write the API response cache")
 
     # stats
     p_stats = subparsers.add_parser("stats", help="Show meeting statistics")
@@ -337,6 +324,17 @@ def main():
     p_launchd.add_argument("--interval", type=int, help="Schedule interval in seconds (default: from config)")
     p_launchd.add_argument("--json", action="store_true", dest="json")
 
+    # watch
+    p_watch = subparsers.add_parser("watch", help="Export new meetings as soon as Granola's cache changes")
+    p_watch.add_argument("--interval", type=float, help="Seconds between checks (default: watch_interval)")
+    p_watch.add_argument("--debounce", type=float,
+                         help="Seconds the cache must be quiet before exporting (default: watch_debounce)")
+    p_watch.add_argument("--json", action="store_true", dest="json", help="One JSON result per export")
+
+    # serve
+    p_serve = subparsers.add_parser("serve", help="Answer JSON-RPC requests from the app (stdin/stdout)")
+    p_serve.add_argument("--socket", help="Listen on this Unix socket instead of stdin/stdout")
+
     # version
     subparsers.add_parser("version", help="Show version")
 
@@ -354,6 +352,8 @@ def main():
         "status": cmd_status,
         "config": cmd_config,
         "launchd": cmd_launchd,
+        "watch": cmd_watch,
+        "serve": cmd_serve,
         "version": cmd_version,
     }
     commands[args.command](args)
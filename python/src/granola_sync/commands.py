@@ -0,0 +1,93 @@
+"""Command implementations that return data — shared by the CLI and ``serve``.
+
+Each takes the loaded config and manifest and, optionally, an open
+MeetingIndex to reuse; the CLI prints the result, the daemon sends it
+back as JSON.
+"""
+
+import os
+
+from . import config
+
+
+def list_meetings(cfg: dict, manifest: dict, search: str | None = None, sort: str = "date",
+                  limit: int | None = None, index=None) -> list[dict]:
+    from .index import list_meetings as list_indexed
+
+    meetings = list_indexed(cfg, manifest, index)
+
+    # Filter by search query
+    if search:
+        q = search.lower()
+        meetings = [
+            m for m in meetings
+            if q in m["title"].lower() or any(q in a.lower() for a in m["attendees"])
+        ]
+
+    # Sort
+    if sort == "title":
+        meetings.sort(key=lambda m: m["title"].lower())
+    elif sort == "duration":
+        meetings.sort(key=lambda m: m["duration_seconds"] or 0, reverse=True)
+    # default: date (already sorted in list_meetings)
+
+    if limit:
+        meetings = meetings[:limit]
+    return meetings
+
+
+def show_meeting(cfg: dict, manifest: dict, doc_id: str, use_cache: bool = True,
+                 index=None) -> dict | None:
+    from .index import get_meeting_detail
+
+    detail = get_meeting_detail(cfg, doc_id, manifest, index)
+
+    # API fallback for summary if cache panels are empty (v4+)
+    if detail and not detail.get("summary_html"):
+        from .auth import get_access_token
+        from .api import fetch_panels
+
+        token = get_access_token(config.expand(cfg.get("granola_auth_path", "")))
+        if token:
+            api_panels = fetch_panels(doc_id, token, cfg.get("api_url"),
+                                      created_at=detail.get("created_at"),
+                                      use_cache=use_cache, cfg=cfg)
+            if api_panels:
+                for panel in api_panels:
+                    if panel.get("title") == "Summary":
+                        detail["summary_html"] = panel.get("original_content", "")
+                        if detail["summary_html"]:
+                            break
+    return detail
+
+
+def sync_status(cfg: dict, manifest: dict, index=None) -> dict:
+    from .index import document_count
+    from .auth import get_access_token
+    from . import launchd
+
+    status = {}
+
+    # Granola cache
+    try:
+        status["documents_in_cache"] = document_count(cfg, index)
+        status["granola_cache"] = "connected"
+    except Exception as e:
+        status["granola_cache"] = f"error: {e}"
+        status["documents_in_cache"] = 0
+
+    # Drive
+    drive_path = config.expand(cfg.get("drive_path", ""))
+    status["drive_path"] = drive_path
+    status["drive_accessible"] = os.path.isdir(drive_path) if drive_path else False
+
+    # Manifest
+    status["manifest_count"] = len(manifest)
+
+    # Auth
+    auth_path = config.expand(cfg.get("granola_auth_path", ""))
+    status["api_auth"] = "available" if get_access_token(auth_path) else "unavailable"
+
+    # LaunchAgent
+    status["launchd"] = launchd.status()
+    return status
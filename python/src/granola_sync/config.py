@@ -14,14 +14,43 @@ DEFAULTS = {
     "granola_cache_path": "~/Library/Application Support/Granola/cache-v4.json",
     "granola_auth_path": "~/Library/Application Support/Granola/supabase.json",
     "manifest_path": str(CONFIG_DIR / "manifest.json"),
+    "index_path": str(CONFIG_DIR / "index.sqlite3"),
     "schedule_interval": 1209600,
     "notifications_enabled": True,
     "export_format": "docx",
+    "transcript_coalesce_seconds": 0,
     "api_url": "https://api.granola.ai/v1",
+    "api_workers": 8,
+    "export_jobs": 1,
+    "watch_interval": 5,
+    "watch_debounce": 10,
+    "api_cache_enabled": True,
+    "api_cache_path": str(CONFIG_DIR / "api-cache.sqlite3"),
+    "api_cache_max_mb": 256,
     "log_path": str(CONFIG_DIR / "export.log"),
 }
 
 
+# Output formats, in the order they are listed when unspecified
+FORMATS = ("docx", "md", "txt")
+
+
+def export_formats(config: dict) -> list[str]:
+    """``export_format`` as a list: one format ("docx") or several
+    (["docx", "md"], or "docx,md" as set from the CLI). Unknown formats
+    export as docx."""
+    value = config.get("export_format") or DEFAULTS["export_format"]
+    if isinstance(value, str):
+        value = value.split(",")
+    formats = []
+    for fmt in value:
+        fmt = fmt.strip().lower()
+        fmt = fmt if fmt in FORMATS else "docx"
+        if fmt not in formats:
+            formats.append(fmt)
+    return formats
+
+
 def expand(path: str) -> str:
     return os.path.expanduser(path)
 
@@ -75,6 +104,13 @@ def validate_config(config: dict) -> tuple[list[str], list[str]]:
         else:
             errors.append(f"Google Drive not found at: {parent}")
 
+    value = config.get("export_format") or DEFAULTS["export_format"]
+    unknown = [f for f in (value.split(",") if isinstance(value, str) else value)
+               if f.strip().lower() not in FORMATS]
+    if unknown:
+        warnings.append(f"Unknown export_format {', '.join(map(str, unknown))} — "
+                        f"exporting as docx (choose from {', '.join(FORMATS)})")
+
     cache_path = expand(config.get("granola_cache_path", ""))
     if not os.path.isfile(cache_path):
         # Check if any cache-v*.json exists (Granola may have upgraded)
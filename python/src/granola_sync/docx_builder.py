@@ -1,13 +1,116 @@
-"""Build styled .docx files from meeting data."""
+"""Build styled .docx files from meeting data.
 
-from datetime import datetime
+Formatting lives in named styles on a base document that is built once
+per thread (see ``_document``); each meeting starts from that document
+with an empty body, and its paragraphs and runs only reference styles.
 
+The transcript never enters the object model: its paragraphs are written
+as raw XML straight into the zip (``_save``), so time and memory don't
+grow with it beyond the output itself.
+"""
+
+import io
+import re
+import threading
+import zipfile
 from docx import Document
-from docx.shared import Pt, RGBColor, Inches
+from docx.enum.style import WD_STYLE_TYPE
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 from docx.oxml.ns import qn
+from docx.shared import Pt, RGBColor, Inches
+
+from . import tracing
+from .meeting import Meeting, TranscriptEntry, build_meeting
+
+# name -> (style id, base style, size, colour, bold, italic). Transcript
+# styles get short ids: they are referenced several times per line.
+PARAGRAPH_STYLES = {
+    "Meeting Title": ("MeetingTitle", "Heading 1", 22, (0x1A, 0x1A, 0x2E), None, None),
+    "Meeting Section": ("MeetingSection", "Heading 2", 16, (0x33, 0x33, 0x33), None, None),
+    "Summary Heading": ("SummaryHeading", "Heading 3", 13, (0x44, 0x44, 0x44), None, None),
+    "Transcript Line": ("TL", "Normal", None, None, None, None),
+}
+CHARACTER_STYLES = {
+    "Meeting Date": ("MeetingDate", "Default Paragraph Font", 11, (0x66, 0x66, 0x66), None, True),
+    "Transcript Timestamp": ("TT", "Default Paragraph Font", 8, (0x99, 0x99, 0x99), None, None),
+    "Speaker You": ("TY", "Default Paragraph Font", 9, (0x1A, 0x73, 0xE8), True, None),
+    "Speaker Other": ("TO", "Default Paragraph Font", 9, (0x5F, 0x63, 0x68), True, None),
+    "Transcript Text": ("TX", "Default Paragraph Font", 9.5, None, None, None),
+}
+
+# Style ids for names used below; set on the XML directly, since python-docx's
+# style setters look up the default style (a scan of all styles) every call
+_STYLE_IDS = {
+    **{name: spec[0] for name, spec in {**PARAGRAPH_STYLES, **CHARACTER_STYLES}.items()},
+    "List Bullet": "ListBullet",
+    "Strong": "Strong",
+}
+
+# Characters XML 1.0 can't carry (tab, newline and CR are handled separately)
+_XML_INVALID = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f\ufffe\uffff]")
+_RUN_BREAKS = re.compile(r"(\t|\r\n|\r|\n)")
+_XML_ESCAPES = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;"})
+# Lines written to the zip per write() call
+_WRITE_BATCH = 256
+# Timestamp of every zip entry (the earliest a zip can hold)
+_ZIP_DATE = (1980, 1, 1, 0, 0, 0)
+
+_local = threading.local()
+
+
+def _add_style(doc: Document, name: str, style_type, style_id: str, base: str,
+               size, color, bold, italic) -> None:
+    style = doc.styles.add_style(name, style_type)
+    style.style_id = style_id
+    style.base_style = doc.styles[base]
+    style.quick_style = True
+    if size is not None:
+        style.font.size = Pt(size)
+    if color is not None:
+        style.font.color.rgb = RGBColor(*color)
+    if bold is not None:
+        style.font.bold = bold
+    if italic is not None:
+        style.font.italic = italic
+
+
+def _base_document() -> Document:
+    """python-docx's default template with our styles added."""
+    doc = Document()
+
+    # Global style
+    style = doc.styles["Normal"]
+    style.font.name = "Calibri"
+    style.font.size = Pt(11)
+    style.paragraph_format.space_after = Pt(4)
+    style.paragraph_format.space_before = Pt(0)
+
+    for name, spec in PARAGRAPH_STYLES.items():
+        _add_style(doc, name, WD_STYLE_TYPE.PARAGRAPH, *spec)
+    for name, spec in CHARACTER_STYLES.items():
+        _add_style(doc, name, WD_STYLE_TYPE.CHARACTER, *spec)
+    doc.styles["Meeting Title"].paragraph_format.alignment = WD_ALIGN_PARAGRAPH.LEFT
+    line = doc.styles["Transcript Line"].paragraph_format
+    line.space_before = Pt(1)
+    line.space_after = Pt(1)
+    return doc
+
 
-from .html_parser import parse_html_to_elements
+def _document() -> Document:
+    """The base document with an empty body.
+
+    It is built once per thread (loading the template and adding styles is
+    the expensive part) and reused for every meeting: only the body
+    changes, and save() serializes the whole package each time.
+    """
+    doc = getattr(_local, "doc", None)
+    if doc is None:
+        doc = _local.doc = _base_document()
+    body = doc.element.body
+    for child in list(body):
+        if child.tag != qn("w:sectPr"):
+            body.remove(child)
+    return doc
 
 
 def _add_hr(doc: Document) -> None:
@@ -27,90 +130,129 @@ def _add_hr(doc: Document) -> None:
     pPr.append(pBdr)
 
 
-def create_meeting_docx(
-    filepath: str,
-    title: str,
-    date_str: str,
-    attendees: list[dict],
-    summary_html: str,
-    transcript_chunks: list[dict],
-    notes_markdown: str | None = None,
-) -> None:
-    doc = Document()
+def _paragraph(doc: Document, text: str = "", style: str | None = None):
+    p = doc.add_paragraph(text)
+    if style:
+        p._p.style = _STYLE_IDS[style]
+    return p
+
+
+def _run(p, text: str, style: str):
+    run = p.add_run(text)
+    run._r.style = _STYLE_IDS[style]
+    return run
+
+
+def _t(text: str) -> str:
+    text = text.translate(_XML_ESCAPES)
+    if text != text.strip():
+        return f'<w:t xml:space="preserve">{text}</w:t>'
+    return f"<w:t>{text}</w:t>"
+
+
+def _run_xml(style_id: str, text: str) -> str:
+    """A w:r referencing a character style, with tabs and line breaks as
+    python-docx's Run.text would write them."""
+    text = _XML_INVALID.sub("", text)
+    if "\t" in text or "\n" in text or "\r" in text:
+        parts = []
+        for piece in _RUN_BREAKS.split(text):
+            if piece == "\t":
+                parts.append("<w:tab/>")
+            elif piece in ("\r\n", "\r", "\n"):
+                parts.append("<w:br/>" * (2 if piece == "\r\n" else 1))
+            elif piece:
+                parts.append(_t(piece))
+        content = "".join(parts)
+    else:
+        content = _t(text)
+    return f'<w:r><w:rPr><w:rStyle w:val="{style_id}"/></w:rPr>{content}</w:r>'
+
+
+def _transcript_xml(transcript: list[TranscriptEntry]):
+    """Yield one "Transcript Line" paragraph of raw XML per entry."""
+    you = _run_xml("TY", "[\U0001f3a4 You]  ")
+    other = _run_xml("TO", "[\U0001f50a Other]  ")
+    for entry in transcript:
+        time_str = entry.time.strftime("%H:%M:%S") if entry.time else "??:??:??"
+        yield (f'<w:p><w:pPr><w:pStyle w:val="TL"/></w:pPr>{_run_xml("TT", f"{time_str}  ")}'
+               f"{you if entry.you else other}{_run_xml('TX', entry.text)}</w:p>")
+
+
+def _save(doc: Document, filepath: str, transcript: list[TranscriptEntry]) -> None:
+    """Save *doc*, with the transcript streamed onto the end of its body.
+
+    python-docx writes the package (all of it small) to memory; it is then
+    copied into *filepath* part by part, and the transcript paragraphs are
+    spliced into word/document.xml just before the body's sectPr. Parts
+    get a fixed timestamp, so the same meeting always gives the same bytes.
+    """
+    staged = io.BytesIO()
+    doc.save(staged)
+    with zipfile.ZipFile(staged) as src, zipfile.ZipFile(filepath, "w", zipfile.ZIP_DEFLATED) as dst:
+        for info in src.infolist():
+            data = src.read(info)
+            info.date_time = _ZIP_DATE
+            if info.filename != "word/document.xml":
+                dst.writestr(info, data)
+                continue
+            split = data.rindex(b"<w:sectPr")
+            with dst.open(info, "w") as out:
+                out.write(data[:split])
+                batch = []
+                for line in _transcript_xml(transcript):
+                    batch.append(line)
+                    if len(batch) >= _WRITE_BATCH:
+                        out.write("".join(batch).encode())
+                        batch.clear()
+                out.write("".join(batch).encode())
+                out.write(data[split:])
 
-    # Global style
-    style = doc.styles["Normal"]
-    style.font.name = "Calibri"
-    style.font.size = Pt(11)
-    style.paragraph_format.space_after = Pt(4)
-    style.paragraph_format.space_before = Pt(0)
+
+def render_docx(meeting: Meeting, filepath: str) -> None:
+    doc = _document()
 
     # Title
-    h = doc.add_heading(title, level=1)
-    h.alignment = WD_ALIGN_PARAGRAPH.LEFT
-    for run in h.runs:
-        run.font.size = Pt(22)
-        run.font.color.rgb = RGBColor(0x1A, 0x1A, 0x2E)
+    _paragraph(doc, meeting.title, "Meeting Title")
 
     # Date
-    try:
-        dt = datetime.fromisoformat(date_str.replace("Z", "+00:00"))
-        formatted_date = dt.strftime("%A, %B %d, %Y  |  %I:%M %p")
-    except (ValueError, AttributeError):
-        formatted_date = date_str
-    p = doc.add_paragraph()
-    run = p.add_run(formatted_date)
-    run.font.size = Pt(11)
-    run.font.color.rgb = RGBColor(0x66, 0x66, 0x66)
-    run.italic = True
+    if meeting.date:
+        formatted_date = meeting.date.strftime("%A, %B %d, %Y  |  %I:%M %p")
+    else:
+        formatted_date = meeting.date_str
+    _run(_paragraph(doc), formatted_date, "Meeting Date")
 
     # Attendees
-    if attendees:
-        names = [a.get("name", a.get("email", "Unknown")) for a in attendees]
-        p = doc.add_paragraph()
-        run = p.add_run("Attendees:  ")
-        run.bold = True
-        run.font.size = Pt(11)
-        p.add_run(", ".join(names)).font.size = Pt(11)
+    if meeting.attendees:
+        p = _paragraph(doc)
+        _run(p, "Attendees:  ", "Strong")
+        p.add_run(", ".join(meeting.attendees))
 
     _add_hr(doc)
 
     # Summary
-    if summary_html:
-        h = doc.add_heading("Meeting Summary", level=2)
-        for run in h.runs:
-            run.font.size = Pt(16)
-            run.font.color.rgb = RGBColor(0x33, 0x33, 0x33)
-
-        elements = parse_html_to_elements(summary_html)
-        for elem_type, text, depth in elements:
+    if meeting.summary:
+        _paragraph(doc, "Meeting Summary", "Meeting Section")
+        for elem_type, text, depth, _ in meeting.summary:
             if elem_type == "heading":
-                sh = doc.add_heading(text, level=3)
-                for run in sh.runs:
-                    run.font.size = Pt(13)
-                    run.font.color.rgb = RGBColor(0x44, 0x44, 0x44)
+                _paragraph(doc, text, "Summary Heading")
             elif elem_type == "bullet":
-                p = doc.add_paragraph(style="List Bullet")
-                p.text = text
+                p = _paragraph(doc, text, "List Bullet")
                 if depth > 1:
                     p.paragraph_format.left_indent = Inches(0.25 * depth)
             elif elem_type == "paragraph":
                 doc.add_paragraph(text)
 
     # Notes
-    if notes_markdown and notes_markdown.strip():
+    if meeting.notes:
         _add_hr(doc)
-        h = doc.add_heading("Notes", level=2)
-        for run in h.runs:
-            run.font.size = Pt(16)
-            run.font.color.rgb = RGBColor(0x33, 0x33, 0x33)
-        for line in notes_markdown.split("\n"):
+        _paragraph(doc, "Notes", "Meeting Section")
+        for line in meeting.notes:
             stripped = line.strip()
             if not stripped:
                 continue
             if stripped.startswith(("- ", "* ")):
-                p = doc.add_paragraph(style="List Bullet")
-                p.text = stripped[2:]
+                _paragraph(doc, stripped[2:], "List Bullet")
             elif stripped.startswith("# "):
                 doc.add_heading(stripped[2:], level=3)
             elif stripped.startswith("## "):
@@ -119,45 +261,24 @@ def create_meeting_docx(
                 doc.add_paragraph(stripped)
 
     # Transcript
-    if transcript_chunks:
+    if meeting.transcript:
         doc.add_page_break()
-        h = doc.add_heading("Full Transcript", level=2)
-        for run in h.runs:
-            run.font.size = Pt(16)
-            run.font.color.rgb = RGBColor(0x33, 0x33, 0x33)
-
-        for chunk in transcript_chunks:
-            ts = chunk.get("start_timestamp", "")
-            source = chunk.get("source", "unknown")
-            text = chunk.get("text", "").strip()
-            if not text:
-                continue
-
-            try:
-                cdt = datetime.fromisoformat(ts.replace("Z", "+00:00"))
-                time_str = cdt.strftime("%H:%M:%S")
-            except (ValueError, AttributeError):
-                time_str = "??:??:??"
-
-            source_label = "\U0001f3a4 You" if source == "microphone" else "\U0001f50a Other"
+        _paragraph(doc, "Full Transcript", "Meeting Section")
 
-            p = doc.add_paragraph()
-            p.paragraph_format.space_after = Pt(1)
-            p.paragraph_format.space_before = Pt(1)
+    with tracing.span("save", cat="render"):
+        _save(doc, filepath, meeting.transcript)
 
-            ts_run = p.add_run(f"{time_str}  ")
-            ts_run.font.size = Pt(8)
-            ts_run.font.color.rgb = RGBColor(0x99, 0x99, 0x99)
 
-            label_run = p.add_run(f"[{source_label}]  ")
-            label_run.font.size = Pt(9)
-            label_run.bold = True
-            if source == "microphone":
-                label_run.font.color.rgb = RGBColor(0x1A, 0x73, 0xE8)
-            else:
-                label_run.font.color.rgb = RGBColor(0x5F, 0x63, 0x68)
-
-            text_run = p.add_run(text)
-            text_run.font.size = Pt(9.5)
-
-    doc.save(filepath)
+def create_meeting_docx(
+    filepath: str,
+    title: str,
+    date_str: str,
+    attendees: list[dict],
+    summary_html: str,
+    transcript_chunks: list[dict],
+    notes_markdown: str | None = None,
+    coalesce_seconds: float = 0,
+) -> None:
+    meeting = build_meeting(title, date_str, attendees, summary_html, transcript_chunks, notes_markdown,
+                            coalesce_seconds)
+    render_docx(meeting, filepath)
@@ -1,21 +1,44 @@
 """Main export orchestrator — the engine that drives the sync."""
 
+import contextlib
+import hashlib
+import heapq
+import importlib
 import json
 import os
+import re
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 
-from . import config
+from . import config, tracing
 from .auth import get_access_token
-from .api import fetch_transcript, fetch_panels
-from .cache import load_cache
-from .docx_builder import create_meeting_docx
-from .markdown_builder import create_meeting_md
-from .text_builder import create_meeting_txt
-from .manifest import load_manifest, save_manifest, add_entry
+from .api import fetch_transcript, fetch_panels, response_cache
+from .api_cache import empty_ttl_for
+from .cache import _parse_attendees, load_cache
+from .manifest import add_entry, format_entries, load_manifest, save_manifest
+from .meeting import build_meeting
 from .notifications import notify
-from .utils import safe_filename, unique_filename
+from .utils import PARTIAL_SUFFIX, safe_filename, staged_file, unique_filename
+
+# manifest.json is rewritten after this many exports or seconds, whichever
+# comes first; the manifest database itself commits every export
+CHECKPOINT_DOCS = 25
+CHECKPOINT_SECONDS = 30.0
+
+# Slowest documents reported in ExportResult.slowest
+SLOWEST_DOCS = 5
+
+# format -> (module, renderer); imported on first use, so md and txt
+# exports never load python-docx
+BUILDERS = {
+    "docx": ("docx_builder", "render_docx"),
+    "md": ("markdown_builder", "render_md"),
+    "txt": ("text_builder", "render_txt"),
+}
 
 
 @dataclass
@@ -23,163 +46,561 @@ class ExportResult:
     success: bool = True
     exported: int = 0
     skipped: int = 0
+    # Re-rendered, but every file came out identical and was left in place
+    unchanged: int = 0
     api_fetched: int = 0
     errors: list[str] = field(default_factory=list)
+    # Documents behind those errors; watch mode retries them
+    failed_ids: list[str] = field(default_factory=list)
     files: list[str] = field(default_factory=list)
     message: str = ""
+    # Seconds the run spent in each phase (see _phase) and in total
+    timings: dict[str, float] = field(default_factory=dict)
+    # Slowest exported documents: file, api, render, write and total seconds
+    slowest: list[dict] = field(default_factory=list)
 
     def to_dict(self) -> dict:
         return {
             "success": self.success,
             "exported": self.exported,
             "skipped": self.skipped,
+            "unchanged": self.unchanged,
             "api_fetched": self.api_fetched,
             "errors": self.errors,
+            "failed_ids": self.failed_ids,
             "files": self.files,
             "message": self.message,
+            "timings": {k: round(v, 4) for k, v in self.timings.items()},
+            "slowest": self.slowest,
         }
 
+    def timing_summary(self) -> list[str]:
+        """Human-readable timing lines, for the text output and export.log."""
+        if "total" not in self.timings:
+            return []
+        phases = ", ".join(f"{k.replace('_', ' ')} {v:.2f}s" for k, v in self.timings.items()
+                           if k != "total" and v >= 0.005)
+        lines = [f"{self.timings['total']:.2f}s total" + (f" ({phases})" if phases else "")]
+        for doc in self.slowest:
+            parts = ", ".join(f"{k} {doc[k]:.2f}s" for k in ("api", "render", "write") if k in doc)
+            lines.append(f"{doc['seconds']:.2f}s  {doc['file']} ({parts})")
+        return lines
 
-def run_export(cfg: dict | None = None, doc_ids: list[str] | None = None, force: bool = False) -> ExportResult:
-    cfg = cfg or config.load_config()
-    result = ExportResult()
 
-    drive_path = config.expand(cfg.get("drive_path", ""))
-    if not drive_path:
-        result.success = False
-        result.message = "drive_path is not configured. Run: granola-sync config set drive_path <path>"
-        return result
-
-    if not os.path.isdir(drive_path):
-        # Auto-create if parent exists (Google Drive is mounted)
-        parent = os.path.dirname(drive_path)
-        if os.path.isdir(parent):
-            os.makedirs(drive_path, exist_ok=True)
+@contextlib.contextmanager
+def _phase(result: ExportResult, name: str, **args):
+    """Add the wall time of the block to ``result.timings[name]`` (and to
+    the trace, with *args*, when tracing)."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        end = time.perf_counter()
+        result.timings[name] = result.timings.get(name, 0.0) + end - start
+        tracing.record(name, start, end, **args)
+
+
+def _timed(fn, *args, **kwargs):
+    start = time.perf_counter()
+    with tracing.span(fn.__name__, cat="api", doc_id=args[0]):
+        value = fn(*args, **kwargs)
+    return value, time.perf_counter() - start
+
+
+def _panels_summary(panels) -> str:
+    """First non-empty Summary panel's HTML."""
+    summary_html = ""
+    for panel in panels:
+        if panel.get("title") == "Summary":
+            summary_html = panel.get("original_content", "")
+            if summary_html:
+                break
+    return summary_html
+
+
+def _cache_summary(cache, doc_id: str) -> str:
+    return _panels_summary(cache.panels.get(doc_id, {}).values())
+
+
+def input_digest(cache, doc_id: str, doc: dict) -> str:
+    """Digest of what the cache holds for a meeting: title, summary, notes,
+    transcript length and last timestamp, attendees. A changed digest means
+    the exported file is stale. API-only data is not included, so checking
+    costs no requests; meetings exported without a summary are checked
+    against the API separately (see _summary_marker), and an API summary
+    that changes after export needs --force."""
+    chunks = cache.transcripts.get(doc_id) or []
+    parts = [
+        doc.get("title", ""),
+        _cache_summary(cache, doc_id),
+        doc.get("notes_markdown", "") or "",
+        len(chunks),
+        chunks[-1].get("start_timestamp", "") if chunks else "",
+        _parse_attendees(cache.meetings_meta.get(doc_id, {})),
+    ]
+    return hashlib.sha256(json.dumps(parts, sort_keys=True).encode()).hexdigest()
+
+
+def _reusable(filename: str, base_name: str, ext: str) -> bool:
+    """Whether a previous export's filename still fits the meeting."""
+    if not filename.endswith(ext):
+        return False
+    stem = filename[:-len(ext)]
+    return stem == base_name or re.fullmatch(re.escape(base_name) + r" \(\d+\)", stem) is not None
+
+
+def _summary_marker(doc_id: str) -> str:
+    """known_empty key for a meeting exported without a summary that the API
+    still had none for; it isn't asked again until the marker expires."""
+    return f"{doc_id}:summary"
+
+
+def _fetch_result(future, doc_id: str, title: str, result: ExportResult, timing: dict):
+    """Wait for an API fallback request; record unexpected failures."""
+    try:
+        with _phase(result, "api_wait", meeting=title):
+            value, seconds = future.result()
+    except Exception as e:
+        result.errors.append(f"{title}: API request failed: {e}")
+        result.failed_ids.append(doc_id)
+        return None
+    timing["api"] = timing.get("api", 0.0) + seconds
+    return value
+
+
+def _builder(fmt: str):
+    module, name = BUILDERS.get(fmt, BUILDERS["docx"])
+    return getattr(importlib.import_module(f".{module}", __package__), name)
+
+
+def _render(targets: list[tuple[str, str, str | None]], meeting_args: dict,
+            trace: bool = False) -> tuple[float, float, dict, dict, list]:
+    """Write one meeting's files atomically, one per (format, path, recorded
+    content digest) in *targets*; a file whose content comes out the same
+    is left untouched. Runs in a worker process when --jobs > 1.
+
+    *meeting_args* are build_meeting's arguments; the meeting is prepared
+    once for all formats. Returns the seconds spent preparing and rendering
+    and checking/flushing/renaming the files, format -> (content digest,
+    whether the file was replaced), format -> error for the formats that
+    failed (the others still land), and the trace events collected when
+    *trace* is set (worker processes).
+    """
+    if trace:
+        tracing.start()
+    render_s = write_s = 0.0
+    contents = {}
+    failed = {}
+    start = time.perf_counter()
+    with tracing.span("prepare", cat="render"):
+        meeting = build_meeting(**meeting_args)
+    for fmt, filepath, previous in targets:
+        builder = _builder(fmt)
+        filename = os.path.basename(filepath)
+        try:
+            with staged_file(filepath, previous) as staged:
+                with tracing.span("build", cat="render", file=filename):
+                    builder(meeting, staged.path)
+                rendered = time.perf_counter()
+        except Exception as e:
+            # The formats that did land are still recorded
+            failed[fmt] = str(e)
+            start = time.perf_counter()
+            continue
+        end = time.perf_counter()
+        tracing.record("write", rendered, end, cat="render", file=filename, replaced=staged.replaced)
+        contents[fmt] = (staged.digest, staged.replaced)
+        render_s += rendered - start
+        write_s += end - rendered
+        start = end
+    return render_s, write_s, contents, failed, tracing.stop() if trace else []
+
+
+def _render_pool(jobs: int):
+    if jobs <= 1:
+        return None
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    # spawn, not fork: the API threads are running when workers start
+    return ProcessPoolExecutor(max_workers=jobs, mp_context=multiprocessing.get_context("spawn"))
+
+
+@contextlib.contextmanager
+def _cancel_on_error(executor):
+    """Run the block with *executor* (or None). If the block raises, Ctrl-C
+    included, queued work is dropped; the executor's own __exit__ would
+    run all of it before the error got out."""
+    if executor is None:
+        yield None
+        return
+    try:
+        yield executor
+    except BaseException:
+        executor.shutdown(wait=False, cancel_futures=True)
+        raise
+    executor.shutdown()
+
+
+class _Recorder:
+    """Records each finished file in the manifest as soon as it lands, so an
+    interrupted run resumes where it stopped."""
+
+    def __init__(self, manifest, result: ExportResult, drive_path: str, formats: list[str],
+                 claimed: set, existing: set):
+        self.manifest = manifest
+        self.result = result
+        self.drive_path = drive_path
+        self.formats = formats
+        self.claimed = claimed
+        self.existing = existing
+        self.renders = deque()
+        self._unsaved = 0
+        self._saved_at = time.monotonic()
+        self._slowest = []
+        self._ranked = 0
+
+    def add(self, doc_id: str, files: dict[str, str], digest: str, summary: str, timing: dict,
+            contents: dict | None = None, failed: dict | None = None, future=None) -> None:
+        """Queue a document's render; *files* maps format -> filename,
+        *summary* is where the summary came from ("cache", "api" or "none")
+        and *contents* and *failed* are _render's results, or come from
+        *future*."""
+        self.renders.append((doc_id, files, digest, summary, timing, contents, failed, future))
+        self.drain()
+
+    def drain(self, wait: bool = False) -> None:
+        """Record finished renders, keeping document order."""
+        while self.renders:
+            doc_id, files, digest, summary, timing, contents, failed, future = self.renders[0]
+            if future is not None and not wait and not future.done():
+                return
+            self.renders.popleft()
+            if future is not None:
+                try:
+                    timing["render"], timing["write"], contents, failed, events = future.result()
+                    tracing.add(events)
+                except Exception as e:
+                    self.result.errors.append(f"{', '.join(files.values())}: {e}")
+                    self.result.failed_ids.append(doc_id)
+                    continue
+            for fmt, error in failed.items():
+                self.result.errors.append(f"{files[fmt]}: {error}")
+            if failed:
+                self.result.failed_ids.append(doc_id)
+            landed = {fmt: filename for fmt, filename in files.items() if fmt in contents}
+            if landed:
+                self._record(doc_id, landed, digest, summary, contents)
+                self._rank(next(iter(landed.values())), timing)
+
+    def _rank(self, filename: str, timing: dict) -> None:
+        """Keep the SLOWEST_DOCS slowest documents."""
+        entry = {"file": filename, **{k: round(v, 4) for k, v in timing.items()},
+                 "seconds": round(sum(timing.values()), 4)}
+        self._ranked += 1
+        item = (entry["seconds"], self._ranked, entry)
+        if len(self._slowest) < SLOWEST_DOCS:
+            heapq.heappush(self._slowest, item)
         else:
-            result.success = False
-            result.message = f"Parent folder not found: {parent}. Is Google Drive running?"
-            return result
+            heapq.heappushpop(self._slowest, item)
+        self.result.slowest = [e for *_, e in sorted(self._slowest, reverse=True)]
+
+    def _record(self, doc_id: str, files: dict[str, str], digest: str, summary: str,
+                contents: dict) -> None:
+        formats = dict(format_entries(self.manifest.get(doc_id)))
+        for fmt, filename in files.items():
+            previous = formats.get(fmt, {}).get("filename", "")
+            if previous and previous != filename and previous not in self.claimed:
+                # Renamed (e.g. the title changed): drop the stale copy
+                with contextlib.suppress(OSError):
+                    os.remove(os.path.join(self.drive_path, previous))
+                    self.existing.discard(previous)
+            formats[fmt] = {"filename": filename, "digest": digest, "content": contents[fmt][0]}
+        # The app shows the file of the first configured format
+        shown = next((formats[f]["filename"] for f in self.formats if f in formats),
+                     next(iter(files.values())))
+        with _phase(self.result, "manifest"):
+            add_entry(self.manifest, doc_id, shown, digest, formats, summary)
+        replaced = [filename for fmt, filename in files.items() if contents[fmt][1]]
+        if replaced:
+            self.result.exported += 1
+            self.result.files.extend(replaced)
+        else:
+            self.result.unchanged += 1
+
+        self._unsaved += 1
+        if self._unsaved >= CHECKPOINT_DOCS or time.monotonic() - self._saved_at >= CHECKPOINT_SECONDS:
+            self.checkpoint()
+
+    def checkpoint(self) -> None:
+        with _phase(self.result, "manifest"):
+            save_manifest(self.manifest, self.manifest.json_path)
+        self._unsaved = 0
+        self._saved_at = time.monotonic()
 
-    # Verify writable
-    test_file = os.path.join(drive_path, ".granola_sync_test")
+
+def run_export(cfg: dict | None = None, doc_ids: list[str] | None = None, force: bool = False,
+               recheck_empty: bool = False, jobs: int | None = None,
+               trace: str | None = None) -> ExportResult:
+    """Export new and changed meetings. With *trace*, a Chrome trace of
+    the run is written to that path."""
+    result = ExportResult()
+    if trace:
+        tracing.start()
+    start = time.perf_counter()
     try:
-        Path(test_file).write_text("sync check")
-        os.remove(test_file)
-    except OSError:
-        result.success = False
-        result.message = "Drive folder is not writable. Is Google Drive running?"
-        return result
+        _export(cfg or config.load_config(), result, doc_ids, force, recheck_empty, jobs)
+    finally:
+        end = time.perf_counter()
+        result.timings["total"] = end - start
+        if trace:
+            tracing.record("export", start, end)
+            tracing.write(trace, tracing.stop())
+    return result
+
+
+def _export(cfg: dict, result: ExportResult, doc_ids: list[str] | None, force: bool,
+            recheck_empty: bool, jobs: int | None) -> None:
+    """run_export's body; fills in *result*. Phases: setup (Drive checks),
+    cache (copy and scan), auth, plan (decode sections, compare digests),
+    api_wait, render, write (flush and rename) and manifest."""
+    with _phase(result, "setup"):
+        drive_path = config.expand(cfg.get("drive_path", ""))
+        if not drive_path:
+            result.success = False
+            result.message = "drive_path is not configured. Run: granola-sync config set drive_path <path>"
+            return
+
+        if not os.path.isdir(drive_path):
+            # Auto-create if parent exists (Google Drive is mounted)
+            parent = os.path.dirname(drive_path)
+            if os.path.isdir(parent):
+                os.makedirs(drive_path, exist_ok=True)
+            else:
+                result.success = False
+                result.message = f"Parent folder not found: {parent}. Is Google Drive running?"
+                return
+
+        # Verify writable
+        test_file = os.path.join(drive_path, ".granola_sync_test")
+        try:
+            Path(test_file).write_text("sync check")
+            os.remove(test_file)
+        except OSError:
+            result.success = False
+            result.message = "Drive folder is not writable. Is Google Drive running?"
+            return
+
+        # The folder is listed once per run; filename collisions are resolved
+        # against this set, which is kept current as files are written
+        existing = set(os.listdir(drive_path))
+
+        # Files left half-written by an interrupted run (not one still going)
+        for name in [n for n in existing if n.endswith(PARTIAL_SUFFIX)]:
+            path = os.path.join(drive_path, name)
+            with contextlib.suppress(OSError):
+                if time.time() - os.path.getmtime(path) > 3600:
+                    os.remove(path)
+                    existing.discard(name)
 
     # Load cache
-    try:
-        cache = load_cache(config.expand(cfg.get("granola_cache_path", "")))
-    except (FileNotFoundError, json.JSONDecodeError, KeyError) as e:
-        result.success = False
-        result.message = f"Failed to read Granola cache: {e}"
-        return result
+    with _phase(result, "cache"):
+        try:
+            cache = load_cache(config.expand(cfg.get("granola_cache_path", "")))
+            documents = cache.documents
+        except (FileNotFoundError, json.JSONDecodeError, KeyError) as e:
+            result.success = False
+            result.message = f"Failed to read Granola cache: {e}"
+            return
 
-    if not cache.documents:
+    if not documents:
         result.message = "No meetings found in Granola cache."
-        return result
+        return
 
     # Auth token for API fallback
-    token = get_access_token(config.expand(cfg.get("granola_auth_path", "")))
+    with _phase(result, "auth"):
+        token = get_access_token(config.expand(cfg.get("granola_auth_path", "")))
 
-    manifest = load_manifest(config.expand(cfg.get("manifest_path", "")))
+    with _phase(result, "plan"):
+        manifest = load_manifest(config.expand(cfg.get("manifest_path", "")))
 
-    docs_to_export = cache.documents.items()
-    if doc_ids:
-        docs_to_export = [(did, cache.documents[did]) for did in doc_ids if did in cache.documents]
+    # Closed however the run ends, so a failed export doesn't leave the
+    # database open in the daemon
+    with contextlib.closing(manifest):
+        with _phase(result, "plan"):
+            docs_to_export = documents.items()
+            if doc_ids:
+                docs_to_export = [(did, documents[did]) for did in doc_ids if did in documents]
 
-    for doc_id, doc in docs_to_export:
-        if doc_id in manifest and not force:
-            result.skipped += 1
-            continue
+            # Each format of an already-exported meeting is rendered again only
+            # if the meeting's inputs changed; a newly added format is backfilled
+            formats = config.export_formats(cfg)
+            pending = []
+            digests = {}
+            # Exported while the API had no summary yet: the API is asked
+            # again, and the files re-rendered if it has one now
+            rechecks = set()
+            for doc_id, doc in docs_to_export:
+                digests[doc_id] = input_digest(cache, doc_id, doc)
+                entry = manifest.get(doc_id)
+                if entry and not force and "digest" not in entry:
+                    # Exported before digests existed: trust the file as is
+                    entry["digest"] = digests[doc_id]
+                    manifest[doc_id] = entry
+                done = {} if force else format_entries(entry)
+                todo = [f for f in formats if done.get(f, {}).get("digest") != digests[doc_id]]
+                if not todo and token and entry.get("summary") == "none" \
+                        and not _cache_summary(cache, doc_id):
+                    todo = formats
+                    rechecks.add(doc_id)
+                if not todo:
+                    result.skipped += 1
+                    continue
+                pending.append((doc_id, doc, todo))
 
-        title = doc.get("title", "Untitled Meeting")
-        created_at = doc.get("created_at", "")
+        api_url = cfg.get("api_url")
+        coalesce_seconds = float(cfg.get("transcript_coalesce_seconds") or 0)
+        use_cache = bool(cfg.get("api_cache_enabled", True))
+        jobs = max(1, int(jobs or cfg.get("export_jobs", 1)))
 
-        try:
-            dt = datetime.fromisoformat(created_at.replace("Z", "+00:00"))
-            date_prefix = dt.strftime("%Y-%m-%d")
-        except (ValueError, AttributeError):
-            date_prefix = "unknown-date"
-
-        export_format = cfg.get("export_format", "docx")
-        ext = {"docx": ".docx", "md": ".md", "txt": ".txt"}.get(export_format, ".docx")
-        base_name = f"{date_prefix} - {safe_filename(title)}"
-        filename = unique_filename(drive_path, base_name, ext)
-
-        # Summary from panels — cache (v3) or API fallback (v4+)
-        summary_html = ""
-        doc_panels = cache.panels.get(doc_id, {})
-        for panel_id, panel in doc_panels.items():
-            if panel.get("title") == "Summary":
-                summary_html = panel.get("original_content", "")
-                if summary_html:
-                    break
-        if not summary_html and token:
-            api_panels = fetch_panels(doc_id, token, cfg.get("api_url"))
-            if api_panels:
-                for panel in api_panels:
-                    if panel.get("title") == "Summary":
-                        summary_html = panel.get("original_content", "")
-                        if summary_html:
-                            break
-
-        # Transcript: local cache first, API fallback second
-        transcript_chunks = cache.transcripts.get(doc_id, [])
-        if not transcript_chunks and token:
-            api_chunks = fetch_transcript(doc_id, token, cfg.get("api_url"))
-            if api_chunks:
-                transcript_chunks = api_chunks
-                result.api_fetched += 1
-
-        notes_md = doc.get("notes_markdown", "") or ""
-
-        # Attendees
-        meta = cache.meetings_meta.get(doc_id, {})
-        attendees = []
-        creator = meta.get("creator", {})
-        if creator:
-            person = creator.get("details", {}).get("person", {})
-            name = person.get("name", {}).get("fullName", creator.get("name", ""))
-            if name:
-                attendees.append({"name": name, "email": creator.get("email", "")})
-        for att in meta.get("attendees", []):
-            person = att.get("details", {}).get("person", {})
-            name = person.get("name", {}).get("fullName", att.get("email", "Unknown"))
-            attendees.append({"name": name, "email": att.get("email", "")})
-
-        # Skip if truly empty
-        if not summary_html and not transcript_chunks and not notes_md:
-            result.skipped += 1
-            continue
+        # Docs the API recently had nothing for aren't asked again until the
+        # marker expires (or --recheck-empty), whether or not responses are
+        # cached
+        store = response_cache(cfg) if token and pending else None
+        marked_empty = store.known_empty(doc_id for doc_id, *_ in pending) if store else set()
+        if store and rechecks and not recheck_empty:
+            quiet = store.known_empty(map(_summary_marker, rechecks))
+            asked = {doc_id for doc_id in rechecks if _summary_marker(doc_id) in quiet}
+            pending = [p for p in pending if p[0] not in asked]
+            result.skipped += len(asked)
 
-        filepath = os.path.join(drive_path, filename)
-        builder_args = dict(
-            filepath=filepath,
-            title=title,
-            date_str=created_at,
-            attendees=attendees,
-            summary_html=summary_html,
-            transcript_chunks=transcript_chunks,
-            notes_markdown=notes_md,
-        )
-        try:
-            if export_format == "md":
-                create_meeting_md(**builder_args)
-            elif export_format == "txt":
-                create_meeting_txt(**builder_args)
-            else:
-                create_meeting_docx(**builder_args)
-            add_entry(manifest, doc_id, filename)
-            result.exported += 1
-            result.files.append(filename)
-        except Exception as e:
-            result.errors.append(f"{filename}: {e}")
+        # API fallback runs on a bounded pool while the loop below renders;
+        # each document waits only for its own requests. With jobs > 1 the
+        # files are written by worker processes; the manifest and result are
+        # only updated here, in order.
+        claimed = set()
+        recorder = _Recorder(manifest, result, drive_path, formats, claimed, existing)
+        with _cancel_on_error(ThreadPoolExecutor(max_workers=max(1, int(cfg.get("api_workers", 8))))) as pool, \
+                _cancel_on_error(_render_pool(jobs)) as render_pool:
+            # Requests are submitted at most two per worker ahead of the
+            # document being rendered, and dropped once used, so only that
+            # many responses are held at a time
+            window = max(1, int(cfg.get("api_workers", 8))) * 2
+            fetches = {}
+            submitted = 0
+            for position, (doc_id, doc, todo) in enumerate(pending):
+                for ahead_id, ahead_doc, _ in pending[submitted:position + window] if token else ():
+                    if ahead_id in marked_empty and not recheck_empty:
+                        continue
+                    created_at = ahead_doc.get("created_at")
+                    if not _cache_summary(cache, ahead_id):
+                        fetches[ahead_id, "panels"] = pool.submit(
+                            _timed, fetch_panels, ahead_id, token, api_url,
+                            created_at=created_at, use_cache=use_cache, cfg=cfg)
+                    if not cache.transcripts.get(ahead_id):
+                        fetches[ahead_id, "transcript"] = pool.submit(
+                            _timed, fetch_transcript, ahead_id, token, api_url,
+                            created_at=created_at, use_cache=use_cache, cfg=cfg)
+                submitted = max(submitted, position + window)
+
+                title = doc.get("title", "Untitled Meeting")
+                created_at = doc.get("created_at", "")
+                panels_fetch = fetches.pop((doc_id, "panels"), None)
+                transcript_fetch = fetches.pop((doc_id, "transcript"), None)
 
-    save_manifest(manifest, config.expand(cfg.get("manifest_path", "")))
+                # Did every API request for this doc get an answer?
+                api_answered = None
+                timing = {}
+
+                # Summary from panels — cache (v3) or API fallback (v4+)
+                summary_html = _cache_summary(cache, doc_id)
+                summary = "cache" if summary_html else "none"
+                if panels_fetch is not None:
+                    api_panels = _fetch_result(panels_fetch, doc_id, title, result, timing)
+                    summary_html = _panels_summary(api_panels or [])
+                    api_answered = api_panels is not None
+                    if summary_html:
+                        summary = "api"
+                    elif store and api_answered and doc_id in rechecks:
+                        store.mark_empty(_summary_marker(doc_id), empty_ttl_for(created_at))
+                if doc_id in rechecks and not summary_html:
+                    # Still no summary: the files on Drive are current
+                    result.skipped += 1
+                    continue
+
+                # Transcript: local cache first, API fallback second
+                transcript_chunks = cache.transcripts.get(doc_id, [])
+                if transcript_fetch is not None:
+                    api_chunks = _fetch_result(transcript_fetch, doc_id, title, result, timing)
+                    if api_chunks:
+                        transcript_chunks = api_chunks
+                        result.api_fetched += 1
+                    api_answered = api_answered is not False and api_chunks is not None
+
+                notes_md = doc.get("notes_markdown", "") or ""
+                attendees = _parse_attendees(cache.meetings_meta.get(doc_id, {}))
+
+                # Skip if truly empty
+                if not summary_html and not transcript_chunks and not notes_md:
+                    if store and api_answered:
+                        store.mark_empty(doc_id, empty_ttl_for(created_at))
+                    result.skipped += 1
+                    continue
+                if store and doc_id in marked_empty and api_answered:
+                    store.clear_empty(doc_id)
+
+                try:
+                    dt = datetime.fromisoformat(created_at.replace("Z", "+00:00"))
+                    date_prefix = dt.strftime("%Y-%m-%d")
+                except (ValueError, AttributeError):
+                    date_prefix = "unknown-date"
+
+                base_name = f"{date_prefix} - {safe_filename(title)}"
+                done = format_entries(manifest.get(doc_id))
+                files = {}
+                targets = []
+                for fmt in todo:
+                    ext = f".{fmt}"
+                    previous = done.get(fmt, {})
+                    content = None
+                    if _reusable(previous.get("filename", ""), base_name, ext) and previous["filename"] not in claimed:
+                        filename = previous["filename"]
+                        # Identical output leaves the file as it is (see staged_file)
+                        content = previous.get("content")
+                    else:
+                        filename = unique_filename(drive_path, base_name, ext, existing)
+                    claimed.add(filename)
+                    existing.add(filename)
+                    files[fmt] = filename
+                    targets.append((fmt, os.path.join(drive_path, filename), content))
+                meeting_args = dict(
+                    title=title,
+                    date_str=created_at,
+                    attendees=attendees,
+                    summary_html=summary_html,
+                    transcript_chunks=transcript_chunks,
+                    notes_markdown=notes_md,
+                    coalesce_seconds=coalesce_seconds,
+                )
+                if render_pool is None:
+                    try:
+                        timing["render"], timing["write"], contents, failed, _ = _render(targets, meeting_args)
+                    except Exception as e:
+                        result.errors.append(f"{', '.join(files.values())}: {e}")
+                        result.failed_ids.append(doc_id)
+                        continue
+                    for name in ("render", "write"):
+                        result.timings[name] = result.timings.get(name, 0.0) + timing[name]
+                    recorder.add(doc_id, files, digests[doc_id], summary, timing, contents, failed)
+                else:
+                    recorder.add(doc_id, files, digests[doc_id], summary, timing,
+                                 future=render_pool.submit(_render, targets, meeting_args, tracing.enabled()))
+
+            # Worker time overlaps; what the run pays is the wait for the rest
+            with _phase(result, "render"):
+                recorder.drain(wait=True)
+
+        recorder.checkpoint()
 
     if result.errors:
         result.success = False
@@ -188,6 +609,8 @@ def run_export(cfg: dict | None = None, doc_ids: list[str] | None = None, force:
         result.message = f"Exported {result.exported} new meeting(s)"
     else:
         result.message = "Nothing new to export"
+    if result.unchanged:
+        result.message += f" ({result.unchanged} re-rendered unchanged)"
 
     # Notify
     if cfg.get("notifications_enabled", True):
@@ -195,5 +618,3 @@ def run_export(cfg: dict | None = None, doc_ids: list[str] | None = None, force:
             notify("Granola Sync", f"Exported {result.exported} with {len(result.errors)} error(s)")
         elif result.exported > 0:
             notify("Granola Sync", f"Exported {result.exported} new meeting(s) to Google Drive")
-
-    return result
@@ -1,20 +1,64 @@
-"""Parse Granola's HTML summaries into structured elements for docx generation."""
+"""Parse Granola's HTML summaries into structured elements for docx generation.
+
+``parse_html_to_elements`` parses with lxml (libxml2) and replays the
+tree as start/data/end events into ``HTMLToDocxElements``, so both paths
+share one set of rules. Feeding ``HTMLToDocxElements`` directly runs the
+same rules on the stdlib tokenizer; the tests compare the two. They can
+only differ on misnested markup that libxml2 repairs (an unclosed <p>
+inside a <div>), which Granola's editor doesn't produce.
+
+Elements carry plain text. ``parse_html_to_blocks`` also returns each
+element's bold/italic runs, for formats that can show them.
+"""
 
 from html.parser import HTMLParser
 
+from lxml import etree
+
+HEADINGS = ("h1", "h2", "h3", "h4", "h5")
+BOLD = ("strong", "b")
+ITALIC = ("em", "i")
+
+
+def _runs(pieces: list[str], marks: list[tuple[bool, bool]]) -> tuple:
+    """(text, bold, italic) runs for one element, trimmed like its text."""
+    runs = []
+    for text, (bold, italic) in zip(pieces, marks):
+        if runs and runs[-1][1:] == (bold, italic):
+            runs[-1] = (runs[-1][0] + text, bold, italic)
+        else:
+            runs.append((text, bold, italic))
+    while runs and not runs[0][0].strip():
+        runs.pop(0)
+    while runs and not runs[-1][0].strip():
+        runs.pop()
+    if runs:
+        runs[0] = (runs[0][0].lstrip(), *runs[0][1:])
+        runs[-1] = (runs[-1][0].rstrip(), *runs[-1][1:])
+    return tuple(runs)
+
 
 class HTMLToDocxElements(HTMLParser):
     """Parse Granola's HTML summary into structured elements for docx."""
 
     def __init__(self):
         super().__init__()
-        self.elements: list[tuple[str, str, int]] = []
+        # (type, text, depth, runs); runs is empty unless there is emphasis
+        self.blocks: list[tuple[str, str, int, tuple]] = []
         self._list_depth = 0
-        self._current_text = ""
+        self._text: list[str] = []
+        self._marks: list[tuple[bool, bool]] = []  # (bold, italic) of each _text piece
+        self._bold = self._italic = 0
+        self._mark = (False, False)
+        self._emphasis = False  # any emphasis in the element being collected
         self._current_tag: str | None = None
 
+    @property
+    def elements(self) -> list[tuple[str, str, int]]:
+        return [block[:3] for block in self.blocks]
+
     def handle_starttag(self, tag, attrs):
-        if tag in ("h1", "h2", "h3", "h4", "h5"):
+        if tag in HEADINGS:
             self._flush()
             self._current_tag = tag
         elif tag == "ul":
@@ -24,13 +68,21 @@ class HTMLToDocxElements(HTMLParser):
             self._flush()
             self._current_tag = "li"
         elif tag == "p":
-            self._flush()
-            self._current_tag = "p"
+            # <li><p>text</p></li> (how Granola writes lists) is still a bullet
+            if self._current_tag != "li" or "".join(self._text).strip():
+                self._flush()
+                self._current_tag = "p"
         elif tag == "br":
-            self._current_text += "\n"
+            self.handle_data("\n")
+        elif tag in BOLD:
+            self._bold += 1
+            self._set_mark()
+        elif tag in ITALIC:
+            self._italic += 1
+            self._set_mark()
 
     def handle_endtag(self, tag):
-        if tag in ("h1", "h2", "h3", "h4", "h5"):
+        if tag in HEADINGS:
             self._flush()
         elif tag == "ul":
             self._flush()
@@ -39,32 +91,70 @@ class HTMLToDocxElements(HTMLParser):
             self._flush()
         elif tag == "p":
             self._flush()
+        elif tag in BOLD:
+            self._bold = max(0, self._bold - 1)
+            self._set_mark()
+        elif tag in ITALIC:
+            self._italic = max(0, self._italic - 1)
+            self._set_mark()
 
     def handle_data(self, data):
-        self._current_text += data
+        self._text.append(data)
+        self._marks.append(self._mark)
+
+    def _set_mark(self):
+        self._mark = (self._bold > 0, self._italic > 0)
+        self._emphasis = self._emphasis or self._mark != (False, False)
 
     def _flush(self):
-        text = self._current_text.strip()
-        if not text:
-            self._current_text = ""
-            self._current_tag = None
+        text = "".join(self._text).strip()
+        runs = _runs(self._text, self._marks) if self._emphasis else ()
+        self._text.clear()
+        self._marks.clear()
+        self._emphasis = self._mark != (False, False)
+        tag, self._current_tag = self._current_tag, None
+        if not text or text.startswith("Chat with meeting transcript"):
             return
-        if text.startswith("Chat with meeting transcript"):
-            self._current_text = ""
-            self._current_tag = None
-            return
-        if self._current_tag in ("h1", "h2", "h3", "h4", "h5"):
-            self.elements.append(("heading", text, int(self._current_tag[1])))
-        elif self._current_tag == "li":
-            self.elements.append(("bullet", text, self._list_depth))
+        if tag in HEADINGS:
+            self.blocks.append(("heading", text, int(tag[1]), runs))
+        elif tag == "li":
+            self.blocks.append(("bullet", text, self._list_depth, runs))
         else:
-            self.elements.append(("paragraph", text, 0))
-        self._current_text = ""
-        self._current_tag = None
+            self.blocks.append(("paragraph", text, 0, runs))
 
 
-def parse_html_to_elements(html_str: str) -> list[tuple[str, str, int]]:
+# Tags that change state; the rest only contribute their text
+_HANDLED = frozenset(HEADINGS + BOLD + ITALIC + ("ul", "li", "p", "br"))
+
+
+def _replay(root, parser: HTMLToDocxElements) -> None:
+    text, marks = parser._text, parser._marks
+    for event, el in etree.iterwalk(root, events=("start", "end", "comment", "pi")):
+        tag = el.tag
+        if event == "start":
+            if tag in _HANDLED:
+                parser.handle_starttag(tag, ())
+            if el.text:
+                text.append(el.text)
+                marks.append(parser._mark)
+        else:  # end, or a comment/PI whose tail is text
+            if tag in _HANDLED:
+                parser.handle_endtag(tag)
+            if el.tail:
+                text.append(el.tail)
+                marks.append(parser._mark)
+
+
+def parse_html_to_blocks(html_str: str) -> list[tuple[str, str, int, tuple]]:
+    """Elements with their (text, bold, italic) runs as a fourth item."""
     parser = HTMLToDocxElements()
-    parser.feed(html_str)
+    if html_str.strip():
+        root = etree.fromstring(html_str, etree.HTMLParser())
+        if root is not None:
+            _replay(root, parser)
     parser._flush()
-    return parser.elements
+    return parser.blocks
+
+
+def parse_html_to_elements(html_str: str) -> list[tuple[str, str, int]]:
+    return [block[:3] for block in parse_html_to_blocks(html_str)]
@@ -0,0 +1,288 @@
+"""Persistent meeting index — list/stats/status/show without reparsing the cache.
+
+The index is a small SQLite database next to the manifest holding one
+summary row per document. It remembers which cache file it was built
+from (path, size, mtime); while that file is unchanged every query is
+answered from the index alone. When the cache changes, each document is
+fingerprinted from its raw JSON and only new or changed documents are
+decoded and re-summarised.
+
+For v4 caches it also records where each document's entries sit in the
+file, so ``show`` can seek to and decode just those byte ranges.
+"""
+
+import contextlib
+import hashlib
+import json
+import os
+import sqlite3
+
+from . import config
+from .cache import (
+    SECTIONS, get_meeting_detail as _detail_from_cache, load_cache, meeting_detail,
+    meeting_summary, resolve_cache_path, with_export_status,
+)
+
+SCHEMA_VERSION = 2
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS source (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    path TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    direct INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS meetings (
+    doc_id TEXT PRIMARY KEY,
+    fingerprint TEXT NOT NULL,
+    title TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    attendees TEXT NOT NULL,
+    duration_seconds INTEGER,
+    has_transcript INTEGER NOT NULL,
+    has_summary INTEGER NOT NULL,
+    has_notes INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS meetings_created_at ON meetings (created_at);
+CREATE TABLE IF NOT EXISTS entries (
+    doc_id TEXT NOT NULL,
+    section TEXT NOT NULL,
+    start INTEGER NOT NULL,
+    length INTEGER NOT NULL,
+    digest TEXT NOT NULL,
+    PRIMARY KEY (doc_id, section)
+);
+"""
+
+_COLUMNS = ("doc_id", "title", "created_at", "attendees", "duration_seconds",
+            "has_transcript", "has_summary", "has_notes")
+
+
+def _connect(path: str) -> sqlite3.Connection:
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    conn = sqlite3.connect(path, timeout=30, isolation_level=None)
+    conn.execute("PRAGMA journal_mode=WAL")
+    if conn.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+        conn.executescript(
+            "DROP TABLE IF EXISTS source; DROP TABLE IF EXISTS meetings; DROP TABLE IF EXISTS entries;"
+        )
+        conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def _fingerprints(cache) -> tuple[dict, dict, list]:
+    """Hash every document's entries across all sections.
+
+    Returns ``(fingerprints, raw, offsets)`` where *raw* maps section ->
+    doc_id -> undecoded JSON, so changed documents can be decoded one by
+    one, and *offsets* holds ``entries`` rows for byte-range lookups.
+    """
+    raw = {key: {} for key in SECTIONS}
+    offsets = []
+    digests = {}
+    for key in SECTIONS:
+        for doc_id, value, start in cache.raw_entries(key):
+            raw[key][doc_id] = value
+            digest = hashlib.sha1(value).hexdigest()
+            digests[doc_id, key] = digest
+            if start is not None and doc_id in raw["documents"]:
+                offsets.append((doc_id, key, start, len(value), digest))
+
+    fingerprints = {}
+    for doc_id in raw["documents"]:
+        h = hashlib.sha1()
+        for key in SECTIONS:
+            h.update(f"{key}:{digests.get((doc_id, key), '')};".encode())
+        fingerprints[doc_id] = h.hexdigest()
+    return fingerprints, raw, offsets
+
+
+def _decode(raw: dict, key: str, doc_id: str, default):
+    value = raw[key].get(doc_id)
+    return json.loads(str(value, "utf-8")) if value is not None else default
+
+
+class MeetingIndex:
+    """SQLite-backed meeting summaries, kept in step with the cache file."""
+
+    def __init__(self, index_path: str, cache_path: str | None = None):
+        self.index_path = index_path
+        self.cache_path = cache_path
+        try:
+            self.conn = _connect(index_path)
+        except sqlite3.DatabaseError:
+            # Corrupt or foreign file: it's only a cache, start over
+            os.remove(index_path)
+            self.conn = _connect(index_path)
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def refresh(self) -> list[str]:
+        """Bring the index up to date; return ids of new or changed documents."""
+        path = resolve_cache_path(self.cache_path)
+        st = os.stat(path)
+        identity = (path, st.st_size, st.st_mtime_ns)
+        if self._identity() == identity:
+            return []
+
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            # Another process may have refreshed while we waited for the lock
+            if self._identity() == identity:
+                self.conn.execute("COMMIT")
+                return []
+            cache = load_cache(path, offsets=True)
+            changed = self._rebuild(cache)
+            self.conn.execute(
+                "INSERT OR REPLACE INTO source (id, path, size, mtime_ns, direct) VALUES (1, ?, ?, ?, ?)",
+                (*identity, cache.is_direct),
+            )
+            self.conn.execute("COMMIT")
+        except BaseException:
+            self.conn.execute("ROLLBACK")
+            raise
+        return changed
+
+    def _identity(self) -> tuple | None:
+        row = self.conn.execute("SELECT path, size, mtime_ns FROM source WHERE id = 1").fetchone()
+        return tuple(row) if row else None
+
+    def _rebuild(self, cache) -> list[str]:
+        fingerprints, raw, offsets = _fingerprints(cache)
+        stored = dict(self.conn.execute("SELECT doc_id, fingerprint FROM meetings"))
+
+        # Any edit shifts the offsets of everything after it
+        self.conn.execute("DELETE FROM entries")
+        self.conn.executemany("INSERT INTO entries VALUES (?, ?, ?, ?, ?)", offsets)
+
+        removed = [(doc_id,) for doc_id in stored if doc_id not in fingerprints]
+        self.conn.executemany("DELETE FROM meetings WHERE doc_id = ?", removed)
+
+        changed = [d for d, fp in fingerprints.items() if stored.get(d) != fp]
+        for doc_id in changed:
+            m = meeting_summary(
+                doc_id,
+                _decode(raw, "documents", doc_id, {}),
+                _decode(raw, "transcripts", doc_id, []),
+                _decode(raw, "documentPanels", doc_id, {}),
+                _decode(raw, "meetingsMetadata", doc_id, {}),
+            )
+            self.conn.execute(
+                "INSERT OR REPLACE INTO meetings VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (doc_id, fingerprints[doc_id], m["title"], m["created_at"],
+                 json.dumps(m["attendees"]), m["duration_seconds"],
+                 m["has_transcript"], m["has_summary"], m["has_notes"]),
+            )
+        return changed
+
+    def summaries(self) -> list[dict]:
+        rows = self.conn.execute(f"SELECT {', '.join(_COLUMNS)} FROM meetings")
+        meetings = []
+        for row in rows:
+            m = dict(zip(_COLUMNS, row))
+            m["attendees"] = json.loads(m["attendees"])
+            for key in ("has_transcript", "has_summary", "has_notes"):
+                m[key] = bool(m[key])
+            meetings.append(m)
+        return meetings
+
+    def count(self) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM meetings").fetchone()[0]
+
+    def fingerprints(self) -> dict[str, str]:
+        return dict(self.conn.execute("SELECT doc_id, fingerprint FROM meetings"))
+
+    def read_entries(self, doc_id: str) -> dict | None:
+        """Decode one document's entries straight from the cache file.
+
+        Returns section -> value (empty if the cache has no such document),
+        or None when offsets can't be trusted: a v3 cache, or the bytes on
+        disk no longer match what was indexed.
+        """
+        row = self.conn.execute("SELECT path, size, mtime_ns, direct FROM source WHERE id = 1").fetchone()
+        if not row or not row[3]:
+            return None
+        path, size, mtime_ns, _ = row
+        rows = self.conn.execute(
+            "SELECT section, start, length, digest FROM entries WHERE doc_id = ?", (doc_id,)
+        ).fetchall()
+        entries = {}
+        try:
+            with open(path, "rb") as f:
+                st = os.fstat(f.fileno())
+                if (st.st_size, st.st_mtime_ns) != (size, mtime_ns):
+                    return None
+                for section, start, length, digest in rows:
+                    f.seek(start)
+                    value = f.read(length)
+                    if hashlib.sha1(value).hexdigest() != digest:
+                        return None
+                    entries[section] = json.loads(value)
+        except (OSError, ValueError):
+            return None
+        return entries
+
+
+def open_index(cfg: dict | None = None) -> MeetingIndex:
+    """Open the configured index and refresh it against the cache."""
+    cfg = cfg or config.load_config()
+    index = MeetingIndex(
+        config.expand(cfg.get("index_path", "")),
+        config.expand(cfg.get("granola_cache_path", "")),
+    )
+    index.refresh()
+    return index
+
+
+@contextlib.contextmanager
+def _using(cfg: dict | None, index: MeetingIndex | None):
+    """Refresh and use *index* if given, else open (and close) the configured one."""
+    if index is not None:
+        index.refresh()
+        yield index
+        return
+    index = open_index(cfg)
+    try:
+        yield index
+    finally:
+        index.close()
+
+
+def list_meetings(cfg: dict | None = None, manifest: dict | None = None,
+                  index: MeetingIndex | None = None) -> list[dict]:
+    """Same result as ``cache.list_meetings``, answered from the index."""
+    with _using(cfg, index) as index:
+        return with_export_status(index.summaries(), manifest)
+
+
+def get_meeting_detail(cfg: dict | None, doc_id: str, manifest: dict | None = None,
+                       index: MeetingIndex | None = None) -> dict | None:
+    """Same result as ``cache.get_meeting_detail``, reading only *doc_id*'s bytes.
+
+    Falls back to loading the cache when there are no usable offsets
+    (v3 cache, unknown doc, or the file changed underneath us).
+    """
+    cfg = cfg or config.load_config()
+    with _using(cfg, index) as index:
+        entries = index.read_entries(doc_id)
+    if entries is None:
+        cache = load_cache(config.expand(cfg.get("granola_cache_path", "")))
+        return _detail_from_cache(cache, doc_id, manifest)
+    if not entries.get("documents"):
+        return None
+    return meeting_detail(
+        doc_id,
+        entries["documents"],
+        entries.get("transcripts", []),
+        entries.get("documentPanels", {}),
+        entries.get("meetingsMetadata", {}),
+        manifest,
+    )
+
+
+def document_count(cfg: dict | None = None, index: MeetingIndex | None = None) -> int:
+    with _using(cfg, index) as index:
+        return index.count()
@@ -0,0 +1,177 @@
+"""Locate values inside large JSON files without parsing them.
+
+The scanner works on any bytes-like buffer (usually an mmap) and only
+ever materialises the pieces a caller asks for. Skipping a value costs
+one regex match per bracket, so the huge string-heavy sections of the
+Granola cache are stepped over without building Python objects.
+"""
+
+import json
+import mmap
+import re
+
+_WS = re.compile(rb"[ \t\n\r]*")
+_STRING_PAT = rb'"[^"\\]*+(?:\\.[^"\\]*+)*+"'
+_STRING = re.compile(_STRING_PAT, re.DOTALL)
+_SCALAR = re.compile(rb"[^,}\]\s]+")
+
+
+def _nested(depth: int) -> bytes:
+    """Pattern for a bracketed value nested at most *depth* levels deep."""
+    inner = rb'[^"{}\[\]]++|' + _STRING_PAT
+    for _ in range(depth):
+        inner = rb'[^"{}\[\]]++|' + _STRING_PAT + rb"|[\[{](?:" + inner + rb")*+[\]}]"
+    return inner
+
+
+# Everything up to the next structural bracket, stepping over whole
+# strings and any containers up to three levels deep in one C-level match
+_FLAT = re.compile(rb"(?:" + _nested(3) + rb")*+", re.DOTALL)
+_HIGH_SURROGATE = re.compile(rb"\\u[dD][89abAB][0-9a-fA-F]{2}")
+
+_OPEN = frozenset(b"{[")
+_CLOSE = frozenset(b"}]")
+
+# Pages behind the cursor are handed back to the OS once this much
+# has been scanned, so peak RSS doesn't grow with the file size.
+RELEASE_EVERY = 8 * 1024 * 1024
+
+
+def _error(msg: str, pos: int) -> json.JSONDecodeError:
+    return json.JSONDecodeError(msg, "", pos)
+
+
+class Scanner:
+    """Walks a JSON buffer, yielding byte ranges instead of objects."""
+
+    def __init__(self, buf):
+        self.buf = buf
+        self._released = 0
+
+    def ws(self, pos: int) -> int:
+        return _WS.match(self.buf, pos).end()
+
+    def expect(self, pos: int, char: bytes) -> int:
+        pos = self.ws(pos)
+        if self.buf[pos:pos + 1] != char:
+            raise _error(f"Expecting {char.decode()!r}", pos)
+        return pos + 1
+
+    def skip_value(self, pos: int) -> int:
+        """Return the offset just past the value starting at *pos*."""
+        buf = self.buf
+        first = buf[pos:pos + 1]
+        if first == b'"':
+            m = _STRING.match(buf, pos)
+            if not m:
+                raise _error("Unterminated string", pos)
+            self.release(m.end())
+            return m.end()
+        if first and first[0] in _OPEN:
+            depth = 0
+            while True:
+                c = buf[pos:pos + 1]
+                if not c:
+                    raise _error("Unterminated container", pos)
+                if c[0] in _OPEN:
+                    depth += 1
+                elif c[0] in _CLOSE:
+                    depth -= 1
+                    if depth == 0:
+                        self.release(pos + 1)
+                        return pos + 1
+                else:
+                    raise _error("Unterminated string", pos)
+                pos = _FLAT.match(buf, pos + 1).end()
+                if pos - self._released >= RELEASE_EVERY:
+                    self.release(pos)
+        m = _SCALAR.match(buf, pos)
+        if not m:
+            raise _error("Expecting value", pos)
+        return m.end()
+
+    def iter_object(self, pos: int, stop_at: str | None = None):
+        """Yield ``(key, value_start, value_end)`` for the object at *pos*.
+
+        If *stop_at* is seen, its value is not skipped: it is yielded with
+        ``value_end`` of None and iteration ends there.
+        """
+        buf = self.buf
+        pos = self.expect(pos, b"{")
+        pos = self.ws(pos)
+        if buf[pos:pos + 1] == b"}":
+            return
+        while True:
+            m = _STRING.match(buf, pos)
+            if not m:
+                raise _error("Expecting property name", pos)
+            key = json.loads(buf[m.start():m.end()])
+            start = self.ws(self.expect(m.end(), b":"))
+            if key == stop_at:
+                yield key, start, None
+                return
+            end = self.skip_value(start)
+            yield key, start, end
+            pos = self.ws(end)
+            c = buf[pos:pos + 1]
+            if c == b"}":
+                return
+            if c != b",":
+                raise _error("Expecting ',' delimiter", pos)
+            pos = self.ws(pos + 1)
+
+    def find_key(self, pos: int, key: str) -> int:
+        """Return where the value of *key* starts in the object at *pos*."""
+        for _, start, end in self.iter_object(pos, stop_at=key):
+            if end is None:
+                return start
+        raise KeyError(key)
+
+    def release(self, upto: int) -> None:
+        """Hand back the mapped pages before *upto* once enough have piled up."""
+        if upto - self._released >= RELEASE_EVERY:
+            self._released = release_pages(self.buf, self._released, upto)
+
+
+def release_pages(buf, start: int, end: int) -> int:
+    """Tell the OS the mapped pages within ``[start, end)`` can be dropped.
+
+    Returns the page-aligned offset released up to. A no-op for plain
+    bytes or where madvise isn't available.
+    """
+    advise = getattr(buf, "madvise", None)
+    dontneed = getattr(mmap, "MADV_DONTNEED", None)
+    start -= start % mmap.PAGESIZE
+    end -= end % mmap.PAGESIZE
+    if advise is None or dontneed is None or end <= start:
+        return max(start, end)
+    advise(dontneed, start, end - start)
+    return end
+
+
+def unescape_string(buf, start: int, end: int, out, chunk_size: int = 4 * 1024 * 1024) -> None:
+    """Decode the JSON string literal at ``buf[start:end]`` into *out* as UTF-8.
+
+    Works in chunks so a string-encoded document (Granola's v3 cache) can
+    be turned back into JSON text without holding all of it in memory.
+    """
+    pos = start + 1
+    stop = end - 1
+    while pos < stop:
+        cut = min(pos + chunk_size, stop)
+        if cut < stop:
+            # Never split an escape (or a \uXXXX\uXXXX surrogate pair):
+            # back up to the first backslash near the cut, then to the
+            # start of the backslash run it belongs to.
+            window = buf[max(pos, cut - 12):cut]
+            idx = window.find(b"\\")
+            if idx >= 0:
+                cut -= len(window) - idx
+                if _HIGH_SURROGATE.fullmatch(buf[max(pos, cut - 6):cut]):
+                    cut -= 6
+                while cut > pos and buf[cut - 1:cut] == b"\\":
+                    cut -= 1
+            if cut <= pos:
+                cut = stop
+        out.write(json.loads(b'"' + buf[pos:cut] + b'"').encode("utf-8", "replace"))
+        pos = cut
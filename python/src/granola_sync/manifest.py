@@ -1,29 +1,213 @@
-"""Export manifest — tracks which documents have been exported."""
+"""Export manifest — tracks which documents have been exported.
+
+Entries live in SQLite (``manifest.sqlite3`` next to the configured
+``manifest.json``), one row per document, so recording an export is a
+single upsert. ``manifest.json`` is still written on save, for the app and
+anything else that reads it. A missing database is created from an
+existing ``manifest.json`` the first time the manifest is opened.
+"""
 
 import json
 import os
+import sqlite3
+from collections.abc import MutableMapping
 from datetime import datetime
 
 from . import config
 
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    doc_id TEXT PRIMARY KEY,
+    exported_at TEXT NOT NULL,
+    entry TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_exported_at ON entries (exported_at);
+"""
+
+
+def db_path_for(manifest_path: str) -> str:
+    root, ext = os.path.splitext(manifest_path)
+    return (root if ext == ".json" else manifest_path) + ".sqlite3"
+
+
+class Manifest(MutableMapping):
+    """doc_id -> entry dict. Reads hit the database; each write commits.
+
+    Entries are returned as copies: assign the changed dict back to
+    persist it.
+    """
+
+    def __init__(self, json_path: str):
+        self.json_path = json_path
+        self.db_path = db_path_for(json_path)
+        self._conn: sqlite3.Connection | None = None
+        self.dirty = False
+        self._reader()
+
+    def _reader(self) -> sqlite3.Connection | None:
+        """The connection, opened only once there is something to read."""
+        if self._conn is None and (os.path.exists(self.db_path) or os.path.exists(self.json_path)):
+            self._connect()
+        return self._conn
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            migrate = not os.path.exists(self.db_path) and os.path.exists(self.json_path)
+            os.makedirs(os.path.dirname(self.db_path) or ".", exist_ok=True)
+            conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(SCHEMA)
+            self._conn = conn
+            if migrate:
+                with open(self.json_path) as f:
+                    self.update(json.load(f))
+                self.dirty = False
+        return self._conn
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def __getitem__(self, doc_id: str) -> dict:
+        conn = self._reader()
+        if conn is None:
+            raise KeyError(doc_id)
+        row = conn.execute("SELECT entry FROM entries WHERE doc_id = ?", (doc_id,)).fetchone()
+        if row is None:
+            raise KeyError(doc_id)
+        return json.loads(row[0])
+
+    def __contains__(self, doc_id) -> bool:
+        conn = self._reader()
+        if conn is None:
+            return False
+        return conn.execute("SELECT 1 FROM entries WHERE doc_id = ?", (doc_id,)).fetchone() is not None
+
+    def __setitem__(self, doc_id: str, entry: dict) -> None:
+        self._connect().execute(
+            "INSERT OR REPLACE INTO entries (doc_id, exported_at, entry) VALUES (?, ?, ?)",
+            (doc_id, entry.get("exported_at", ""), json.dumps(entry)),
+        )
+        self.dirty = True
+
+    def __delitem__(self, doc_id: str) -> None:
+        if doc_id not in self:
+            raise KeyError(doc_id)
+        self._conn.execute("DELETE FROM entries WHERE doc_id = ?", (doc_id,))
+        self.dirty = True
 
-def load_manifest(manifest_path: str | None = None) -> dict:
+    def __iter__(self):
+        conn = self._reader()
+        if conn is None:
+            return iter(())
+        return iter([doc_id for (doc_id,) in conn.execute("SELECT doc_id FROM entries")])
+
+    def __len__(self) -> int:
+        conn = self._reader()
+        if conn is None:
+            return 0
+        return conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+    def items(self) -> list[tuple[str, dict]]:
+        conn = self._reader()
+        if conn is None:
+            return []
+        rows = conn.execute("SELECT doc_id, entry FROM entries").fetchall()
+        return [(doc_id, json.loads(entry)) for doc_id, entry in rows]
+
+    def values(self) -> list[dict]:
+        return [entry for _, entry in self.items()]
+
+    def update(self, other=(), **kwargs) -> None:
+        """Upsert many entries in one transaction."""
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            super().update(other, **kwargs)
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+    def last_exported_at(self) -> str | None:
+        conn = self._reader()
+        if conn is None:
+            return None
+        return conn.execute("SELECT MAX(exported_at) FROM entries WHERE exported_at != ''").fetchone()[0]
+
+    def write_json(self) -> None:
+        """Write manifest.json atomically (temp file + rename)."""
+        os.makedirs(os.path.dirname(self.json_path) or ".", exist_ok=True)
+        tmp = f"{self.json_path}.tmp"
+        with open(tmp, "w") as f:
+            json.dump(dict(self.items()), f, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.json_path)
+        self.dirty = False
+
+
+def load_manifest(manifest_path: str | None = None) -> Manifest:
     path = manifest_path or config.get("manifest_path")
-    if os.path.exists(path):
-        with open(path) as f:
-            return json.load(f)
-    return {}
+    return Manifest(path)
+
 
+def save_manifest(manifest, manifest_path: str | None = None) -> None:
+    """Persist *manifest* and refresh manifest.json.
 
-def save_manifest(manifest: dict, manifest_path: str | None = None) -> None:
+    A Manifest is already stored entry by entry, so this only rewrites the
+    JSON export if anything changed. A plain dict replaces the contents.
+    """
     path = manifest_path or config.get("manifest_path")
-    os.makedirs(os.path.dirname(path), exist_ok=True)
-    with open(path, "w") as f:
-        json.dump(manifest, f, indent=2)
+    if not isinstance(manifest, Manifest) or manifest.json_path != path:
+        entries = dict(manifest.items())
+        copy = Manifest(path)
+        try:
+            copy.update(entries)
+            for doc_id in set(copy) - entries.keys():
+                del copy[doc_id]
+            copy.write_json()
+        finally:
+            copy.close()
+    elif manifest.dirty or not os.path.exists(path):
+        manifest.write_json()
+
+
+def last_exported_at(manifest) -> str | None:
+    if isinstance(manifest, Manifest):
+        return manifest.last_exported_at()
+    export_dates = [v.get("exported_at", "") for v in manifest.values()]
+    return max((d for d in export_dates if d), default=None)
+
+
+def format_entries(entry: dict | None) -> dict[str, dict]:
+    """format -> {"filename", "digest"} for one document's entry. Entries
+    written before multi-format exports describe their one file."""
+    if not entry:
+        return {}
+    if "formats" in entry:
+        return entry["formats"]
+    if not entry.get("filename"):
+        return {}
+    fmt = os.path.splitext(entry["filename"])[1].lstrip(".")
+    return {fmt: {k: entry[k] for k in ("filename", "digest") if k in entry}}
 
 
-def add_entry(manifest: dict, doc_id: str, filename: str) -> None:
-    manifest[doc_id] = {
+def add_entry(manifest, doc_id: str, filename: str, digest: str | None = None,
+              formats: dict[str, dict] | None = None, summary: str | None = None) -> None:
+    """Record an export. *filename* is the file the app shows; *formats*
+    lists every exported file by format; *summary* is where the summary
+    came from: "cache", "api" or "none"."""
+    entry = {
         "filename": filename,
         "exported_at": datetime.now().isoformat(),
     }
+    if digest:
+        entry["digest"] = digest
+    if formats:
+        entry["formats"] = formats
+    if summary:
+        entry["summary"] = summary
+    manifest[doc_id] = entry
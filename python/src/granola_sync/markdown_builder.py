@@ -1,91 +1,95 @@
 """Build .md files from meeting data."""
 
 import re
-from datetime import datetime
-
-
-def _strip_html(html: str) -> str:
-    """Rough HTML to markdown conversion."""
-    text = html
-    # Headings
-    text = re.sub(r"<h[1-3][^>]*>(.*?)</h[1-3]>", r"\n## \1\n", text, flags=re.DOTALL)
-    # Bold
-    text = re.sub(r"<(strong|b)>(.*?)</\1>", r"**\2**", text, flags=re.DOTALL)
-    # Italic
-    text = re.sub(r"<(em|i)>(.*?)</\1>", r"*\2*", text, flags=re.DOTALL)
-    # List items
-    text = re.sub(r"<li[^>]*>(.*?)</li>", r"- \1", text, flags=re.DOTALL)
-    # Paragraphs and divs to newlines
-    text = re.sub(r"<br\s*/?>", "\n", text)
-    text = re.sub(r"</p>", "\n", text)
-    text = re.sub(r"<p[^>]*>", "", text)
-    # Strip remaining tags
-    text = re.sub(r"<[^>]+>", "", text)
-    # Clean up whitespace
-    text = re.sub(r"\n{3,}", "\n\n", text)
-    return text.strip()
 
+from . import tracing
+from .meeting import Meeting, build_meeting
 
-def create_meeting_md(
-    filepath: str,
-    title: str,
-    date_str: str,
-    attendees: list[dict],
-    summary_html: str,
-    transcript_chunks: list[dict],
-    notes_markdown: str | None = None,
-) -> None:
+
+def _inline(text: str, runs: tuple) -> str:
+    """*text* with its bold/italic runs as **bold** and *italic*."""
+    if not runs:
+        return text
+    out = []
+    for run, bold, italic in runs:
+        core = run.strip()
+        marker = "**" * bold + "*" * italic
+        if not marker or not core:
+            out.append(run)
+            continue
+        lead = run[:len(run) - len(run.lstrip())]
+        trail = run[len(run.rstrip()):]
+        out.append(f"{lead}{marker}{core}{marker}{trail}")
+    return "".join(out)
+
+
+def _summary_md(summary: list[tuple[str, str, int, tuple]]) -> str:
+    lines = []
+    for elem_type, text, depth, runs in summary:
+        text = _inline(text, runs)
+        if elem_type == "heading":
+            lines += ["", f"{'##' if depth <= 3 else '###'} {text}", ""]
+        elif elem_type == "bullet":
+            lines.append(f"{'  ' * (max(depth, 1) - 1)}- {text}")
+        else:
+            lines += ["", text, ""]
+    return re.sub(r"\n{3,}", "\n\n", "\n".join(lines)).strip()
+
+
+def render_md(meeting: Meeting, filepath: str) -> None:
     lines = []
 
     # Title
-    lines.append(f"# {title}\n")
+    lines.append(f"# {meeting.title}\n")
 
     # Date
-    try:
-        dt = datetime.fromisoformat(date_str.replace("Z", "+00:00"))
-        lines.append(f"**Date:** {dt.strftime('%B %d, %Y at %I:%M %p')}\n")
-    except (ValueError, AttributeError):
-        if date_str:
-            lines.append(f"**Date:** {date_str}\n")
+    if meeting.date:
+        lines.append(f"**Date:** {meeting.date.strftime('%B %d, %Y at %I:%M %p')}\n")
+    elif meeting.date_str:
+        lines.append(f"**Date:** {meeting.date_str}\n")
 
     # Attendees
-    if attendees:
-        names = ", ".join(a["name"] for a in attendees)
-        lines.append(f"**Attendees:** {names}\n")
+    if meeting.attendees:
+        lines.append(f"**Attendees:** {', '.join(meeting.attendees)}\n")
 
     lines.append("---\n")
 
     # Summary
-    if summary_html:
+    if meeting.summary:
         lines.append("## Summary\n")
-        lines.append(_strip_html(summary_html))
+        lines.append(_summary_md(meeting.summary))
         lines.append("\n")
 
     # Notes
-    if notes_markdown:
+    if meeting.notes:
         lines.append("---\n")
         lines.append("## Notes\n")
-        lines.append(notes_markdown.strip())
+        lines.append("\n".join(meeting.notes))
         lines.append("\n")
 
     # Transcript
-    if transcript_chunks:
+    if meeting.transcript:
         lines.append("---\n")
         lines.append("## Transcript\n")
-        for chunk in transcript_chunks:
-            source = chunk.get("source", "unknown")
-            text = chunk.get("text", "")
-            ts = chunk.get("start_timestamp", "")
-            time_str = ""
-            if ts:
-                try:
-                    ct = datetime.fromisoformat(ts.replace("Z", "+00:00"))
-                    time_str = ct.strftime("%H:%M")
-                except (ValueError, AttributeError):
-                    pass
-            speaker = "You" if source == "microphone" else "Speaker"
-            prefix = f"[{time_str}] " if time_str else ""
-            lines.append(f"**{prefix}{speaker}:** {text}\n")
-
-    with open(filepath, "w") as f:
+        for entry in meeting.transcript:
+            prefix = f"[{entry.time.strftime('%H:%M')}] " if entry.time else ""
+            speaker = "You" if entry.you else "Speaker"
+            lines.append(f"**{prefix}{speaker}:** {entry.text}\n")
+
+    with tracing.span("save", cat="render"), open(filepath, "w") as f:
         f.write("\n".join(lines))
+
+
+def create_meeting_md(
+    filepath: str,
+    title: str,
+    date_str: str,
+    attendees: list[dict],
+    summary_html: str,
+    transcript_chunks: list[dict],
+    notes_markdown: str | None = None,
+    coalesce_seconds: float = 0,
+) -> None:
+    meeting = build_meeting(title, date_str, attendees, summary_html, transcript_chunks, notes_markdown,
+                            coalesce_seconds)
+    render_md(meeting, filepath)
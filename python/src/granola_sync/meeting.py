@@ -0,0 +1,100 @@
+"""A meeting prepared for rendering, shared by every output format.
+
+``build_meeting`` does the parsing once per document: the summary HTML
+becomes html_parser elements, notes are split into lines and transcript
+timestamps are parsed. Optionally, consecutive transcript chunks from the
+same speaker are merged into one entry (``coalesce_seconds``). The
+builders only format what it returns.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+
+from . import tracing
+
+
+@dataclass
+class TranscriptEntry:
+    time: datetime | None  # None when the chunk's timestamp doesn't parse
+    you: bool  # microphone (the user) rather than system audio (everyone else)
+    text: str
+
+
+@dataclass
+class Meeting:
+    title: str
+    date: datetime | None
+    date_str: str  # as Granola has it; shown when it doesn't parse
+    attendees: list[str]
+    summary: list[tuple[str, str, int, tuple]]  # (type, text, depth, runs), see html_parser
+    notes: list[str]
+    transcript: list[TranscriptEntry]
+
+
+def parse_time(ts: str) -> datetime | None:
+    try:
+        return datetime.fromisoformat(ts.replace("Z", "+00:00"))
+    except (ValueError, AttributeError):
+        return None
+
+
+def _coalesce(transcript_chunks: list[dict], gap: float) -> list[TranscriptEntry]:
+    """Entries for *transcript_chunks*, merging each chunk into the one
+    before when the same speaker resumes within *gap* seconds."""
+    entries = []
+    last_end = None
+    for chunk in transcript_chunks:
+        text = chunk.get("text", "").strip()
+        if not text:
+            continue
+        start = parse_time(chunk.get("start_timestamp", ""))
+        you = chunk.get("source") == "microphone"
+        prev = entries[-1] if entries else None
+        if prev and prev.you == you and start and last_end \
+                and (start - last_end).total_seconds() <= gap:
+            prev.text += " " + text
+        else:
+            entries.append(TranscriptEntry(start, you, text))
+        last_end = parse_time(chunk.get("end_timestamp", "")) or start
+    return entries
+
+
+def build_meeting(
+    title: str,
+    date_str: str,
+    attendees: list[dict],
+    summary_html: str,
+    transcript_chunks: list[dict],
+    notes_markdown: str | None = None,
+    coalesce_seconds: float = 0,
+) -> Meeting:
+    """Parse a meeting's cache/API data into a Meeting. With
+    *coalesce_seconds*, a speaker's consecutive chunks no further apart
+    than that become one transcript entry."""
+    summary = []
+    if summary_html:
+        from .html_parser import parse_html_to_blocks  # loads lxml
+
+        with tracing.span("parse_html", cat="render"):
+            summary = parse_html_to_blocks(summary_html)
+
+    if coalesce_seconds > 0:
+        transcript = _coalesce(transcript_chunks, coalesce_seconds)
+    else:
+        transcript = []
+        for chunk in transcript_chunks:
+            text = chunk.get("text", "").strip()
+            if text:
+                transcript.append(TranscriptEntry(
+                    parse_time(chunk.get("start_timestamp", "")), chunk.get("source") == "microphone", text))
+
+    notes = (notes_markdown or "").strip()
+    return Meeting(
+        title=title,
+        date=parse_time(date_str),
+        date_str=date_str,
+        attendees=[a.get("name", a.get("email", "Unknown")) for a in attendees],
+        summary=summary,
+        notes=notes.split("\n") if notes else [],
+        transcript=transcript,
+    )
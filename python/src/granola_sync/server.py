@@ -0,0 +1,190 @@
+"""``granola-sync serve`` — a long-lived process for the macOS app.
+
+Speaks JSON-RPC 2.0, one JSON object per line, over stdin/stdout or a
+Unix socket. Methods mirror the read-only CLI commands (list, show,
+stats, status) and return what their ``--json`` output would contain.
+Requests are answered one at a time, so exports are not served here:
+they run as their own ``export --json`` process.
+
+Between requests the process keeps the config, manifest and meeting
+index open and the API client's HTTP session alive. Each is reloaded
+only when its file changes on disk.
+"""
+
+import contextlib
+import inspect
+import json
+import os
+import socket
+import sys
+
+from . import config, commands
+from .index import MeetingIndex
+from .manifest import Manifest, load_manifest
+
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+INTERNAL_ERROR = -32603
+SERVER_ERROR = -32000
+
+
+class RpcError(Exception):
+    def __init__(self, code: int, message: str):
+        super().__init__(message)
+        self.code = code
+
+
+def _stamp(path) -> tuple | None:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+class Server:
+    def __init__(self):
+        self.cfg: dict | None = None
+        self.manifest: Manifest | None = None
+        self.index: MeetingIndex | None = None
+        self._stamps: dict = {}
+        self._index_paths: tuple | None = None
+        self.running = True
+
+    def close(self) -> None:
+        if self.index is not None:
+            self.index.close()
+            self.index = None
+        if self.manifest is not None:
+            self.manifest.close()
+            self.manifest = None
+
+    def _changed(self, key: str, path) -> bool:
+        stamp = _stamp(path)
+        if key in self._stamps and self._stamps[key] == stamp:
+            return False
+        self._stamps[key] = stamp
+        return True
+
+    def _refresh(self) -> None:
+        """Reload whatever changed on disk since the last request."""
+        if self._changed("config", config.CONFIG_PATH) or self.cfg is None:
+            self.cfg = config.load_config()
+
+        paths = (config.expand(self.cfg.get("index_path", "")),
+                 config.expand(self.cfg.get("granola_cache_path", "")))
+        if paths != self._index_paths:
+            self.close()
+            self.index = MeetingIndex(*paths)
+            self._index_paths = paths
+
+        # The manifest reads through to its database, so it only needs
+        # reopening if it moved
+        manifest_path = config.expand(self.cfg.get("manifest_path", ""))
+        if self.manifest is None or self.manifest.json_path != manifest_path:
+            if self.manifest is not None:
+                self.manifest.close()
+            self.manifest = load_manifest(manifest_path)
+
+    # Methods
+
+    def rpc_ping(self):
+        return "pong"
+
+    def rpc_list(self, search: str | None = None, sort: str = "date", limit: int | None = None):
+        return commands.list_meetings(self.cfg, self.manifest, search, sort, limit, self.index)
+
+    def rpc_show(self, doc_id: str, no_api_cache: bool = False):
+        detail = commands.show_meeting(self.cfg, self.manifest, doc_id, not no_api_cache, self.index)
+        if not detail:
+            raise RpcError(SERVER_ERROR, f"Meeting not found: {doc_id}")
+        return detail
+
+    def rpc_stats(self):
+        from .stats import compute_stats
+        return compute_stats(cfg=self.cfg, manifest=self.manifest, index=self.index)
+
+    def rpc_status(self):
+        return commands.sync_status(self.cfg, self.manifest, self.index)
+
+    def rpc_shutdown(self):
+        self.running = False
+        return None
+
+    def handle(self, request) -> dict | None:
+        """Answer one decoded request; None for notifications."""
+        req_id = request.get("id") if isinstance(request, dict) else None
+        try:
+            if not isinstance(request, dict) or not isinstance(request.get("method"), str):
+                raise RpcError(INVALID_REQUEST, "Invalid request")
+            method = getattr(self, "rpc_" + request["method"], None)
+            if method is None:
+                raise RpcError(METHOD_NOT_FOUND, f"Unknown method: {request['method']}")
+            params = request.get("params") or {}
+            if not isinstance(params, dict):
+                raise RpcError(INVALID_PARAMS, "params must be an object")
+            # Checked before the call, so a TypeError from inside the method
+            # is reported as the internal error it is
+            try:
+                inspect.signature(method).bind(**params)
+            except TypeError as e:
+                raise RpcError(INVALID_PARAMS, str(e))
+            self._refresh()
+            response = {"jsonrpc": "2.0", "id": req_id, "result": method(**params)}
+        except RpcError as e:
+            response = {"jsonrpc": "2.0", "id": req_id, "error": {"code": e.code, "message": str(e)}}
+        except Exception as e:
+            response = {"jsonrpc": "2.0", "id": req_id,
+                        "error": {"code": INTERNAL_ERROR, "message": f"{type(e).__name__}: {e}"}}
+        if isinstance(request, dict) and "id" not in request:
+            return None
+        return response
+
+    def serve(self, rfile, wfile) -> None:
+        """Handle line-delimited requests until EOF or ``shutdown``."""
+        for line in rfile:
+            if not line.strip():
+                continue
+            try:
+                request = json.loads(line)
+            except ValueError:
+                response = {"jsonrpc": "2.0", "id": None,
+                            "error": {"code": PARSE_ERROR, "message": "Parse error"}}
+            else:
+                # Nothing but responses may reach the output stream
+                with contextlib.redirect_stdout(sys.stderr):
+                    response = self.handle(request)
+            if response is not None:
+                wfile.write(json.dumps(response) + "\n")
+                wfile.flush()
+            if not self.running:
+                break
+
+    def serve_socket(self, path: str) -> None:
+        """Accept clients on a Unix socket, one at a time."""
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(path)
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.bind(path)
+            sock.listen()
+            try:
+                while self.running:
+                    conn, _ = sock.accept()
+                    with conn, conn.makefile("r", encoding="utf-8") as rfile, \
+                            conn.makefile("w", encoding="utf-8") as wfile:
+                        self.serve(rfile, wfile)
+            finally:
+                os.remove(path)
+
+
+def run(socket_path: str | None = None) -> None:
+    server = Server()
+    try:
+        if socket_path:
+            server.serve_socket(socket_path)
+        else:
+            server.serve(sys.stdin, sys.stdout)
+    finally:
+        server.close()
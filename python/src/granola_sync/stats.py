@@ -5,15 +5,25 @@ from collections import Counter
 from datetime import datetime, timedelta
 
 from .cache import CacheData, list_meetings, _compute_duration, _parse_attendees
-from .manifest import load_manifest
+from .manifest import last_exported_at, load_manifest
 from . import config
 
 
-def compute_stats(cache: CacheData, cfg: dict | None = None) -> dict:
-    """Compute aggregated statistics from cache and manifest."""
+def compute_stats(cache: CacheData | None = None, cfg: dict | None = None,
+                  manifest: dict | None = None, index=None) -> dict:
+    """Compute aggregated statistics from cache and manifest.
+
+    Without a *cache*, meetings come from the persistent index (*index*
+    if already open).
+    """
     cfg = cfg or config.load_config()
-    manifest = load_manifest(config.expand(cfg.get("manifest_path", "")))
-    meetings = list_meetings(cache, manifest)
+    if manifest is None:
+        manifest = load_manifest(config.expand(cfg.get("manifest_path", "")))
+    if cache is None:
+        from .index import list_meetings as list_indexed
+        meetings = list_indexed(cfg, manifest, index)
+    else:
+        meetings = list_meetings(cache, manifest)
 
     total = len(meetings)
     exported = sum(1 for m in meetings if m["is_exported"])
@@ -78,12 +88,7 @@ def compute_stats(cache: CacheData, cfg: dict | None = None) -> dict:
     storage_mb = round(storage_bytes / (1024 * 1024), 2)
 
     # Last export
-    last_export_at = None
-    if manifest:
-        export_dates = [v.get("exported_at", "") for v in manifest.values()]
-        export_dates = [d for d in export_dates if d]
-        if export_dates:
-            last_export_at = max(export_dates)
+    last_export_at = last_exported_at(manifest)
 
     # Activity heatmap (last 90 days)
     today = datetime.now().date()
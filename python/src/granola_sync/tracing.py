@@ -0,0 +1,96 @@
+"""Timeline spans in Chrome trace-event format (chrome://tracing, Perfetto).
+
+Tracing is off unless ``start()`` was called: ``span()`` then returns a
+shared do-nothing context manager and ``record()`` returns at once, so
+instrumented code costs a function call and a None check.
+
+    tracing.start()
+    with tracing.span("load_cache", path=path):
+        ...
+    tracing.write("trace.json", tracing.stop())
+
+Timestamps come from ``time.perf_counter``, which is system-wide on macOS
+and Linux, so events collected in worker processes (see ``add``) line up
+with the parent's.
+"""
+
+import contextlib
+import json
+import os
+import threading
+import time
+
+_events: list | None = None
+_threads: dict[tuple[int, int], str] = {}
+_NULL = contextlib.nullcontext()
+
+
+def enabled() -> bool:
+    return _events is not None
+
+
+def start() -> None:
+    """Start collecting events in this process."""
+    global _events
+    _events = []
+    _threads.clear()
+
+
+def stop() -> list[dict]:
+    """Stop collecting; returns the events, including thread names."""
+    global _events
+    events, _events = _events or [], None
+    names = [{"ph": "M", "name": "thread_name", "pid": pid, "tid": tid, "args": {"name": name}}
+             for (pid, tid), name in _threads.items()]
+    _threads.clear()
+    return events + names
+
+
+def add(events: list[dict]) -> None:
+    """Merge events collected elsewhere (e.g. returned by a worker process)."""
+    if _events is not None:
+        _events.extend(events)
+
+
+def record(name: str, start: float, end: float, cat: str = "export", **args) -> None:
+    """Add a span that has already happened (perf_counter seconds)."""
+    if _events is None:
+        return
+    thread = threading.current_thread()
+    pid, tid = os.getpid(), thread.ident
+    _threads.setdefault((pid, tid), thread.name)
+    _events.append({
+        "name": name, "cat": cat, "ph": "X", "pid": pid, "tid": tid,
+        "ts": start * 1e6, "dur": (end - start) * 1e6, "args": args,
+    })
+
+
+class _Span:
+    __slots__ = ("name", "cat", "args", "start")
+
+    def __init__(self, name: str, cat: str, args: dict):
+        self.name = name
+        self.cat = cat
+        self.args = args
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is not None:
+            self.args["error"] = exc_type.__name__
+        record(self.name, self.start, time.perf_counter(), self.cat, **self.args)
+        return False
+
+
+def span(name: str, cat: str = "export", **args):
+    """Time the enclosed block as one span; a no-op when tracing is off."""
+    if _events is None:
+        return _NULL
+    return _Span(name, cat, args)
+
+
+def write(path: str, events: list[dict]) -> None:
+    with open(path, "w") as f:
+        json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
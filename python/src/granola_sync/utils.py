@@ -1,7 +1,15 @@
 """Shared helpers — filename sanitization, path utilities."""
 
+import contextlib
+import functools
+import hashlib
 import os
 import re
+import shutil
+import tempfile
+import zlib
+
+PARTIAL_SUFFIX = ".partial"
 
 
 def safe_filename(name: str, max_len: int = 80) -> str:
@@ -10,12 +18,96 @@ def safe_filename(name: str, max_len: int = 80) -> str:
     return cleaned[:max_len] if cleaned else "Untitled"
 
 
-def unique_filename(dest_dir: str, base_name: str, ext: str) -> str:
+def unique_filename(dest_dir: str, base_name: str, ext: str, existing: set | None = None) -> str:
+    """First free name in dest_dir.
+
+    With ``existing`` — the names already in dest_dir plus any claimed but
+    not written yet, kept current by the caller — no filesystem calls are
+    made; without it each candidate is checked on disk.
+    """
+    if existing is None:
+        def taken(name):
+            return os.path.exists(os.path.join(dest_dir, name))
+    else:
+        taken = existing.__contains__
+
     candidate = f"{base_name}{ext}"
-    if not os.path.exists(os.path.join(dest_dir, candidate)):
+    if not taken(candidate):
         return candidate
     for i in range(2, 100):
         candidate = f"{base_name} ({i}){ext}"
-        if not os.path.exists(os.path.join(dest_dir, candidate)):
+        if not taken(candidate):
             return candidate
-    return f"{base_name} ({hash(base_name) % 9999}){ext}"
+    # Past 99 copies: jump to a number derived from the name, then probe
+    n = zlib.crc32(base_name.encode()) % 9999
+    while taken(candidate := f"{base_name} ({n}){ext}"):
+        n += 1
+    return candidate
+
+
+class Staged:
+    """A file being written through ``staged_file``."""
+
+    def __init__(self, path: str):
+        self.path = path  # write here
+        self.digest = ""  # SHA-256 of what was written, once the block exits
+        self.replaced = False  # whether it was moved into place
+
+
+def file_digest(path: str) -> str:
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+@functools.cache
+def _new_file_mode() -> int:
+    """The mode open() gives a new file under the current umask."""
+    umask = os.umask(0)
+    os.umask(umask)
+    return 0o666 & ~umask
+
+
+def _temp_path(name: str, directory: str | None) -> str:
+    """A new empty file for staging *name*, in *directory* (None: the
+    system temp folder). The name is unique, so concurrent runs writing
+    the same file don't collide; the mode is what open() would give, not
+    mkstemp's owner-only one."""
+    fd, path = tempfile.mkstemp(prefix=f".{name}.", suffix=PARTIAL_SUFFIX, dir=directory)
+    os.fchmod(fd, _new_file_mode())
+    os.close(fd)
+    return path
+
+
+@contextlib.contextmanager
+def staged_file(path: str, previous_digest: str | None = None):
+    """Yield a Staged temporary file to write instead of *path*; on success,
+    flush it to disk and rename it over *path*, so readers never see a
+    partial file.
+
+    If *path* exists and has a *previous_digest* (its recorded digest),
+    the file is written outside *path*'s folder and only copied in when
+    its digest differs: identical output never touches the folder, so the
+    file keeps its mtime and sync clients see nothing at all.
+    """
+    directory, name = os.path.split(path)
+    compare = previous_digest is not None and os.path.exists(path)
+    staged = Staged(_temp_path(name, None if compare else directory))
+    leftovers = [staged.path]
+    try:
+        yield staged
+        staged.digest = file_digest(staged.path)
+        if compare and staged.digest == previous_digest:
+            return
+        ready = staged.path
+        if compare:
+            ready = _temp_path(name, directory)
+            leftovers.append(ready)
+            shutil.copyfile(staged.path, ready)
+        with open(ready, "rb") as f:
+            os.fsync(f.fileno())
+        os.replace(ready, path)
+        staged.replaced = True
+    finally:
+        for leftover in leftovers:
+            with contextlib.suppress(OSError):
+                os.remove(leftover)
@@ -0,0 +1,139 @@
+"""Watch mode — export new and changed meetings soon after Granola writes its cache.
+
+The Granola data directory is polled with stat calls only (no reads)
+every ``watch_interval`` seconds. A change starts a debounce window.
+The export runs once the cache files have been quiet for
+``watch_debounce`` seconds, or after ``MAX_WAIT_FACTOR`` windows if
+Granola keeps writing (e.g. during a live meeting).
+"""
+
+import os
+import time
+
+from . import config
+from .exporter import ExportResult, run_export
+from .index import MeetingIndex
+from .manifest import load_manifest
+
+MAX_WAIT_FACTOR = 6
+
+
+def _snapshot(cache_dir: str) -> dict:
+    """name -> (mtime_ns, size) for each cache-v*.json in *cache_dir*."""
+    snap = {}
+    try:
+        with os.scandir(cache_dir) as entries:
+            for entry in entries:
+                if entry.name.startswith("cache-v") and entry.name.endswith(".json"):
+                    try:
+                        st = entry.stat()
+                    except FileNotFoundError:
+                        continue
+                    snap[entry.name] = (st.st_mtime_ns, st.st_size)
+    except FileNotFoundError:
+        pass
+    return snap
+
+
+class Watcher:
+    """Debounced cache watcher. ``poll()`` does one step; ``run()`` loops."""
+
+    def __init__(self, cfg: dict | None = None, interval: float | None = None,
+                 debounce: float | None = None, clock=time.monotonic, sleep=time.sleep):
+        self._cfg = cfg
+        cfg = self.cfg
+        self.interval = float(interval if interval is not None else cfg.get("watch_interval", 5))
+        self.debounce = float(debounce if debounce is not None else cfg.get("watch_debounce", 10))
+        self.max_wait = self.debounce * MAX_WAIT_FACTOR
+        self.cache_dir = os.path.dirname(config.expand(cfg.get("granola_cache_path", "")))
+        self._clock = clock
+        self._sleep = sleep
+        self._snapshot = _snapshot(self.cache_dir)
+        self._first_change: float | None = None
+        self._last_change: float | None = None
+        self._seen: dict | None = None  # doc_id -> index fingerprint at the last sync
+
+    @property
+    def cfg(self) -> dict:
+        # Without an explicit config, pick up edits made in the app between syncs
+        return self._cfg or config.load_config()
+
+    def _changes(self, cfg: dict) -> tuple[list[str], dict]:
+        index = MeetingIndex(config.expand(cfg.get("index_path", "")),
+                             config.expand(cfg.get("granola_cache_path", "")))
+        try:
+            index.refresh()
+            fingerprints = index.fingerprints()
+        finally:
+            index.close()
+        if self._seen is None:
+            # First sync: hand every doc to the exporter, digests skip the unchanged
+            return sorted(fingerprints), fingerprints
+        changed = {d for d, fp in fingerprints.items() if self._seen.get(d) != fp}
+        manifest = load_manifest(config.expand(cfg.get("manifest_path", "")))
+        return sorted(changed | (fingerprints.keys() - manifest.keys())), fingerprints
+
+    def pending(self, cfg: dict) -> list[str]:
+        """Docs changed since this watcher's last sync, plus any never
+        exported. Compared against the watcher's own fingerprints, since
+        list/show or the daemon may refresh the shared index first."""
+        return self._changes(cfg)[0]
+
+    def sync(self) -> ExportResult | None:
+        """Export pending docs; None if there was nothing to do. Docs whose
+        export failed stay pending and are retried after another window;
+        a crashed run is reported as a failed result rather than raised."""
+        cfg = self.cfg
+        try:
+            doc_ids, fingerprints = self._changes(cfg)
+        except (OSError, ValueError):
+            # Cache missing or caught mid-write: try again after another window
+            self._retry_later()
+            return None
+        except Exception as e:
+            self._retry_later()
+            return ExportResult(success=False, message=f"Watch failed to read the cache: {e}")
+        if not doc_ids:
+            self._seen = fingerprints
+            return None
+        try:
+            result = run_export(cfg, doc_ids=doc_ids)
+        except Exception as e:
+            self._retry_later()
+            return ExportResult(success=False, errors=[str(e)], failed_ids=doc_ids,
+                                message=f"Export failed: {e}")
+        seen = dict(fingerprints)
+        if not result.success:
+            # Without per-doc errors the whole run failed (e.g. Drive missing)
+            for doc_id in result.failed_ids or doc_ids:
+                seen.pop(doc_id, None)
+            self._retry_later()
+        self._seen = seen
+        return result
+
+    def _retry_later(self) -> None:
+        self._first_change = self._last_change = self._clock()
+
+    def poll(self) -> ExportResult | None:
+        now = self._clock()
+        snap = _snapshot(self.cache_dir)
+        if snap != self._snapshot:
+            self._snapshot = snap
+            self._last_change = now
+            if self._first_change is None:
+                self._first_change = now
+        if self._first_change is None:
+            return None
+        if now - self._last_change < self.debounce and now - self._first_change < self.max_wait:
+            return None
+        self._first_change = self._last_change = None
+        return self.sync()
+
+    def run(self, on_result=None) -> None:
+        """Catch up once, then poll until interrupted."""
+        result = self.sync()
+        while True:
+            if result is not None and on_result:
+                on_result(result)
+            self._sleep(self.interval)
+            result = self.poll()
@@ -0,0 +1,148 @@
+"""Tests for the API client against a local stub server."""
+
+import json
+import os
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+
+import pytest
+
+from granola_sync import api, config
+from granola_sync.api import ApiClient
+
+
+class _Stub(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        server = self.server
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        with server.lock:
+            server.requests.append((self.path, body, self.client_address[1]))
+            status, headers, payload = server.script.pop(0) if server.script else server.default
+        data = json.dumps(payload).encode()
+        self.send_response(status)
+        for k, v in headers.items():
+            self.send_header(k, v)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stub():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Stub)
+    server.lock = threading.Lock()
+    server.requests = []
+    server.script = []
+    server.default = (200, {}, [{"title": "Summary", "original_content": "<p>x</p>"}])
+    server.url = f"http://127.0.0.1:{server.server_address[1]}/v1"
+    thread = threading.Thread(target=server.serve_forever, args=(0.01,), daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _client(**kwargs) -> tuple[ApiClient, list]:
+    client = ApiClient(backoff=0.001, **kwargs)
+    sleeps = []
+    client._sleep = sleeps.append
+    return client, sleeps
+
+
+def test_reuses_one_connection(stub):
+    client, _ = _client()
+    for i in range(3):
+        assert client.fetch_panels(f"doc{i}", "tok", stub.url)
+    ports = {port for _, _, port in stub.requests}
+    assert len(stub.requests) == 3
+    assert len(ports) == 1
+    assert stub.requests[0][:2] == ("/v1/get-document-panels", {"document_id": "doc0"})
+
+
+def test_retries_server_errors_with_backoff(stub):
+    stub.script = [(503, {}, {}), (502, {}, {})]
+    client, sleeps = _client()
+    assert client.fetch_panels("doc", "tok", stub.url)
+    assert len(stub.requests) == 3
+    assert len(sleeps) == 2
+    assert all(0 <= s <= 0.002 for s in sleeps)
+
+
+def test_honours_retry_after(stub):
+    stub.script = [(429, {"Retry-After": "7"}, {})]
+    client, sleeps = _client()
+    assert client.fetch_panels("doc", "tok", stub.url)
+    assert sleeps == [7.0]
+
+
+def test_gives_up_after_max_retries(stub):
+    stub.default = (500, {}, {})
+    client, sleeps = _client(max_retries=2)
+    assert client.fetch_transcript("doc", "tok", stub.url) is None
+    assert len(stub.requests) == 3
+
+
+def test_client_errors_are_not_retried(stub):
+    stub.script = [(404, {}, {"error": "nope"})]
+    client, sleeps = _client()
+    assert client.fetch_panels("doc", "tok", stub.url) is None
+    assert len(stub.requests) == 1
+    assert not client.breaker_open
+
+
+def test_circuit_breaker_stops_calling(stub):
+    stub.default = (503, {}, {})
+    client, _ = _client(max_retries=0, breaker_threshold=3)
+    for i in range(10):
+        assert client.fetch_panels(f"doc{i}", "tok", stub.url) is None
+    assert client.breaker_open
+    assert len(stub.requests) == 3
+
+
+def test_circuit_breaker_recovers_after_cooldown(stub):
+    stub.script = [(503, {}, {})] * 2
+    client, _ = _client(max_retries=0, breaker_threshold=2, breaker_cooldown=0)
+    client.fetch_panels("a", "tok", stub.url)
+    client.fetch_panels("b", "tok", stub.url)
+    assert client.breaker_open
+    assert client.fetch_panels("c", "tok", stub.url)
+    assert not client.breaker_open
+
+
+def test_shared_client_follows_the_callers_config():
+    with tempfile.TemporaryDirectory() as d:
+        cfg = dict(config.DEFAULTS, api_cache_path=os.path.join(d, "a.sqlite3"), api_workers=2)
+        first = api.get_client(cfg)
+        same = api.get_client(dict(cfg, api_url="http://elsewhere"))
+        current = api.get_client()
+        moved = api.get_client(dict(cfg, api_cache_path=os.path.join(d, "b.sqlite3")))
+        smaller = api.get_client(dict(cfg, api_cache_path=os.path.join(d, "b.sqlite3"), api_cache_max_mb=1))
+        api.reset_client()
+    assert same is first and current is first
+    assert moved is not first
+    assert smaller is not moved and smaller.response_cache.max_bytes == 1024 * 1024
+    assert first.session.adapters["https://"]._pool_maxsize == 2
+
+
+def test_disabled_response_cache_still_holds_markers():
+    with tempfile.TemporaryDirectory() as d:
+        cfg = dict(config.DEFAULTS, api_cache_path=os.path.join(d, "a.sqlite3"), api_cache_enabled=False)
+        client = api.get_client(cfg)
+        store = api.response_cache(cfg)
+        store.mark_empty("doc", 60)
+        with mock.patch.object(client, "post", return_value=[]) as post:
+            client.fetch_panels("doc", "tok", "http://x")
+            client.fetch_panels("doc", "tok", "http://x")
+        marked = store.known_empty(["doc"])
+        cached = store.get("get-document-panels", "doc", "http://x")
+        api.reset_client()
+    assert marked == {"doc"}
+    assert post.call_count == 2 and cached == (False, None)
@@ -0,0 +1,126 @@
+"""Tests for the on-disk API response cache."""
+
+import os
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from unittest import mock
+
+from granola_sync import api_cache
+from granola_sync.api import ApiClient
+from granola_sync.api_cache import DAY, HOUR, ResponseCache, empty_ttl_for, ttl_for
+
+
+def _ago(seconds: float) -> str:
+    return (datetime.now(timezone.utc) - timedelta(seconds=seconds)).isoformat().replace("+00:00", "Z")
+
+
+def test_ttl_grows_with_meeting_age():
+    assert ttl_for(_ago(600)) == HOUR
+    assert ttl_for(_ago(3 * DAY)) == DAY
+    assert ttl_for(_ago(60 * DAY)) == 90 * DAY
+    assert ttl_for(None) == HOUR
+    assert ttl_for("garbage") == HOUR
+    assert empty_ttl_for(_ago(600)) == HOUR
+    assert 2 * DAY < empty_ttl_for(_ago(10 * DAY)) < 3 * DAY
+    assert empty_ttl_for(_ago(400 * DAY)) == 30 * DAY
+
+
+def test_roundtrip_and_expiry():
+    with tempfile.TemporaryDirectory() as d:
+        cache = ResponseCache(os.path.join(d, "c.sqlite3"))
+        cache.put("get-document-panels", "doc1", [{"title": "Summary"}], ttl=60)
+        assert cache.get("get-document-panels", "doc1") == (True, [{"title": "Summary"}])
+        assert cache.get("get-document-transcript", "doc1") == (False, None)
+        with mock.patch.object(api_cache.time, "time", return_value=time.time() + 120):
+            assert cache.get("get-document-panels", "doc1") == (False, None)
+        cache.close()
+
+
+def test_identical_bodies_share_one_blob():
+    with tempfile.TemporaryDirectory() as d:
+        cache = ResponseCache(os.path.join(d, "c.sqlite3"))
+        for i in range(5):
+            cache.put("get-document-panels", f"doc{i}", [], ttl=60)
+        blobs = cache._conn.execute("SELECT COUNT(*) FROM blobs").fetchone()[0]
+        cache.close()
+    assert blobs == 1
+
+
+def test_evicts_least_recently_used():
+    with tempfile.TemporaryDirectory() as d:
+        cache = ResponseCache(os.path.join(d, "c.sqlite3"), max_bytes=1600)
+        body = lambda i: [{"text": os.urandom(400).hex(), "i": i}]
+        clock = [1000.0]
+        with mock.patch.object(api_cache.time, "time", side_effect=lambda: clock[0]):
+            for i in range(3):
+                clock[0] += 1
+                cache.put("t", f"doc{i}", body(i), ttl=DAY)
+            clock[0] += 1
+            assert cache.get("t", "doc0")[0]  # doc0 is now the most recent
+            clock[0] += 1
+            cache.put("t", "doc3", body(3), ttl=DAY)
+            hits = {i: cache.get("t", f"doc{i}")[0] for i in range(4)}
+            total = cache._conn.execute("SELECT SUM(size) FROM blobs").fetchone()[0]
+        cache.close()
+    assert hits == {0: True, 1: False, 2: True, 3: True}
+    assert total <= 1600
+
+
+def test_size_is_tracked_without_rescanning():
+    with tempfile.TemporaryDirectory() as d:
+        cache = ResponseCache(os.path.join(d, "c.sqlite3"))
+        statements = []
+        cache._conn.set_trace_callback(statements.append)
+        for i in range(5):
+            cache.put("t", f"doc{i}", [i], ttl=60)
+        cache.put("t", "doc0", ["replaced"], ttl=60)
+        cache._conn.set_trace_callback(None)
+        blobs = cache._conn.execute("SELECT COUNT(*), SUM(size) FROM blobs").fetchone()
+        total = cache._total
+        cache.close()
+    assert sum("SUM(size)" in sql for sql in statements) == 1  # counted once, on the first put
+    # doc0's old body went with it
+    assert blobs == (5, total)
+
+
+def test_eviction_drops_expired_responses_first():
+    with tempfile.TemporaryDirectory() as d:
+        cache = ResponseCache(os.path.join(d, "c.sqlite3"), max_bytes=1600)
+        body = lambda i: [{"text": os.urandom(400).hex(), "i": i}]
+        clock = [1000.0]
+        with mock.patch.object(api_cache.time, "time", side_effect=lambda: clock[0]):
+            cache.put("t", "old", body(0), ttl=DAY)
+            clock[0] += 1
+            cache.put("t", "stale", body(1), ttl=10)
+            clock[0] += 60
+            cache.put("t", "new", body(2), ttl=DAY)
+            assert cache._total < 1600  # nothing evicted yet
+            cache.put("t", "newer", body(3), ttl=DAY)
+            hits = {k: cache.get("t", k)[0] for k in ("old", "new", "newer")}
+            rows = cache._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+        cache.close()
+    assert hits == {"old": True, "new": True, "newer": True}
+    assert rows == 3
+
+
+def test_client_serves_repeats_from_cache():
+    with tempfile.TemporaryDirectory() as d:
+        client = ApiClient(response_cache=ResponseCache(os.path.join(d, "c.sqlite3")))
+        panels = [{"title": "Summary", "original_content": "<p>x</p>"}]
+        with mock.patch.object(client, "post", return_value=panels) as post:
+            old = _ago(60 * DAY)
+            assert client.fetch_panels("doc", "tok", "http://x", created_at=old) == panels
+            assert client.fetch_panels("doc", "tok", "http://x", created_at=old) == panels
+            assert post.call_count == 1
+            client.fetch_panels("doc", "tok", "http://x", created_at=old, use_cache=False)
+            assert post.call_count == 2
+            # Another API (e.g. staging) has its own entries
+            client.fetch_panels("doc", "tok", "http://y", created_at=old)
+            assert post.call_count == 3
+            # Failures are not cached
+            post.return_value = None
+            assert client.fetch_transcript("doc", "tok", "http://x") is None
+            assert client.fetch_transcript("doc", "tok", "http://x") is None
+            assert post.call_count == 5
+        client.close()
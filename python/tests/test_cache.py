@@ -37,3 +37,102 @@ def test_load_cache_missing_file():
     import pytest
     with pytest.raises(FileNotFoundError):
         load_cache("/nonexistent/cache.json")
+
+
+def _write_v4_cache(path: str, state: dict) -> None:
+    raw = {"cache": {"state": state, "version": 4}}
+    Path(path).write_text(json.dumps(raw))
+
+
+def test_load_cache_v4_dict_form():
+    state = {
+        "documents": {"doc1": {"title": "Test"}},
+        "transcripts": {"doc1": [{"text": "hi", "source": "microphone"}]},
+        "documentPanels": {},
+        "meetingsMetadata": {"doc1": {"attendees": []}},
+    }
+    with tempfile.NamedTemporaryFile(suffix=".json", mode="w", delete=False) as f:
+        _write_v4_cache(f.name, state)
+        cache = load_cache(f.name)
+    assert cache.documents == state["documents"]
+    assert cache.transcripts == state["transcripts"]
+    assert cache.meetings_meta == state["meetingsMetadata"]
+
+
+def test_load_cache_skips_other_state_keys():
+    state = {
+        "people": [{"name": "x {[ \"tricky\" ]}"}] * 50,
+        "documents": {"doc1": {"title": "Ünïcødé \U0001f3a4 \"quoted\" \\ back"}},
+        "featureFlags": {"nested": {"deep": [1, 2.5, True, None, "]"]}},
+    }
+    with tempfile.NamedTemporaryFile(suffix=".json", mode="w", delete=False) as f:
+        _write_v4_cache(f.name, state)
+        full = load_cache(f.name)
+        scanned = load_cache(f.name, offsets=True)
+    assert full.documents == scanned.documents == state["documents"]
+    assert "people" not in full._state
+    assert "people" not in scanned._source.sections
+    assert full.transcripts == scanned.transcripts == {}
+
+
+def test_load_cache_decodes_sections_lazily():
+    with tempfile.NamedTemporaryFile(suffix=".json", mode="w", delete=False) as f:
+        _write_cache(f.name, {"doc1": {"title": "Test"}})
+        cache = load_cache(f.name, sections=("documents", "transcripts"))
+    assert cache._state == {}
+    assert "doc1" in cache.documents
+    assert list(cache._state) == ["documents"]
+
+
+def test_offsets_only_for_v4():
+    state = {"documents": {"doc1": {"title": "Test"}}, "transcripts": {}}
+    with tempfile.NamedTemporaryFile(suffix=".json", mode="w", delete=False) as f:
+        _write_v4_cache(f.name, state)
+        v4 = load_cache(f.name, offsets=True)
+        [(doc_id, raw, start)] = list(v4.raw_entries("documents"))
+        on_disk = Path(f.name).read_bytes()
+        _write_cache(f.name, state["documents"])
+        v3 = load_cache(f.name, offsets=True)
+    assert v4.is_direct and on_disk[start:start + len(raw)] == bytes(raw)
+    assert not v3.is_direct and v3.documents == state["documents"]
+
+
+def test_load_cache_sections_filter():
+    with tempfile.NamedTemporaryFile(suffix=".json", mode="w", delete=False) as f:
+        _write_cache(f.name, {"doc1": {"title": "Test"}})
+        cache = load_cache(f.name, sections=("transcripts",))
+    assert cache.documents == {}
+
+
+def test_load_cache_v3_matches_json_load():
+    state = {
+        "documents": {
+            f"doc{i}": {"title": f"Meeting {i} \U0001f50a \\\\ \"q\" \n", "notes_markdown": "é" * i}
+            for i in range(40)
+        },
+        "transcripts": {}, "documentPanels": {}, "meetingsMetadata": {},
+    }
+    with tempfile.NamedTemporaryFile(suffix=".json", mode="w", delete=False) as f:
+        Path(f.name).write_text(json.dumps({"cache": json.dumps({"state": state})}))
+        cache = load_cache(f.name)
+    assert cache.documents == state["documents"]
+
+
+def test_unescape_string_any_chunk_size():
+    import io
+    from granola_sync.json_scan import unescape_string
+
+    text = "a\\\"b\U0001f3a4\né\\\\\\x" * 30
+    literal = json.dumps(text).encode()
+    for chunk_size in range(1, 40):
+        out = io.BytesIO()
+        unescape_string(literal, 0, len(literal), out, chunk_size=chunk_size)
+        assert out.getvalue().decode("utf-8") == text
+
+
+def test_load_cache_malformed():
+    import pytest
+    with tempfile.NamedTemporaryFile(suffix=".json", mode="w", delete=False) as f:
+        Path(f.name).write_text('{"cache": {"state": {"documents": {"a": [1, 2}')
+        with pytest.raises(json.JSONDecodeError):
+            load_cache(f.name).documents
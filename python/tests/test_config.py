@@ -55,3 +55,26 @@ def test_validate_config_missing_drive():
     cfg["drive_path"] = ""
     errors, warnings = config.validate_config(cfg)
     assert any("drive_path" in e for e in errors)
+
+
+def test_export_formats_accepts_one_or_several():
+    assert config.export_formats({"export_format": "md"}) == ["md"]
+    assert config.export_formats({"export_format": ["docx", "md", "docx"]}) == ["docx", "md"]
+    assert config.export_formats({"export_format": "md, txt"}) == ["md", "txt"]
+    assert config.export_formats({"export_format": "pdf"}) == ["docx"]
+    assert config.export_formats({}) == ["docx"]
+
+
+def test_config_set_accepts_fractional_watch_timings():
+    from argparse import Namespace
+
+    from granola_sync import cli
+
+    with tempfile.TemporaryDirectory() as d, \
+            mock.patch.object(config, "CONFIG_DIR", Path(d)), \
+            mock.patch.object(config, "CONFIG_PATH", Path(d) / "config.json"):
+        cli.cmd_config(Namespace(action="set", key="watch_debounce", value="0.5", json=False))
+        cli.cmd_config(Namespace(action="set", key="api_workers", value="4", json=False))
+        saved = json.loads((Path(d) / "config.json").read_text())
+    assert saved["watch_debounce"] == 0.5
+    assert saved["api_workers"] == 4
@@ -0,0 +1,69 @@
+"""Tests for docx_builder module."""
+
+import os
+import tempfile
+import zipfile
+
+from docx import Document
+
+from granola_sync.docx_builder import create_meeting_docx
+
+
+def _build(path: str, title: str = "Planning", chunks=None) -> Document:
+    create_meeting_docx(
+        filepath=path,
+        title=title,
+        date_str="2026-01-15T10:00:00Z",
+        attendees=[{"name": "Ada", "email": "ada@example.com"}],
+        summary_html="<h3>Goals</h3><ul><li>Ship it</li></ul>",
+        transcript_chunks=chunks if chunks is not None else [
+            {"source": "microphone", "text": "Hello there", "start_timestamp": "2026-01-15T10:00:05Z"},
+            {"source": "system", "text": "Hi\tback", "start_timestamp": "2026-01-15T10:00:09Z"},
+        ],
+        notes_markdown="- follow up",
+    )
+    return Document(path)
+
+
+def test_transcript_uses_named_styles():
+    with tempfile.TemporaryDirectory() as d:
+        path = os.path.join(d, "m.docx")
+        doc = _build(path)
+        xml = zipfile.ZipFile(path).read("word/document.xml").decode()
+    lines = [p for p in doc.paragraphs if p.style.name == "Transcript Line"]
+    assert [p.text for p in lines] == [
+        "10:00:05  [\U0001f3a4 You]  Hello there",
+        "10:00:09  [\U0001f50a Other]  Hi\tback",
+    ]
+    assert [r.style.name for r in lines[0].runs] == ["Transcript Timestamp", "Speaker You", "Transcript Text"]
+    assert lines[1].runs[1].style.name == "Speaker Other"
+    # Formatting comes from the styles, not from each run
+    transcript = xml[xml.index("Hello there") - 600:]
+    assert "<w:sz " not in transcript and "<w:color " not in transcript
+    assert doc.paragraphs[0].style.name == "Meeting Title"
+
+
+def test_each_meeting_starts_from_an_empty_body():
+    with tempfile.TemporaryDirectory() as d:
+        _build(os.path.join(d, "a.docx"), title="First")
+        doc = _build(os.path.join(d, "b.docx"), title="Second", chunks=[])
+    texts = [p.text for p in doc.paragraphs]
+    assert texts[0] == "Second"
+    assert "First" not in texts
+    assert not any(p.style.name == "Transcript Line" for p in doc.paragraphs)
+
+
+def test_transcript_text_is_escaped_and_broken_like_python_docx():
+    with tempfile.TemporaryDirectory() as d:
+        path = os.path.join(d, "m.docx")
+        doc = _build(path, chunks=[
+            {"source": "system", "text": "a < b & \"c\"\x07", "start_timestamp": "bad"},
+            {"source": "system", "text": "one\ntwo", "start_timestamp": "2026-01-15T10:00:09Z"},
+            {"source": "system", "text": "   ", "start_timestamp": "2026-01-15T10:00:10Z"},
+        ])
+    lines = [p.text for p in doc.paragraphs if p.style.name == "Transcript Line"]
+    assert lines == [
+        "??:??:??  [\U0001f50a Other]  a < b & \"c\"",
+        "10:00:09  [\U0001f50a Other]  one\ntwo",
+    ]
+    assert doc.paragraphs[-1].text == lines[-1]  # transcript comes before the body's sectPr
@@ -0,0 +1,505 @@
+"""Tests for the export orchestrator."""
+
+import json
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+from unittest import mock
+
+from granola_sync import config, exporter, markdown_builder, text_builder, tracing
+from granola_sync.api_cache import ResponseCache
+
+
+def _setup(d: str, docs: int = 6, fmt: str = "md") -> dict:
+    state = {
+        "documents": {
+            f"doc{i}": {"title": f"Meeting {i}", "created_at": f"2026-01-{10 + i:02d}T10:00:00Z"}
+            for i in range(docs)
+        },
+        "transcripts": {}, "documentPanels": {}, "meetingsMetadata": {},
+    }
+    cache_path = Path(d) / "cache-v4.json"
+    cache_path.write_text(json.dumps({"cache": {"state": state}}))
+    drive = Path(d) / "drive"
+    drive.mkdir()
+    cfg = dict(config.DEFAULTS)
+    cfg.update({
+        "drive_path": str(drive),
+        "granola_cache_path": str(cache_path),
+        "manifest_path": str(Path(d) / "manifest.json"),
+        "export_format": fmt,
+        "notifications_enabled": False,
+        "api_workers": 4,
+    })
+    return cfg
+
+
+class _FakeApi:
+    """Slow fake API that records how many requests overlap."""
+
+    def __init__(self, fail_ids=(), empty=False):
+        self.lock = threading.Lock()
+        self.active = 0
+        self.peak = 0
+        self.calls = 0
+        self.fail_ids = set(fail_ids)
+        self.empty = empty
+
+    def _call(self, doc_id):
+        with self.lock:
+            self.calls += 1
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(0.05)
+        with self.lock:
+            self.active -= 1
+        if doc_id in self.fail_ids:
+            raise ValueError("bad payload")
+
+    def panels(self, doc_id, token, api_url=None, **kwargs):
+        self._call(doc_id)
+        if self.empty:
+            return [{"title": "Notes", "original_content": ""}]
+        return [{"title": "Summary", "original_content": f"<p>{doc_id}</p>"}]
+
+    def transcript(self, doc_id, token, api_url=None, **kwargs):
+        self._call(doc_id)
+        if self.empty:
+            return []
+        return [{"source": "microphone", "text": "hi", "start_timestamp": "2026-01-10T10:00:00Z"}]
+
+
+def _run(cfg, api, store=None, **kwargs):
+    with mock.patch.object(exporter, "get_access_token", return_value="token"), \
+         mock.patch.object(exporter, "response_cache", return_value=store), \
+         mock.patch.object(exporter, "fetch_panels", api.panels), \
+         mock.patch.object(exporter, "fetch_transcript", api.transcript):
+        return exporter.run_export(cfg, **kwargs)
+
+
+def test_api_fallback_runs_concurrently():
+    with tempfile.TemporaryDirectory() as d:
+        cfg = _setup(d)
+        api = _FakeApi()
+        result = _run(cfg, api)
+        files = sorted(os.listdir(cfg["drive_path"]))
+        content = Path(cfg["drive_path"], files[0]).read_text()
+    assert result.success
+    assert result.exported == 6
+    assert result.api_fetched == 6
+    assert 1 < api.peak <= 4
+    assert "doc0" in content
+
+
+def test_api_fallback_errors_are_recorded():
+    with tempfile.TemporaryDirectory() as d:
+        cfg = _setup(d, docs=3)
+        result = _run(cfg, _FakeApi(fail_ids={"doc1"}))
+    assert not result.success
+    assert len(result.errors) == 2  # panels and transcript for doc1
+    assert all("Meeting 1" in e for e in result.errors)
+    # doc1 had nothing else to export
+    assert result.exported == 2
+    assert result.skipped == 1
+
+
+def test_already_exported_docs_skip_the_api():
+    with tempfile.TemporaryDirectory() as d:
+        cfg = _setup(d, docs=2)
+        _run(cfg, _FakeApi())
+        api = _FakeApi()
+        result = _run(cfg, api)
+    assert result.exported == 0
+    assert result.skipped == 2
+    assert api.peak == 0
+
+
+def test_known_empty_docs_are_not_refetched():
+    with tempfile.TemporaryDirectory() as d:
+        cfg = _setup(d, docs=2)
+        store = ResponseCache(os.path.join(d, "api-cache.sqlite3"))
+        first = _run(cfg, _FakeApi(empty=True), store)
+        again = _FakeApi(empty=True)
+        second = _run(cfg, again, store)
+        recheck = _FakeApi()
+        third = _run(cfg, recheck, store, recheck_empty=True)
+        remaining = store.known_empty(["doc0", "doc1"])
+        store.close()
+    assert first.skipped == second.skipped == 2
+    assert again.calls == 0
+    assert recheck.calls == 4
+    assert third.exported == 2
+    assert remaining == set()
+
+
+def test_known_empty_does_not_depend_on_the_response_cache():
+    with tempfile.TemporaryDirectory() as d:
+        cfg = _setup(d, docs=2)
+        cfg["api_cache_enabled"] = False
+        store = ResponseCache(os.path.join(d, "api-cache.sqlite3"))
+        _run(cfg, _FakeApi(empty=True), store)
+        again = _FakeApi(empty=True)
+        second = _run(cfg, again, store)
+        store.close()
+    assert again.calls == 0
+    assert second.skipped == 2
+
+
+def test_failed_requests_are_not_marked_empty():
+    with tempfile.TemporaryDirectory() as d:
+        cfg = _setup(d, docs=2)
+        store = ResponseCache(os.path.join(d, "api-cache.sqlite3"))
+        _run(cfg, _FakeApi(fail_ids={"doc1"}, empty=True), store)
+        marked = store.known_empty(["doc0", "doc1"])
+        store.close()
+    assert marked == {"doc0"}
+
+
+class _NoSummaryApi(_FakeApi):
+    """Has a transcript but no summary (yet)."""
+
+    def panels(self, doc_id, token, api_url=None, **kwargs):
+        self._call(doc_id)
+        return []
+
+
+def test_summary_added_later_is_picked_up():
+    with tempfile.TemporaryDirectory() as d:
+        cfg = _setup(d, docs=2)
+        store = ResponseCache(os.path.join(d, "api-cache.sqlite3"))
+        first = _run(cfg, _NoSummaryApi(), store)
+        before = json.loads(Path(cfg["manifest_path"]).read_text())
+        still_none = _run(cfg, _NoSummaryApi(), store)
+        quiet = _NoSummaryApi()
+        throttled = _run(cfg, quiet, store)
+        later = _run(cfg, _FakeApi(), store, recheck_empty=True)
+        after = json.loads(Path(cfg["manifest_path"]).read_text())
+        content = Path(cfg["drive_path"], "2026-01-10 - Meeting 0.md").read_text()
+        store.close()
+    assert first.exported == 2
+    assert before["doc0"]["summary"] == "none"
+    assert still_none.exported == 0 and still_none.skipped == 2
+    assert quiet.calls == 0 and throttled.skipped == 2
+    assert later.exported == 2
+    assert after["doc0"]["summary"] == "api"
+    assert "## Summary" in content
+
+
+class _EditedSummaryApi(_FakeApi):
+    def panels(self, doc_id, token, api_url=None, **kwargs):
+        self._call(doc_id)
+        return [{"title": "Summary", "original_content": "<p>Rewritten</p>"}]
+
+
+def test_api_only_changes_need_force():
+    # The digest covers the local cache only; a summary the API changed
+    # after export is not noticed without --force (see README)
+    with tempfile.TemporaryDirectory() as d:
+        cfg = _setup(d, docs=1)
+        _run(cfg, _FakeApi())
+        edited = _EditedSummaryApi()
+        again = _run(cfg, edited)
+        forced = _run(cfg, _EditedSummaryApi(), force=True)
+        content = Path(cfg["drive_path"], "2026-01-10 - Meeting 0.md").read_text()
+    assert again.exported == 0 and again.skipped == 1
+    assert edited.calls == 0
+    assert forced.exported == 1
+    assert "Rewritten" in content
+
+
+def test_renamed_meeting_drops_a_parenthesised_title():
+    with tempfile.TemporaryDirectory() as d:
+        cfg = _setup(d, docs=1)
+        _edit(cfg, "doc0", title="Sync (Q3)")
+        _run(cfg, _FakeApi())
+        _edit(cfg, "doc0", title="Sync")
+        result = _run(cfg, _FakeApi())
+        files = os.listdir(cfg["drive_path"])
+    assert result.files == ["2026-01-10 - Sync.md"]
+    assert files == ["2026-01-10 - Sync.md"]
+
+
+def test_several_formats_in_one_run_and_backfill():
+    with tempfile.TemporaryDirectory() as d:
+        cfg = _setup(d, docs=3)
+        _run(cfg, _FakeApi())
+        md_mtimes = {n: os.stat(os.path.join(cfg["drive_path"], n)).st_mtime_ns
+                     for n in os.listdir(cfg["drive_path"])}
+
+        cfg["export_format"] = ["md", "txt"]
+        api = _FakeApi()
+        with mock.patch.object(exporter, "build_meeting", wraps=exporter.build_meeting) as build:
+            backfill = _run(cfg, api)
+        files = sorted(os.listdir(cfg["drive_path"]))
+        unchanged = all(os.stat(os.path.join(cfg["drive_path"], n)).st_mtime_ns == t
+                        for n, t in md_mtimes.items())
+        manifest = json.loads(Path(cfg["manifest_path"]).read_text())
+        again = _run(cfg, _FakeApi())
+        with mock.patch.object(exporter, "build_meeting", wraps=exporter.build_meeting) as build_both:
+            both = _run(cfg, _FakeApi(), force=True)
+    assert backfill.exported == 3 and build.call_count == 3
+    assert all(f.endswith(".txt") for f in backfill.files)
+    assert unchanged
+    assert len(files) == 6
+    entry = manifest["doc0"]
+    assert entry["filename"].endswith(".md")
+    assert {fmt: os.path.splitext(e["filename"])[1] for fmt, e in entry["formats"].items()} == \
+        {"md": ".md", "txt": ".txt"}
+    assert again.exported == 0 and again.skipped == 3
+    # Each meeting is prepared once for both formats (and nothing changed)
+    assert build_both.call_count == 3 and both.unchanged == 3
+
+
+def test_identical_output_is_not_rewritten():
+    with tempfile.TemporaryDirectory() as d:
+        cfg = _setup(d, docs=3, fmt="docx")
+        _run(cfg, _FakeApi())
+        drive = cfg["drive_path"]
+        mtimes = {n: os.stat(os.path.join(drive, n)).st_mtime_ns for n in os.listdir(drive)}
+        forced = _run(cfg, _FakeApi(), force=True)
+        untouched = {n: os.stat(os.path.join(drive, n)).st_mtime_ns for n in os.listdir(drive)} == mtimes
+
+        # A changed meeting is rewritten; the others are left alone
+        cache = json.loads(Path(cfg["granola_cache_path"]).read_text())
+        cache["cache"]["state"]["documents"]["doc1"]["notes_markdown"] = "- new note"
+        Path(cfg["granola_cache_path"]).write_text(json.dumps(cache))
+        changed = _run(cfg, _FakeApi(), force=True)
+        manifest = json.loads(Path(cfg["manifest_path"]).read_text())
+    assert forced.exported == 0 and forced.unchanged == 3 and forced.files == []
+    assert untouched
+    assert "re-rendered unchanged" in forced.message
+    assert changed.exported == 1 and changed.unchanged == 2
+    assert changed.files == [manifest["doc1"]["filename"]]
+    assert len(manifest["doc1"]["formats"]["docx"]["content"]) == 64
+
+
+def test_a_failed_format_keeps_the_ones_that_landed():
+    with tempfile.TemporaryDirectory() as d:
+        cfg = _setup(d, docs=1)
+        cfg["export_format"] = ["md", "txt"]
+        with mock.patch.object(text_builder, "render_txt", side_effect=OSError("disk full")):
+            failed = _run(cfg, _FakeApi())
+        manifest = json.loads(Path(cfg["manifest_path"]).read_text())
+        retried = _run(cfg, _FakeApi())
+        files = sorted(os.listdir(cfg["drive_path"]))
+    assert not failed.success
+    assert failed.errors == ["2026-01-10 - Meeting 0.txt: disk full"]
+    assert failed.files == ["2026-01-10 - Meeting 0.md"]
+    assert list(manifest["doc0"]["formats"]) == ["md"]
+    assert retried.success and retried.files == ["2026-01-10 - Meeting 0.txt"]
+    assert files == ["2026-01-10 - Meeting 0.md", "2026-01-10 - Meeting 0.txt"]
+
+
+def test_parallel_render_matches_serial():
+    outputs = {}
+    for jobs in (1, 2):
+        with tempfile.TemporaryDirectory() as d:
+            cfg = _setup(d, docs=4, fmt="md")
+            # Two meetings with the same title and date must not collide
+            state = json.loads(Path(cfg["granola_cache_path"]).read_text())
+            state["cache"]["state"]["documents"]["doc3"] = {
+                "title": "Meeting 0", "created_at": "2026-01-10T15:00:00Z"}
+            Path(cfg["granola_cache_path"]).write_text(json.dumps(state))
+            result = _run(cfg, _FakeApi(), jobs=jobs)
+            manifest = json.loads(Path(cfg["manifest_path"]).read_text())
+            outputs[jobs] = (
+                result.exported,
+                result.files,
+                {doc_id: entry["filename"] for doc_id, entry in manifest.items()},
+                {f: Path(cfg["drive_path"], f).read_text() for f in os.listdir(cfg["drive_path"])},
+            )
+    assert outputs[1] == outputs[2]
+    assert outputs[2][0] == 4
+    assert "2026-01-10 - Meeting 0 (2).md" in outputs[2][1]
+
+
+def _edit(cfg, doc_id, **fields):
+    data = json.loads(Path(cfg["granola_cache_path"]).read_text())
+    data["cache"]["state"]["documents"][doc_id].update(fields)
+    Path(cfg["granola_cache_path"]).write_text(json.dumps(data))
+
+
+def test_edited_meetings_are_rerendered_in_place():
+    with tempfile.TemporaryDirectory() as d:
+        cfg = _setup(d, docs=3)
+        _run(cfg, _FakeApi())
+        _edit(cfg, "doc1", notes_markdown="- follow up")
+        result = _run(cfg, _FakeApi())
+        content = Path(cfg["drive_path"], "2026-01-11 - Meeting 1.md").read_text()
+        files = sorted(os.listdir(cfg["drive_path"]))
+    assert result.exported == 1
+    assert result.skipped == 2
+    assert result.files == ["2026-01-11 - Meeting 1.md"]
+    assert "follow up" in content
+    assert len(files) == 3
+
+
+def test_renamed_meeting_replaces_old_file():
+    with tempfile.TemporaryDirectory() as d:
+        cfg = _setup(d, docs=2)
+        _run(cfg, _FakeApi())
+        _edit(cfg, "doc0", title="Kickoff")
+        _run(cfg, _FakeApi())
+        files = sorted(os.listdir(cfg["drive_path"]))
+        manifest = json.loads(Path(cfg["manifest_path"]).read_text())
+    assert files == ["2026-01-10 - Kickoff.md", "2026-01-11 - Meeting 1.md"]
+    assert manifest["doc0"]["filename"] == "2026-01-10 - Kickoff.md"
+
+
+def test_filename_collisions_resolved_without_stat_calls():
+    with tempfile.TemporaryDirectory() as d:
+        cfg = _setup(d, docs=3)
+        _edit(cfg, "doc1", title="Meeting 0", created_at="2026-01-10T12:00:00Z")
+        Path(cfg["drive_path"], "2026-01-10 - Meeting 0.md").write_text("someone else's")
+        exists = os.path.exists
+        with mock.patch("os.path.exists", side_effect=exists) as spy:
+            result = _run(cfg, _FakeApi())
+        in_drive = [c for c in spy.call_args_list if str(c.args[0]).startswith(cfg["drive_path"])]
+    assert in_drive == []
+    assert sorted(result.files) == [
+        "2026-01-10 - Meeting 0 (2).md", "2026-01-10 - Meeting 0 (3).md", "2026-01-12 - Meeting 2.md"]
+
+
+def test_legacy_entries_adopt_digest_without_rerender():
+    with tempfile.TemporaryDirectory() as d:
+        cfg = _setup(d, docs=2)
+        Path(cfg["manifest_path"]).write_text(json.dumps({
+            f"doc{i}": {"filename": f"old{i}.md", "exported_at": "2025-01-01T00:00:00"} for i in range(2)
+        }))
+        api = _FakeApi()
+        result = _run(cfg, api)
+        manifest = json.loads(Path(cfg["manifest_path"]).read_text())
+    assert result.exported == 0
+    assert api.calls == 0
+    assert all(len(entry["digest"]) == 64 for entry in manifest.values())
+    assert manifest["doc0"]["filename"] == "old0.md"
+
+
+def test_interrupted_run_resumes_where_it_stopped():
+    with tempfile.TemporaryDirectory() as d:
+        cfg = _setup(d, docs=5)
+        real_md = markdown_builder.render_md
+        calls = []
+
+        def crash_on_fourth(meeting, filepath):
+            calls.append(meeting.title)
+            if len(calls) == 4:
+                Path(filepath).write_text("half a fi")
+                raise KeyboardInterrupt
+            real_md(meeting, filepath)
+
+        with mock.patch.object(markdown_builder, "render_md", crash_on_fourth), \
+             mock.patch.object(exporter, "CHECKPOINT_DOCS", 2):
+            try:
+                _run(cfg, _FakeApi())
+            except KeyboardInterrupt:
+                pass
+        checkpointed = json.loads(Path(cfg["manifest_path"]).read_text())
+        files_after_crash = sorted(os.listdir(cfg["drive_path"]))
+
+        api = _FakeApi()
+        result = _run(cfg, api)
+    assert len(checkpointed) == 2
+    # No truncated file was left behind, under any name
+    assert len(files_after_crash) == 3
+    assert result.exported == 2
+    assert result.skipped == 3
+
+
+def test_interrupt_cancels_queued_api_requests():
+    with tempfile.TemporaryDirectory() as d:
+        cfg = _setup(d, docs=40)
+        api = _FakeApi()
+
+        def interrupt(meeting, filepath):
+            raise KeyboardInterrupt
+
+        with mock.patch.object(markdown_builder, "render_md", interrupt):
+            try:
+                _run(cfg, api)
+            except KeyboardInterrupt:
+                pass
+            else:
+                raise AssertionError("KeyboardInterrupt was swallowed")
+        time.sleep(0.1)  # requests already running finish in the background
+    # 80 were queued; only those already running when the first doc failed ran
+    assert api.calls <= 2 * cfg["api_workers"]
+
+
+def test_api_requests_run_a_bounded_window_ahead():
+    with tempfile.TemporaryDirectory() as d:
+        cfg = _setup(d, docs=12)
+        cfg["api_workers"] = 1
+        api = _FakeApi()
+        real_md = markdown_builder.render_md
+        rendered = []
+
+        def slow_render(meeting, filepath):
+            if not rendered:
+                time.sleep(0.5)  # long enough for every request to finish
+            real_md(meeting, filepath)
+            rendered.append(api.calls)
+
+        with mock.patch.object(markdown_builder, "render_md", slow_render):
+            result = _run(cfg, api)
+    assert result.exported == 12
+    # Two requests per doc, submitted at most two docs ahead of the render
+    assert all(calls <= 2 * (i + 2) for i, calls in enumerate(rendered))
+
+
+def test_manifest_is_closed_when_the_run_fails():
+    with tempfile.TemporaryDirectory() as d:
+        cfg = _setup(d, docs=2)
+        opened = []
+        real_load = exporter.load_manifest
+
+        def load(path):
+            opened.append(real_load(path))
+            return opened[-1]
+
+        real_md = markdown_builder.render_md
+        calls = []
+
+        def crash_on_second(meeting, filepath):
+            calls.append(meeting.title)
+            if len(calls) == 2:
+                raise KeyboardInterrupt
+            real_md(meeting, filepath)
+
+        with mock.patch.object(exporter, "load_manifest", load), \
+             mock.patch.object(markdown_builder, "render_md", crash_on_second):
+            try:
+                _run(cfg, _FakeApi())
+            except KeyboardInterrupt:
+                pass
+    assert opened and opened[0]._conn is None
+
+
+def test_timings_break_down_the_run():
+    with tempfile.TemporaryDirectory() as d:
+        cfg = _setup(d, docs=7)
+        result = _run(cfg, _FakeApi())
+    timings = result.to_dict()["timings"]
+    assert {"setup", "cache", "auth", "plan", "api_wait", "render", "write", "manifest", "total"} <= timings.keys()
+    assert timings["total"] >= sum(v for k, v in timings.items() if k != "total") - 0.01
+    assert len(result.slowest) == exporter.SLOWEST_DOCS
+    seconds = [doc["seconds"] for doc in result.slowest]
+    assert seconds == sorted(seconds, reverse=True)
+    assert all(doc["api"] >= 0.05 and "render" in doc and "write" in doc for doc in result.slowest)
+    assert result.timing_summary()[1].endswith(")")
+
+
+def test_trace_covers_cache_api_and_rendering():
+    with tempfile.TemporaryDirectory() as d:
+        cfg = _setup(d, docs=3)
+        trace = os.path.join(d, "trace.json")
+        _run(cfg, _FakeApi(), trace=trace)
+        events = json.loads(Path(trace).read_text())["traceEvents"]
+    names = {e["name"] for e in events if e["ph"] == "X"}
+    assert {"export", "read_cache", "decode", "plan", "api_wait",
+            "build", "parse_html", "save", "write", "manifest"} <= names
+    api = [e for e in events if e.get("cat") == "api"]
+    assert {e["args"]["doc_id"] for e in api} == {"doc0", "doc1", "doc2"}
+    assert not tracing.enabled()
@@ -1,6 +1,10 @@
 """Tests for HTML parser module."""
 
-from granola_sync.html_parser import parse_html_to_elements
+import hashlib
+import json
+import random
+
+from granola_sync.html_parser import HTMLToDocxElements, parse_html_to_blocks, parse_html_to_elements
 
 
 def test_simple_paragraph():
@@ -28,6 +32,17 @@ def test_nested_list_depth():
     assert depths == [1, 2]
 
 
+def test_paragraph_inside_list_item_is_a_bullet():
+    html = "<ul><li><p>Outer</p><ul><li><p>Inner</p></li></ul></li></ul><p>After</p>"
+    assert parse_html_to_elements(html) == [
+        ("bullet", "Outer", 1), ("bullet", "Inner", 2), ("paragraph", "After", 0),
+    ]
+    # A second paragraph in the same item is still a paragraph
+    assert parse_html_to_elements("<ul><li><p>One</p><p>Two</p></li></ul>") == [
+        ("bullet", "One", 1), ("paragraph", "Two", 0),
+    ]
+
+
 def test_skips_chat_link():
     html = "<p>Chat with meeting transcript</p>"
     elements = parse_html_to_elements(html)
@@ -46,3 +61,81 @@ def test_mixed_content():
 def test_empty_html():
     assert parse_html_to_elements("") == []
     assert parse_html_to_elements("<p></p>") == []
+
+
+def test_blocks_keep_bold_and_italic_runs():
+    blocks = parse_html_to_blocks("<p><b>Due</b> <i>Friday, <strong>noon</strong></i></p><p>plain</p>")
+    assert blocks == [
+        ("paragraph", "Due Friday, noon", 0,
+         (("Due", True, False), (" ", False, False), ("Friday, ", False, True), ("noon", True, True))),
+        ("paragraph", "plain", 0, ()),
+    ]
+
+
+def _stdlib_blocks(html: str) -> list[tuple[str, str, int, tuple]]:
+    parser = HTMLToDocxElements()
+    parser.feed(html)
+    parser.close()
+    parser._flush()
+    return parser.blocks
+
+
+# Outputs of the original stdlib-only parser (before lxml), so a change
+# both parsing paths share can't slip through the differential check.
+# One deliberate change since: <li><p> is a bullet, not a paragraph.
+BASELINE_CASES = [
+    ("<h3>Decisions</h3><ul><li><p><strong>Pricing</strong>: keep <em>tiers</em> as is</p>"
+     "<ul><li><p>Revisit in Q3</p></li></ul></li><li>Second</li></ul>",
+     [("heading", "Decisions", 3), ("bullet", "Pricing: keep tiers as is", 1),
+      ("bullet", "Revisit in Q3", 2), ("bullet", "Second", 1)]),
+    ("<p>one<br>two</p><p>A &amp; B&nbsp;&lt;c&gt; &foo;</p>",
+     [("paragraph", "one\ntwo", 0), ("paragraph", "A & B\xa0<c> &foo;", 0)]),
+    ("Loose text <b>bold</b> <i>italic</i><ul><li>a<ul><li>b</li></ul></li></ul>after",
+     [("paragraph", "Loose text bold italic", 0), ("bullet", "a", 1), ("bullet", "b", 2),
+      ("paragraph", "after", 0)]),
+    ("<h1>1</h1><h4>4</h4><h6>six</h6><!-- note -->tail<p>x</p>",
+     [("heading", "1", 1), ("heading", "4", 4), ("paragraph", "sixtail", 0), ("paragraph", "x", 0)]),
+    ("<ul><li><p>Chat with meeting transcript: <a href='https://example.com'>link</a></p></li></ul>", []),
+    ("</ul></ul><li>orphan</li><p>unclosed<li>item",
+     [("bullet", "orphan", 0), ("paragraph", "unclosed", 0), ("bullet", "item", 0)]),
+    ("<table><tr><td>cell</td></tr></table><script>var x = 1</script>",
+     [("paragraph", "cellvar x = 1", 0)]),
+    ("<ul><li>x</li>\n  <li>y</li></ul>", [("bullet", "x", 1), ("bullet", "y", 1)]),
+    ("   \n ", []),
+]
+
+# SHA-256 of the expected output for _fuzz_cases(), as JSON: the original
+# parser's, with <li><p> as a bullet
+BASELINE_FUZZ_DIGEST = "cbe0efc94b42f3183e28f16ca7d234d0f2b751b875efdd6fd54c9f62ec00c82c"
+
+
+def _fuzz_cases() -> list[str]:
+    rng = random.Random(0)
+    words = ["alpha", "beta", "a&amp;b", "x<br>y", "<strong>bold</strong>", "<em>it</em>"]
+    cases = []
+    for _ in range(200):
+        parts = []
+        for _ in range(rng.randint(1, 8)):
+            text = " ".join(rng.choice(words) for _ in range(rng.randint(1, 6)))
+            level = rng.randint(1, 5)
+            parts.append(rng.choice([
+                f"<h{level}>{text}</h{level}>",
+                f"<p>{text}</p>",
+                f"<ul><li><p>{text}</p><ul><li>{text}</li></ul></li></ul>",
+                f"<ul><li>{text}</li><ul><li>{text}</li></ul></ul>",
+            ]))
+        cases.append("".join(parts))
+    return cases
+
+
+def test_both_paths_match_the_original_parser():
+    for html, expected in BASELINE_CASES:
+        assert parse_html_to_elements(html) == expected, html
+        assert [b[:3] for b in _stdlib_blocks(html)] == expected, html
+    outputs = [parse_html_to_elements(html) for html in _fuzz_cases()]
+    assert hashlib.sha256(json.dumps(outputs).encode()).hexdigest() == BASELINE_FUZZ_DIGEST
+
+
+def test_lxml_path_matches_stdlib_parser():
+    for html in [html for html, _ in BASELINE_CASES] + _fuzz_cases():
+        assert parse_html_to_blocks(html) == _stdlib_blocks(html), html
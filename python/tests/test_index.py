@@ -0,0 +1,134 @@
+"""Tests for the persistent meeting index."""
+
+import json
+import os
+import tempfile
+from pathlib import Path
+from unittest import mock
+
+from granola_sync import config, index
+from granola_sync.cache import get_meeting_detail, list_meetings, load_cache
+from granola_sync.stats import compute_stats
+
+
+def _state():
+    return {
+        "documents": {
+            "doc1": {"title": "Standup", "created_at": "2026-01-15T10:00:00Z", "notes_markdown": "- a"},
+            "doc2": {"title": "Review", "created_at": "2026-01-16T14:00:00Z"},
+        },
+        "transcripts": {
+            "doc1": [
+                {"start_timestamp": "2026-01-15T10:00:00Z", "source": "microphone", "text": "hi"},
+                {"start_timestamp": "2026-01-15T10:30:00Z", "source": "system", "text": "bye"},
+            ],
+        },
+        "documentPanels": {"doc2": {"p": {"title": "Summary", "original_content": "<p>x</p>"}}},
+        "meetingsMetadata": {
+            "doc1": {"attendees": [{"email": "bob@test.com",
+                                    "details": {"person": {"name": {"fullName": "Bob"}}}}]},
+        },
+    }
+
+
+def _write(path: str, state: dict) -> None:
+    Path(path).write_text(json.dumps({"cache": {"state": state}}))
+    # Make sure a rewrite within the same mtime tick still looks different
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+
+def _cfg(d: str) -> dict:
+    cfg = dict(config.DEFAULTS)
+    cfg["granola_cache_path"] = str(Path(d) / "cache-v4.json")
+    cfg["index_path"] = str(Path(d) / "index.sqlite3")
+    cfg["manifest_path"] = str(Path(d) / "manifest.json")
+    cfg["drive_path"] = d
+    return cfg
+
+
+def test_index_matches_cache_listing():
+    with tempfile.TemporaryDirectory() as d:
+        cfg = _cfg(d)
+        _write(cfg["granola_cache_path"], _state())
+        manifest = {"doc2": {"filename": "Review.docx", "exported_at": "2026-01-17"}}
+        expected = list_meetings(load_cache(cfg["granola_cache_path"]), manifest)
+        assert index.list_meetings(cfg, manifest) == expected
+
+
+def test_unchanged_cache_is_not_reparsed():
+    with tempfile.TemporaryDirectory() as d:
+        cfg = _cfg(d)
+        _write(cfg["granola_cache_path"], _state())
+        assert index.document_count(cfg) == 2
+        with mock.patch.object(index, "load_cache", side_effect=AssertionError("reparsed")):
+            assert len(index.list_meetings(cfg)) == 2
+
+
+def test_refresh_only_rebuilds_changed_documents():
+    with tempfile.TemporaryDirectory() as d:
+        cfg = _cfg(d)
+        state = _state()
+        _write(cfg["granola_cache_path"], state)
+        idx = index.MeetingIndex(cfg["index_path"], cfg["granola_cache_path"])
+        assert sorted(idx.refresh()) == ["doc1", "doc2"]
+
+        state["documents"]["doc2"]["title"] = "Review (edited)"
+        state["documents"]["doc3"] = {"title": "New", "created_at": "2026-01-17T09:00:00Z"}
+        del state["documents"]["doc1"]
+        _write(cfg["granola_cache_path"], state)
+        assert sorted(idx.refresh()) == ["doc2", "doc3"]
+        assert idx.refresh() == []
+
+        titles = {m["doc_id"]: m["title"] for m in idx.summaries()}
+        idx.close()
+    assert titles == {"doc2": "Review (edited)", "doc3": "New"}
+
+
+def test_stats_from_index():
+    with tempfile.TemporaryDirectory() as d:
+        cfg = _cfg(d)
+        _write(cfg["granola_cache_path"], _state())
+        with mock.patch.object(config, "CONFIG_PATH", Path(d) / "config.json"):
+            stats = compute_stats(cfg=cfg)
+    assert stats["total_meetings"] == 2
+    assert stats["top_attendees"] == [{"name": "Bob", "count": 1}]
+    assert stats["total_duration_hours"] == 0.5
+
+
+def test_show_reads_only_the_document_bytes():
+    with tempfile.TemporaryDirectory() as d:
+        cfg = _cfg(d)
+        _write(cfg["granola_cache_path"], _state())
+        expected = get_meeting_detail(load_cache(cfg["granola_cache_path"]), "doc1")
+        index.document_count(cfg)
+        with mock.patch.object(index, "load_cache", side_effect=AssertionError("reparsed")):
+            assert index.get_meeting_detail(cfg, "doc1") == expected
+            assert index.get_meeting_detail(cfg, "missing") is None
+
+
+def test_show_falls_back_when_file_changes_underneath():
+    with tempfile.TemporaryDirectory() as d:
+        cfg = _cfg(d)
+        state = _state()
+        _write(cfg["granola_cache_path"], state)
+        idx = index.MeetingIndex(cfg["index_path"], cfg["granola_cache_path"])
+        idx.refresh()
+        # Same size and mtime, different bytes: only the digest notices
+        st = os.stat(cfg["granola_cache_path"])
+        state["documents"]["doc1"]["title"] = "Standuq"
+        _write(cfg["granola_cache_path"], state)
+        os.utime(cfg["granola_cache_path"], ns=(st.st_atime_ns, st.st_mtime_ns))
+        assert idx.read_entries("doc1") is None
+        assert idx.read_entries("doc2") is not None
+        idx.close()
+        assert index.get_meeting_detail(cfg, "doc1")["title"] == "Standuq"
+
+
+def test_show_v3_cache_uses_full_parse():
+    with tempfile.TemporaryDirectory() as d:
+        cfg = _cfg(d)
+        Path(cfg["granola_cache_path"]).write_text(json.dumps({"cache": json.dumps({"state": _state()})}))
+        detail = index.get_meeting_detail(cfg, "doc1")
+    assert detail["title"] == "Standup"
+    assert len(detail["transcript"]) == 2
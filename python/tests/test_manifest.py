@@ -1,6 +1,7 @@
 """Tests for manifest module."""
 
 import json
+import os
 import tempfile
 from pathlib import Path
 
@@ -27,3 +28,46 @@ def test_add_entry():
     assert "doc123" in manifest
     assert manifest["doc123"]["filename"] == "test.docx"
     assert "exported_at" in manifest["doc123"]
+
+
+def test_migrates_existing_json():
+    with tempfile.TemporaryDirectory() as d:
+        path = Path(d) / "manifest.json"
+        legacy = {f"doc{i}": {"filename": f"{i}.docx", "exported_at": f"2026-01-0{i + 1}"} for i in range(3)}
+        path.write_text(json.dumps(legacy))
+        manifest = load_manifest(str(path))
+        assert manifest == legacy
+        assert (Path(d) / "manifest.sqlite3").exists()
+        assert manifest.last_exported_at() == "2026-01-03"
+        manifest.close()
+
+
+def test_entries_are_durable_before_save():
+    with tempfile.TemporaryDirectory() as d:
+        path = str(Path(d) / "manifest.json")
+        manifest = load_manifest(path)
+        add_entry(manifest, "doc1", "a.docx")
+        # Another process (or the next run after a crash) already sees it
+        other = load_manifest(path)
+        assert other["doc1"]["filename"] == "a.docx"
+        assert not os.path.exists(path)
+
+        save_manifest(manifest, path)
+        assert json.loads(Path(path).read_text()) == {"doc1": manifest["doc1"]}
+        mtime = os.stat(path).st_mtime_ns
+        save_manifest(manifest, path)  # nothing changed: JSON left alone
+        assert os.stat(path).st_mtime_ns == mtime
+        manifest.close()
+        other.close()
+
+
+def test_entries_are_copies():
+    with tempfile.TemporaryDirectory() as d:
+        path = str(Path(d) / "manifest.json")
+        manifest = load_manifest(path)
+        add_entry(manifest, "doc1", "a.docx")
+        manifest["doc1"]["filename"] = "changed.docx"
+        assert manifest["doc1"]["filename"] == "a.docx"
+        del manifest["doc1"]
+        assert "doc1" not in manifest and len(manifest) == 0
+        manifest.close()
@@ -0,0 +1,80 @@
+"""Tests for the shared meeting representation."""
+
+import os
+import tempfile
+from pathlib import Path
+from unittest import mock
+
+from granola_sync import html_parser
+from granola_sync.docx_builder import render_docx
+from granola_sync.markdown_builder import render_md
+from granola_sync.meeting import build_meeting
+from granola_sync.text_builder import render_txt
+
+
+def _meeting():
+    return build_meeting(
+        title="Planning",
+        date_str="2026-01-15T10:00:00Z",
+        attendees=[{"name": "Ada", "email": "ada@example.com"}, {"email": "grace@example.com"}],
+        summary_html="<h3>Goals</h3><ul><li><strong>Ship</strong> it</li><ul><li>Soon</li></ul></ul>"
+                     "<h4>Risks</h4><p>Mostly <em>fine </em>so far</p>",
+        transcript_chunks=[
+            {"source": "microphone", "text": " Hello ", "start_timestamp": "2026-01-15T10:00:05Z"},
+            {"source": "system", "text": "  ", "start_timestamp": "2026-01-15T10:00:07Z"},
+            {"source": "system", "text": "Hi", "start_timestamp": "garbage"},
+        ],
+        notes_markdown="\n- follow up\n\nLater\n",
+    )
+
+
+def test_build_meeting_parses_once():
+    meeting = _meeting()
+    assert meeting.date.hour == 10
+    assert meeting.attendees == ["Ada", "grace@example.com"]
+    assert meeting.summary == [
+        ("heading", "Goals", 3, ()),
+        ("bullet", "Ship it", 1, (("Ship", True, False), (" it", False, False))),
+        ("bullet", "Soon", 2, ()),
+        ("heading", "Risks", 4, ()),
+        ("paragraph", "Mostly fine so far", 0,
+         (("Mostly ", False, False), ("fine ", False, True), ("so far", False, False))),
+    ]
+    assert meeting.notes == ["- follow up", "", "Later"]
+    assert [(e.time and e.time.second, e.you, e.text) for e in meeting.transcript] == [
+        (5, True, "Hello"), (None, False, "Hi"),
+    ]
+
+
+def test_every_format_renders_from_one_meeting():
+    meeting = _meeting()
+    with tempfile.TemporaryDirectory() as d, \
+            mock.patch.object(html_parser, "parse_html_to_blocks") as parse:
+        render_md(meeting, os.path.join(d, "m.md"))
+        render_txt(meeting, os.path.join(d, "m.txt"))
+        render_docx(meeting, os.path.join(d, "m.docx"))
+        md = Path(d, "m.md").read_text()
+        txt = Path(d, "m.txt").read_text()
+    parse.assert_not_called()
+    assert "## Goals\n\n- **Ship** it\n  - Soon\n\n### Risks\n\nMostly *fine* so far" in md
+    assert "**[10:00] You:** Hello" in md and "**Speaker:** Hi" in md
+    assert "  - Ship it\n    - Soon" in txt and "Mostly fine so far" in txt
+    assert "[10:00] You: Hello\nSpeaker: Hi" in txt
+
+
+def test_coalesce_merges_a_speakers_consecutive_chunks():
+    def chunk(source, text, start, end):
+        return {"source": source, "text": text,
+                "start_timestamp": f"2026-01-15T10:00:{start:02d}Z", "end_timestamp": f"2026-01-15T10:00:{end:02d}Z"}
+
+    chunks = [
+        chunk("microphone", "One", 0, 2), chunk("microphone", "two", 3, 5),
+        chunk("microphone", "", 5, 6),  # empty chunks don't break a run
+        chunk("microphone", "three", 6, 8), chunk("microphone", "late", 20, 22),
+        chunk("system", "Reply", 22, 24), chunk("microphone", "Back", 24, 25),
+    ]
+    meeting = build_meeting("Planning", "", [], "", chunks, coalesce_seconds=3)
+    assert [(e.time.second, e.you, e.text) for e in meeting.transcript] == [
+        (0, True, "One two three"), (20, True, "late"), (22, False, "Reply"), (24, True, "Back"),
+    ]
+    assert len(build_meeting("Planning", "", [], "", chunks).transcript) == 6
@@ -0,0 +1,152 @@
+"""Tests for the JSON-RPC daemon."""
+
+import io
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from unittest import mock
+
+from granola_sync import api, config, index
+from granola_sync.server import Server
+
+
+def _setup(d: str) -> dict:
+    state = {
+        "documents": {
+            "doc1": {"title": "Standup", "created_at": "2026-01-15T10:00:00Z", "notes_markdown": "- a"},
+            "doc2": {"title": "Review", "created_at": "2026-01-16T14:00:00Z", "notes_markdown": "- b"},
+        },
+        "transcripts": {}, "documentPanels": {}, "meetingsMetadata": {},
+    }
+    cfg = dict(config.DEFAULTS)
+    cfg.update({
+        "granola_cache_path": str(Path(d) / "cache-v4.json"),
+        "index_path": str(Path(d) / "index.sqlite3"),
+        "manifest_path": str(Path(d) / "manifest.json"),
+        "granola_auth_path": str(Path(d) / "supabase.json"),
+        "drive_path": d,
+    })
+    Path(cfg["granola_cache_path"]).write_text(json.dumps({"cache": {"state": state}}))
+    Path(d, "config.json").write_text(json.dumps(cfg))
+    return cfg
+
+
+def _call(server: Server, *requests) -> list:
+    rfile = io.StringIO("".join(json.dumps(r) + "\n" if not isinstance(r, str) else r for r in requests))
+    wfile = io.StringIO()
+    server.serve(rfile, wfile)
+    return [json.loads(line) for line in wfile.getvalue().splitlines()]
+
+
+def test_methods_and_errors():
+    with tempfile.TemporaryDirectory() as d:
+        _setup(d)
+        with mock.patch.object(config, "CONFIG_PATH", Path(d) / "config.json"):
+            server = Server()
+            responses = _call(
+                server,
+                {"jsonrpc": "2.0", "id": 1, "method": "list", "params": {"sort": "title"}},
+                {"jsonrpc": "2.0", "id": 2, "method": "show", "params": {"doc_id": "doc1"}},
+                {"jsonrpc": "2.0", "id": 3, "method": "show", "params": {"doc_id": "nope"}},
+                {"jsonrpc": "2.0", "id": 4, "method": "frobnicate"},
+                {"jsonrpc": "2.0", "id": 5, "method": "list", "params": {"bogus": 1}},
+                "{not json\n",
+                {"jsonrpc": "2.0", "method": "ping"},
+                {"jsonrpc": "2.0", "id": 6, "method": "stats"},
+                {"jsonrpc": "2.0", "id": 7, "method": "export"},
+            )
+            server.close()
+    assert [r["id"] for r in responses] == [1, 2, 3, 4, 5, None, 6, 7]
+    assert [m["title"] for m in responses[0]["result"]] == ["Review", "Standup"]
+    assert responses[1]["result"]["notes_markdown"] == "- a"
+    assert responses[2]["error"]["message"] == "Meeting not found: nope"
+    assert responses[3]["error"]["code"] == -32601
+    assert responses[4]["error"]["code"] == -32602
+    assert responses[5]["error"]["code"] == -32700
+    assert responses[6]["result"]["total_meetings"] == 2
+    # Exports run as their own process, not in the daemon
+    assert responses[7]["error"]["code"] == -32601
+
+
+def test_errors_inside_a_method_are_internal():
+    with tempfile.TemporaryDirectory() as d:
+        _setup(d)
+        with mock.patch.object(config, "CONFIG_PATH", Path(d) / "config.json"), \
+             mock.patch("granola_sync.commands.sync_status", side_effect=TypeError("bad state")):
+            server = Server()
+            [broken, bad_params] = _call(
+                server,
+                {"jsonrpc": "2.0", "id": 1, "method": "status"},
+                {"jsonrpc": "2.0", "id": 2, "method": "show", "params": {}},
+            )
+            server.close()
+    assert broken["error"] == {"code": -32603, "message": "TypeError: bad state"}
+    assert bad_params["error"]["code"] == -32602
+
+
+def test_state_is_reused_until_files_change():
+    with tempfile.TemporaryDirectory() as d:
+        cfg = _setup(d)
+        list_req = {"jsonrpc": "2.0", "id": 1, "method": "list"}
+        with mock.patch.object(config, "CONFIG_PATH", Path(d) / "config.json"):
+            server = Server()
+            _call(server, list_req)
+            with mock.patch.object(index, "load_cache", side_effect=AssertionError("reparsed")), \
+                 mock.patch("granola_sync.server.load_manifest", side_effect=AssertionError("reloaded")):
+                _call(server, list_req, list_req)
+
+            Path(cfg["manifest_path"]).write_text(json.dumps(
+                {"doc2": {"filename": "Review.md", "exported_at": "2026-01-17"}}))
+            [response] = _call(server, list_req)
+            server.close()
+    exported = {m["doc_id"]: m["is_exported"] for m in response["result"]}
+    assert exported == {"doc1": False, "doc2": True}
+
+
+def test_config_edit_rebuilds_the_api_client():
+    with tempfile.TemporaryDirectory() as d:
+        cfg = _setup(d)
+        cfg["api_cache_enabled"] = False
+        Path(d, "config.json").write_text(json.dumps(cfg))
+        list_req = {"jsonrpc": "2.0", "id": 1, "method": "list"}
+        with mock.patch.object(config, "CONFIG_PATH", Path(d) / "config.json"):
+            server = Server()
+            _call(server, list_req)
+            before = api.get_client(server.cfg)
+            _call(server, list_req)
+            kept = api.get_client(server.cfg)
+            cfg["api_workers"] = 2
+            Path(d, "config.json").write_text(json.dumps(cfg, indent=1))
+            _call(server, list_req)
+            after = api.get_client(server.cfg)
+            server.close()
+            api.reset_client()
+    assert kept is before
+    assert after is not before
+    assert after.session.adapters["https://"]._pool_maxsize == 2
+
+
+def test_serve_subcommand_over_stdio():
+    with tempfile.TemporaryDirectory() as d:
+        config_dir = Path(d, "Library", "Application Support", "GranolaSync")
+        config_dir.mkdir(parents=True)
+        cfg = _setup(d)
+        os.replace(Path(d, "config.json"), config_dir / "config.json")
+        requests = "".join(json.dumps(r) + "\n" for r in [
+            {"jsonrpc": "2.0", "id": 1, "method": "ping"},
+            {"jsonrpc": "2.0", "id": 2, "method": "list"},
+            {"jsonrpc": "2.0", "id": 3, "method": "shutdown"},
+        ])
+        proc = subprocess.run(
+            [sys.executable, "-c", "from granola_sync.cli import main; main()", "serve"],
+            input=requests, capture_output=True, text=True, timeout=60,
+            env={**os.environ, "HOME": d},
+        )
+    responses = [json.loads(line) for line in proc.stdout.splitlines()]
+    assert proc.returncode == 0, proc.stderr
+    assert responses[0]["result"] == "pong"
+    assert len(responses[1]["result"]) == 2
+    assert responses[2]["result"] is None
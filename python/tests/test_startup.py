@@ -0,0 +1,62 @@
+"""Startup cost of CLI commands: what they import."""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+# Heavy dependencies no command loads unless it needs them. Timing
+# budgets live in benchmarks/bench_startup.py --check.
+HEAVY = ("docx", "lxml", "requests")
+
+
+def _setup(home: str) -> None:
+    state = {
+        "documents": {
+            "doc1": {"title": "Standup", "created_at": "2026-01-15T10:00:00Z", "notes_markdown": "- a"},
+        },
+        "transcripts": {}, "documentPanels": {}, "meetingsMetadata": {},
+    }
+    Path(home, "cache-v4.json").write_text(json.dumps({"cache": {"state": state}}))
+    Path(home, "drive").mkdir()
+    config_dir = Path(home, "Library", "Application Support", "GranolaSync")
+    config_dir.mkdir(parents=True)
+    (config_dir / "config.json").write_text(json.dumps({
+        "granola_cache_path": str(Path(home, "cache-v4.json")),
+        "drive_path": str(Path(home, "drive")),
+        "export_format": "md",
+        "notifications_enabled": False,
+    }))
+
+
+def imported_modules(home: str, *args: str) -> set:
+    """Run a CLI command under -X importtime; returns the modules it imported."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "from granola_sync.cli import main; main()", *args],
+        capture_output=True, text=True, timeout=60, env={**os.environ, "HOME": home},
+    )
+    assert proc.returncode == 0, proc.stderr
+    return {line.split("|")[2].strip() for line in proc.stderr.splitlines() if line.startswith("import time:")}
+
+
+@pytest.fixture(scope="module")
+def home():
+    with tempfile.TemporaryDirectory() as d:
+        _setup(d)
+        yield d
+
+
+@pytest.mark.parametrize("args", [
+    ["list", "--json"],
+    ["status", "--json"],
+    ["show", "doc1", "--json"],
+    ["stats", "--json"],
+    ["export", "--json"],
+])
+def test_commands_import_only_what_they_use(home, args):
+    modules = imported_modules(home, *args)
+    assert not {m for m in modules if m.split(".")[0] in HEAVY}
@@ -0,0 +1,53 @@
+"""Tests for tracing module."""
+
+import json
+import os
+import tempfile
+import threading
+
+import pytest
+
+from granola_sync import tracing
+
+
+def test_spans_are_free_when_tracing_is_off():
+    assert not tracing.enabled()
+    assert tracing.span("a") is tracing.span("b", x=1)
+    with tracing.span("a"):
+        tracing.record("b", 0.0, 1.0)
+    assert tracing.stop() == []
+
+
+def test_spans_nest_and_name_threads():
+    tracing.start()
+    with tracing.span("outer", doc_id="d1"):
+        with tracing.span("inner"):
+            pass
+        worker = threading.Thread(target=lambda: tracing.record("api", 1.0, 1.5), name="api-0")
+        worker.start()
+        worker.join()
+    with pytest.raises(ValueError), tracing.span("fails"):
+        raise ValueError
+    events = tracing.stop()
+
+    spans = {e["name"]: e for e in events if e["ph"] == "X"}
+    outer, inner = spans["outer"], spans["inner"]
+    assert outer["args"] == {"doc_id": "d1"}
+    assert outer["ts"] <= inner["ts"] and inner["ts"] + inner["dur"] <= outer["ts"] + outer["dur"]
+    assert spans["api"]["ts"] == 1e6 and spans["api"]["dur"] == 0.5e6
+    assert spans["fails"]["args"] == {"error": "ValueError"}
+    threads = {e["args"]["name"] for e in events if e["ph"] == "M"}
+    assert {"MainThread", "api-0"} <= threads
+    assert not tracing.enabled()
+
+
+def test_write_produces_trace_event_json():
+    tracing.start()
+    with tracing.span("x"):
+        pass
+    with tempfile.TemporaryDirectory() as d:
+        path = os.path.join(d, "trace.json")
+        tracing.write(path, tracing.stop())
+        with open(path) as f:
+            data = json.load(f)
+    assert data["traceEvents"][0]["name"] == "x"
@@ -2,8 +2,9 @@
 
 import os
 import tempfile
+from unittest import mock
 
-from granola_sync.utils import safe_filename, unique_filename
+from granola_sync.utils import file_digest, safe_filename, staged_file, unique_filename
 
 
 def test_safe_filename_removes_bad_chars():
@@ -43,3 +44,63 @@ def test_unique_filename_multiple_conflicts():
         open(os.path.join(d, "test (2).docx"), "w").close()
         result = unique_filename(d, "test", ".docx")
         assert result == "test (3).docx"
+
+
+def test_unique_filename_from_listing_makes_no_fs_calls():
+    existing = {"test.docx", "test (2).docx"}
+    with mock.patch("os.path.exists", side_effect=AssertionError("fs call")):
+        assert unique_filename("/nowhere", "test", ".docx", existing) == "test (3).docx"
+
+
+def test_unique_filename_fallback_probes_listing():
+    existing = {"test.docx"} | {f"test ({i}).docx" for i in range(2, 100)}
+    first = unique_filename("/nowhere", "test", ".docx", existing)
+    assert first not in existing
+    assert unique_filename("/nowhere", "test", ".docx", existing | {first}) != first
+
+
+def test_staged_file_leaves_identical_content_in_place():
+    with tempfile.TemporaryDirectory() as d:
+        path = os.path.join(d, "m.md")
+        with staged_file(path) as first:
+            with open(first.path, "w") as f:
+                f.write("same")
+        os.utime(path, (0, 0))
+        with staged_file(path, first.digest) as second:
+            with open(second.path, "w") as f:
+                f.write("same")
+        kept_mtime = os.path.getmtime(path)
+        with staged_file(path, first.digest) as third:
+            with open(third.path, "w") as f:
+                f.write("new")
+        assert os.listdir(d) == ["m.md"]
+        content = open(path).read()
+        assert file_digest(path) == third.digest
+    assert first.replaced and not second.replaced and third.replaced
+    assert second.digest == first.digest and kept_mtime == 0
+    assert content == "new"
+
+
+def test_rerender_is_staged_outside_the_folder():
+    with tempfile.TemporaryDirectory() as d:
+        path = os.path.join(d, "m.md")
+        with staged_file(path) as first:
+            new_in_folder = os.path.dirname(first.path) == d
+            with open(first.path, "w") as f:
+                f.write("same")
+        with staged_file(path, first.digest) as second, staged_file(path, first.digest) as third:
+            listing = os.listdir(d)
+            with open(second.path, "w") as f:
+                f.write("same")
+            with open(third.path, "w") as f:
+                f.write("new")
+        mode = os.stat(path).st_mode & 0o777
+        umask = os.umask(0)
+        os.umask(umask)
+        assert os.listdir(d) == ["m.md"]
+    # Only a file that may be unchanged is built elsewhere
+    assert new_in_folder
+    assert listing == ["m.md"]
+    assert second.path != third.path
+    assert not second.replaced and third.replaced
+    assert mode == 0o666 & ~umask
@@ -0,0 +1,173 @@
+"""Tests for watch mode."""
+
+import json
+import os
+import tempfile
+from pathlib import Path
+from unittest import mock
+
+from granola_sync import config, index, watch
+from granola_sync.exporter import ExportResult
+
+
+def _cfg(d: str) -> dict:
+    cfg = dict(config.DEFAULTS)
+    cfg.update({
+        "granola_cache_path": str(Path(d) / "cache-v4.json"),
+        "index_path": str(Path(d) / "index.sqlite3"),
+        "manifest_path": str(Path(d) / "manifest.json"),
+    })
+    return cfg
+
+
+def _write(cfg: dict, docs: dict, tick: int) -> None:
+    path = cfg["granola_cache_path"]
+    state = {"documents": docs, "transcripts": {}, "documentPanels": {}, "meetingsMetadata": {}}
+    Path(path).write_text(json.dumps({"cache": {"state": state}}))
+    os.utime(path, ns=(tick * 10**9, tick * 10**9))
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _watcher(cfg):
+    clock = _Clock()
+    exports = []
+
+    def fake_export(cfg, doc_ids=None):
+        exports.append(doc_ids)
+        return ExportResult(exported=len(doc_ids))
+
+    w = watch.Watcher(cfg, interval=1, debounce=3, clock=clock)
+    return w, clock, exports, fake_export
+
+
+def test_debounces_bursts_and_exports_only_new_docs():
+    with tempfile.TemporaryDirectory() as d:
+        cfg = _cfg(d)
+        docs = {"a": {"title": "A"}, "b": {"title": "B"}}
+        _write(cfg, docs, 1)
+        w, clock, exports, fake_export = _watcher(cfg)
+        with mock.patch.object(watch, "run_export", fake_export):
+            w.sync()
+            Path(cfg["manifest_path"]).write_text(json.dumps(
+                {"a": {"filename": "A.md", "exported_at": "x"}, "b": {"filename": "B.md", "exported_at": "x"}}))
+
+            # A burst of writes: nothing happens until the cache is quiet
+            for tick in range(2, 5):
+                docs[f"n{tick}"] = {"title": f"New {tick}"}
+                _write(cfg, docs, tick)
+                clock.now += 1
+                assert w.poll() is None
+            clock.now += 2
+            assert w.poll() is None
+            clock.now += 1
+            result = w.poll()
+            clock.now += 10
+            assert w.poll() is None  # quiet again
+    assert exports == [["a", "b"], ["n2", "n3", "n4"]]
+    assert result.exported == 3
+
+
+def test_continuous_writes_still_export_eventually():
+    with tempfile.TemporaryDirectory() as d:
+        cfg = _cfg(d)
+        docs = {}
+        _write(cfg, docs, 1)
+        w, clock, exports, fake_export = _watcher(cfg)
+        with mock.patch.object(watch, "run_export", fake_export):
+            for tick in range(2, 40):
+                docs[f"n{tick}"] = {"title": "x"}
+                _write(cfg, docs, tick)
+                clock.now += 1
+                w.poll()
+    # max wait is 6 debounce windows of 3s
+    assert len(exports) == 2
+    assert exports[0] == sorted(f"n{t}" for t in range(2, 21))
+
+
+def test_unchanged_cache_costs_only_a_stat():
+    with tempfile.TemporaryDirectory() as d:
+        cfg = _cfg(d)
+        _write(cfg, {"a": {"title": "A"}}, 1)
+        w, clock, exports, fake_export = _watcher(cfg)
+        with mock.patch.object(watch, "MeetingIndex", side_effect=AssertionError("opened index")):
+            for _ in range(20):
+                clock.now += 1
+                assert w.poll() is None
+
+
+def test_edit_is_seen_after_another_command_refreshed_the_index():
+    with tempfile.TemporaryDirectory() as d:
+        cfg = _cfg(d)
+        docs = {f"doc{i}": {"title": f"Meeting {i}"} for i in range(3)}
+        _write(cfg, docs, 1)
+        w, clock, exports, fake_export = _watcher(cfg)
+        with mock.patch.object(watch, "run_export", fake_export):
+            w.sync()
+            Path(cfg["manifest_path"]).write_text(json.dumps(
+                {doc_id: {"filename": f"{doc_id}.md", "exported_at": "x"} for doc_id in docs}))
+            docs["doc1"]["notes_markdown"] = "edited"
+            _write(cfg, docs, 2)
+            index.list_meetings(cfg)  # e.g. the app's list, or the daemon
+            assert w.pending(cfg) == ["doc1"]
+            assert w.poll() is None  # the write starts a debounce window
+            clock.now += 10
+            assert w.poll().exported == 1
+            assert w.pending(cfg) == []
+    assert exports == [["doc0", "doc1", "doc2"], ["doc1"]]
+
+
+def test_failed_exports_stay_pending_and_are_retried():
+    with tempfile.TemporaryDirectory() as d:
+        cfg = _cfg(d)
+        docs = {"a": {"title": "A"}}
+        _write(cfg, docs, 1)
+        w, clock, exports, fake_export = _watcher(cfg)
+        outcomes = []
+
+        def flaky_export(cfg, doc_ids=None):
+            outcome = outcomes.pop(0) if outcomes else None
+            if isinstance(outcome, Exception):
+                exports.append(doc_ids)
+                raise outcome
+            if outcome is not None:
+                exports.append(doc_ids)
+                return outcome
+            return fake_export(cfg, doc_ids)
+
+        with mock.patch.object(watch, "run_export", flaky_export):
+            w.sync()
+            Path(cfg["manifest_path"]).write_text(json.dumps({"a": {"filename": "A.md", "exported_at": "x"}}))
+
+            # Drive is missing when A is edited
+            outcomes.append(ExportResult(success=False, message="Parent folder not found"))
+            docs["a"]["notes_markdown"] = "edited"
+            _write(cfg, docs, 2)
+            clock.now += 1
+            w.poll()
+            clock.now += 5
+            failed = w.poll()
+
+            # The crash is reported, not raised, and A is still pending
+            outcomes.append(RuntimeError("database is locked"))
+            clock.now += 5
+            crashed = w.poll()
+
+            # Drive is back and B arrives
+            docs["b"] = {"title": "B"}
+            _write(cfg, docs, 3)
+            clock.now += 1
+            w.poll()
+            clock.now += 5
+            w.poll()
+            clock.now += 10
+            assert w.poll() is None
+    assert not failed.success
+    assert not crashed.success and crashed.errors == ["database is locked"]
+    assert exports == [["a"], ["a"], ["a"], ["a", "b"]]